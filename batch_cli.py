@@ -0,0 +1,266 @@
+# batch_cli.py
+# 生年月日の一括診断（コマンドライン）。Streamlit を介さずに大量の行を再スコアする。
+#
+#   python batch_cli.py batch in.csv -o out.jsonl
+#   cat in.jsonl | python batch_cli.py batch - -o out.csv --column birthday --messages
+#   python batch_cli.py compat roster.csv -o matches.csv --id-column name -k 5   # 名簿内の相性上位k人
+#
+# 入力は固定サイズのチャンクで逐次読み込み、ProcessPoolExecutor でチャンク単位に並列処理し、
+# 入力順のまま書き出す（入力全体をメモリに載せない）。処理速度（rows/sec）は標準エラーへ出す。
+
+import argparse
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+
+RESULT_FIELDS = [
+    "year_kanshi", "year_index",
+    "month_kanshi", "month_index",
+    "day_kanshi", "day_index",
+    "tenchusatsu", "error",
+]
+
+
+# ---------------- 1チャンク分の診断（ワーカープロセス側） ----------------
+def _score_chunk(rows, column: str, with_messages: bool):
+    """rows: dict の list。各 dict に診断結果の列を足して返す（日付が読めない行は error に理由）。"""
+    from sanmeigaku_core.date_parser import parse_many
+    from sanmeigaku_core.calendar_engine import get_engine
+    engine = get_engine()  # プロセスごとに1回だけ構築
+    if with_messages:
+        from sanmeigaku_core.data_access import get_messages
+        tentyuusatsu_messages = get_messages()
+
+    # 和暦・全角まじりの自由入力もチャンク単位でまとめて読む（読めない行は errors に理由）
+    dates, errors = parse_many([row.get(column, "") for row in rows])
+
+    out = []
+    for row, d, error in zip(rows, dates, errors):
+        rec = dict(row)
+        try:
+            if error:
+                raise ValueError(error)
+            rec.update(engine.diagnose(d))
+            rec["error"] = ""
+        except (TypeError, ValueError) as e:
+            rec.update({k: None for k in RESULT_FIELDS})
+            rec["error"] = str(e)
+        if with_messages:
+            rec["messages"] = tentyuusatsu_messages.get(rec.get("tenchusatsu"), [])
+        out.append(rec)
+    return out
+
+
+# ---------------- 入出力 ----------------
+def _detect_format(path: str | None, explicit: str | None, default: str) -> str:
+    if explicit:
+        return explicit
+    if path and path != "-":
+        ext = os.path.splitext(path)[1].lower()
+        if ext in (".jsonl", ".ndjson", ".json"):
+            return "jsonl"
+        if ext in (".csv", ".tsv", ".txt"):
+            return "csv"
+    return default
+
+
+def _read_rows(fp, fmt: str):
+    """1行ずつ dict を返すジェネレータ。"""
+    if fmt == "jsonl":
+        for line in fp:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+    else:
+        yield from csv.DictReader(fp)
+
+
+def _chunks(rows, size: int):
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class _Writer:
+    """
+    CSV/JSONL の逐次書き出し。CSV のヘッダーは、どの行も同じキーなら（uniform=True）最初の行で決める。
+    行ごとにキーが違いうる入力（JSONL）では、行を一時ファイルに書きためてキーの和集合を集め、
+    close() でヘッダーと全行を書き出す（後の行にだけある列も落とさない。メモリには載せない）。
+    """
+
+    def __init__(self, fp, fmt: str, uniform: bool = True):
+        self.fp = fp
+        self.fmt = fmt
+        self._csv = None
+        self._spool = None
+        self._keys = None
+        if fmt == "csv" and not uniform:
+            self._spool = tempfile.TemporaryFile("w+", encoding="utf-8")
+            self._keys = {}
+
+    def write(self, rec: dict):
+        if self.fmt == "jsonl":
+            self.fp.write(json.dumps(rec, ensure_ascii=False, default=str) + "\n")
+            return
+        if self._spool is not None:
+            self._keys.update(dict.fromkeys(rec))
+            self._spool.write(json.dumps(rec, ensure_ascii=False, default=str) + "\n")
+            return
+        if self._csv is None:
+            self._csv = csv.DictWriter(self.fp, fieldnames=list(rec.keys()), extrasaction="ignore")
+            self._csv.writeheader()
+        self._writerow(rec)
+
+    def _writerow(self, rec: dict):
+        if isinstance(rec.get("messages"), list):
+            rec = dict(rec, messages=" / ".join(rec["messages"]))
+        self._csv.writerow(rec)
+
+    def close(self):
+        """書きためた行を書き出す（一時ファイルを使っていなければ何もしない）。"""
+        spool, self._spool = self._spool, None
+        if spool is None:
+            return
+        with spool:
+            spool.seek(0)
+            self._csv = csv.DictWriter(self.fp, fieldnames=list(self._keys), restval="")
+            self._csv.writeheader()
+            for line in spool:
+                self._writerow(json.loads(line))
+
+
+def _ordered_map(fn, chunks, workers: int):
+    """チャンクを並列に処理し、入力順に結果を返す（先読みは workers*2 チャンクまで）。"""
+    if workers <= 1:
+        for chunk in chunks:
+            yield fn(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(fn, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# ---------------- batch サブコマンド ----------------
+def run_batch(args) -> int:
+    in_fmt = _detect_format(args.input, args.input_format, "csv")
+    out_fmt = _detect_format(args.output, args.format, "jsonl")
+
+    fin = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8-sig")
+    fout = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    # CSV の入力はどの行も同じ列。JSONL は行ごとに列が違いうるので、CSV に出すときは列の和集合をヘッダーにする
+    writer = _Writer(fout, out_fmt, uniform=in_fmt == "csv")
+
+    fn = partial(_score_chunk, column=args.column, with_messages=args.messages)
+
+    n = errors = 0
+    t0 = last = time.perf_counter()
+    try:
+        for result in _ordered_map(fn, _chunks(_read_rows(fin, in_fmt), args.chunk_size), args.workers):
+            for rec in result:
+                writer.write(rec)
+                if rec["error"]:
+                    errors += 1
+            n += len(result)
+            now = time.perf_counter()
+            if not args.quiet and now - last >= 5.0:
+                print(f"{n:,} rows  {n / (now - t0):,.0f} rows/sec", file=sys.stderr)
+                last = now
+        writer.close()
+    finally:
+        if fin is not sys.stdin:
+            fin.close()
+        if fout is not sys.stdout:
+            fout.close()
+
+    elapsed = time.perf_counter() - t0
+    if not args.quiet:
+        rate = n / elapsed if elapsed > 0 else 0.0
+        print(f"done: {n:,} rows ({errors:,} errors) in {elapsed:.2f}s  {rate:,.0f} rows/sec", file=sys.stderr)
+    return 0
+
+
+# ---------------- compat サブコマンド ----------------
+def run_compat(args) -> int:
+    from sanmeigaku_core.compat import iter_top_matches
+
+    in_fmt = _detect_format(args.input, args.input_format, "csv")
+    out_fmt = _detect_format(args.output, args.format, "jsonl")
+    fin = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8-sig")
+    try:
+        rows = list(_read_rows(fin, in_fmt))
+    finally:
+        if fin is not sys.stdin:
+            fin.close()
+    roster = [(row.get(args.id_column) or str(i + 1), row.get(args.column, "")) for i, row in enumerate(rows)]
+
+    t0 = time.perf_counter()
+    fout = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    writer = _Writer(fout, out_fmt)
+    try:
+        for pid, matches in iter_top_matches(roster, args.k, args.min_score):
+            for rank, (mid, score, labels) in enumerate(matches, 1):
+                writer.write({"id": pid, "rank": rank, "match_id": mid, "score": score,
+                              "relations": " / ".join(labels)})
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if fout is not sys.stdout:
+            fout.close()
+    if not args.quiet:
+        print(f"done: {len(roster):,} people in {time.perf_counter() - t0:.2f}s", file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="batch_cli.py", description="天中殺診断の一括処理")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("batch", help="CSV/JSONL の生年月日を一括診断する")
+    p.add_argument("input", help="入力ファイル（- で標準入力）")
+    p.add_argument("-o", "--output", default="-", help="出力ファイル（既定: 標準出力）")
+    p.add_argument("--column", default="birth_date", help="生年月日の列名（既定: birth_date）")
+    p.add_argument("--input-format", choices=("csv", "jsonl"), help="入力形式（既定: 拡張子から判定、不明なら csv）")
+    p.add_argument("--format", choices=("csv", "jsonl"), help="出力形式（既定: 拡張子から判定、不明なら jsonl）")
+    p.add_argument("--chunk-size", type=int, default=10_000, help="1チャンクの行数（既定: 10000）")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="ワーカープロセス数（1 で同一プロセス）")
+    p.add_argument("--messages", action="store_true", help="天中殺メッセージも出力する")
+    p.add_argument("-q", "--quiet", action="store_true", help="進捗・速度を表示しない")
+    p.set_defaults(func=run_batch)
+
+    p = sub.add_parser("compat", help="名簿の全員について相性の良い相手の上位k人を出す")
+    p.add_argument("input", help="名簿ファイル（- で標準入力）")
+    p.add_argument("-o", "--output", default="-", help="出力ファイル（既定: 標準出力）")
+    p.add_argument("--column", default="birth_date", help="生年月日の列名（既定: birth_date）")
+    p.add_argument("--id-column", default="id", help="人を識別する列名（既定: id、無ければ行番号）")
+    p.add_argument("--input-format", choices=("csv", "jsonl"), help="入力形式（既定: 拡張子から判定、不明なら csv）")
+    p.add_argument("--format", choices=("csv", "jsonl"), help="出力形式（既定: 拡張子から判定、不明なら jsonl）")
+    p.add_argument("-k", type=int, default=5, help="1人あたりの件数（既定: 5）")
+    p.add_argument("--min-score", type=int, help="この点数未満の相手は出さない")
+    p.add_argument("-q", "--quiet", action="store_true", help="処理時間を表示しない")
+    p.set_defaults(func=run_compat)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
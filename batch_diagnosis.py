@@ -0,0 +1,9 @@
+# batch_diagnosis.py
+# 互換用。実装は sanmeigaku_core/batch_diagnosis.py に移った。
+# import batch_diagnosis は sanmeigaku_core.batch_diagnosis そのもの（同じモジュールオブジェクト）を返す。
+
+import sys
+
+from sanmeigaku_core import batch_diagnosis as _module
+
+sys.modules[__name__] = _module
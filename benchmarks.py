@@ -0,0 +1,394 @@
+# benchmarks.py
+# 計算の入口ごとのマイクロベンチマーク。結果は JSON（ops/sec と 1回あたりの時間のパーセンタイル）で出すので、
+# 変更前後の JSON を --compare で突き合わせれば速くなったか・遅くなったかを数字で比べられる。
+#
+#   python benchmarks.py -o bench.json                  # 全部
+#   python benchmarks.py -k month --repeat 20           # 名前に month を含むものだけ
+#   python benchmarks.py -o new.json --compare bench.json
+#
+# 1件の計測は「1回の呼び出しを inner 回まわした時間」を repeat 回とり、1回あたりに割ってから集計する。
+# 入力の日付は固定シードで作るので、同じマシンなら毎回同じ入力で測れる。
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+from itertools import cycle
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+SEED = 20240204
+N_DATES = 1000
+
+# import 時間を測るデータモジュール・計算モジュール
+IMPORT_MODULES = [
+    "sanmeigaku_core.risshun_data",
+    "sanmeigaku_core.month_kanshi_index_dict",
+    "sanmeigaku_core.day_kanshi_dict",
+    "sanmeigaku_core.tenchusatsu_messages",
+    "hayami",
+    "sanmeigaku_core.kanshi_core",
+    "sanmeigaku_core.calendar_engine",
+    "sanmeigaku_core",
+]
+
+
+# ---------------- 計測 ----------------
+def _percentile(sorted_vals, q: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    k = (len(sorted_vals) - 1) * q
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_vals) - 1)
+    return sorted_vals[lo] + (sorted_vals[hi] - sorted_vals[lo]) * (k - lo)
+
+
+def _summary(name: str, per_op_s: list, inner: int, ops_per_call: int = 1, group: str = "") -> dict:
+    """1回あたりの秒数のリストから結果の dict を作る（時間は μs）。"""
+    vals = sorted(per_op_s)
+    mean = statistics.fmean(vals)
+    return {
+        "name": name,
+        "group": group,
+        "ops_per_sec": ops_per_call / mean if mean > 0 else None,
+        "mean_us": mean * 1e6 / ops_per_call,
+        "p50_us": _percentile(vals, 0.50) * 1e6 / ops_per_call,
+        "p90_us": _percentile(vals, 0.90) * 1e6 / ops_per_call,
+        "p99_us": _percentile(vals, 0.99) * 1e6 / ops_per_call,
+        "min_us": vals[0] * 1e6 / ops_per_call,
+        "max_us": vals[-1] * 1e6 / ops_per_call,
+        "stdev_us": (statistics.stdev(vals) * 1e6 / ops_per_call) if len(vals) > 1 else 0.0,
+        "samples": len(vals),
+        "inner": inner,
+    }
+
+
+def measure(fn, repeat: int, min_time: float):
+    """fn() を inner 回まわす計測を repeat 回。inner は1回の計測が min_time 秒を超えるように決める。"""
+    fn()  # 初回（遅延読み込みなど）は計測から外す
+    inner = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(inner):
+            fn()
+        if time.perf_counter() - t0 >= min_time or inner >= 1 << 20:
+            break
+        inner *= 2
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(inner):
+            fn()
+        samples.append((time.perf_counter() - t0) / inner)
+    return samples, inner
+
+
+# ---------------- 入力 ----------------
+def _dates(start: date, end: date, n: int = N_DATES, seed: int = SEED) -> list:
+    rng = random.Random(seed)
+    span = (end - start).days
+    return [start + timedelta(days=rng.randrange(span + 1)) for _ in range(n)]
+
+
+def _feeder(values):
+    """呼ぶたびに次の入力を返す（入力を回しながら同じ関数を何度も呼ぶため）。"""
+    return cycle(values).__next__
+
+
+class _DateLike:
+    """pandas.Timestamp のように year/month/day を持つだけのオブジェクト。"""
+
+    __slots__ = ("year", "month", "day")
+
+    def __init__(self, d: date):
+        self.year, self.month, self.day = d.year, d.month, d.day
+
+
+def _wareki(d: date, abbr: bool = False) -> str:
+    """d を "昭和60年2月3日"（abbr なら "S60.2.3"）の形に。明治より前は西暦のまま。"""
+    from sanmeigaku_core.date_parser import ERAS
+    for name, letter, start in reversed(ERAS):
+        if d >= start:
+            y = d.year - start.year + 1
+            if abbr:
+                return f"{letter}{y}.{d.month}.{d.day}"
+            return f"{name}{'元' if y == 1 else y}年{d.month}月{d.day}日"
+    return f"{d.year}年{d.month}月{d.day}日"
+
+
+_FULLWIDTH = str.maketrans("0123456789", "０１２３４５６７８９")
+# parse_many の入力（CSV の自由入力で見かける書き方）
+_DIRTY_FORMATS = (
+    lambda d: d.isoformat(),
+    lambda d: f" {d.year}/{d.month}/{d.day} ",
+    lambda d: f"{d.year}年{d.month}月{d.day}日".translate(_FULLWIDTH),
+    _wareki,
+    lambda d: _wareki(d, abbr=True),
+)
+
+
+# get_month_kanshi_from_table（旧方式）の分岐ごとの (日付, 月の表の中身)。
+# 実際の表は start_day を持たないので、分岐を通すための月エントリ (this_idx, start_day, prev_idx) を差し替えて測る。
+MONTH_TABLE_BRANCHES = {
+    "start_day≥": (date(2000, 3, 10), {(2000, 3): (40, 6, 39)}),
+    "before start_day": (date(2000, 3, 3), {(2000, 3): (40, 6, 39)}),
+    "fallback prev month": (date(2000, 3, 3), {(2000, 3): (40, 6, None), (2000, 2): (39, None, None)}),
+    "fallback this_idx": (date(2000, 3, 3), {(2000, 3): (40, 6, None)}),
+    "no start_day": (date(2000, 3, 10), {(2000, 3): (40, None, None)}),
+    "risshun prev-month": (date(2000, 2, 1), {(2000, 2): (39, None, None), (1999, 12): (37, None, None)}),
+    "no data: use prev": (date(2000, 3, 10), {(2000, 2): (39, None, None)}),
+    "no data": (date(2000, 3, 10), {}),
+}
+
+
+@contextlib.contextmanager
+def _month_entries(entries: dict):
+    """計測の間だけ kanshi_core._read_month_entry を entries を引く関数に差し替える。"""
+    from sanmeigaku_core import kanshi_core
+    real = kanshi_core._read_month_entry
+    empty = (None, None, None)
+    kanshi_core._read_month_entry = lambda y, m: entries.get((y, m), empty)
+    try:
+        yield
+    finally:
+        kanshi_core._read_month_entry = real
+
+
+def build_cases(include_app: bool = True, include_imports: bool = True):
+    """(名前, グループ, 呼び出す関数, 1回の呼び出しで処理する件数, 計測中に入る context manager) のリスト。"""
+    from sanmeigaku_core.kanshi_core import (
+        TABLE_START, TABLE_END, RANGE_START, RANGE_END, _as_date,
+        get_year_kanshi, get_month_kanshi, get_month_kanshi_from_table,
+        get_day_kanshi_from_table, tenchusatsu_from_index, kanshi_name, ETO, get_year_eto, tenchusatsu_from_eto,
+        get_year_kanshi_index, month_kanshi_index, day_kanshi_index,
+    )
+    from sanmeigaku_core.kanshi_type import Kanshi
+    from sanmeigaku_core.calendar_engine import get_engine
+    from sanmeigaku_core.batch_diagnosis import diagnose_many
+    from sanmeigaku_core.sekki_index import resolve_month
+    from sanmeigaku_core.date_parser import parse_many
+    from sanmeigaku_core.lunar_calendar import lunar_to_solar, solar_to_lunar
+
+    table_dates = _dates(TABLE_START, TABLE_END)
+    wide_dates = _dates(RANGE_START, RANGE_END)
+    cases = []
+
+    def add(name, group, fn, per_call=1, ctx=None):
+        cases.append((name, group, fn, per_call, ctx))
+
+    # 年・月・日
+    nxt = _feeder(table_dates)
+    add("get_year_kanshi", "core", lambda: get_year_kanshi(nxt()))
+    nxt_w = _feeder(wide_dates)
+    add("get_year_kanshi[1600-2200]", "core", lambda: get_year_kanshi(nxt_w()))
+    nxt_yi = _feeder(table_dates)
+    add("get_year_kanshi_index", "core", lambda: get_year_kanshi_index(nxt_yi()))
+    nxt_m = _feeder(table_dates)
+    add("get_month_kanshi[sekki]", "core", lambda: get_month_kanshi(nxt_m()))
+    nxt_mt = _feeder(table_dates)
+    add("get_month_kanshi[sekki,trace]", "core", lambda: get_month_kanshi(nxt_mt(), trace=True))
+    nxt_mi = _feeder(table_dates)
+    add("month_kanshi_index", "core", lambda: month_kanshi_index(nxt_mi()))
+    nxt_r = _feeder(table_dates)
+    add("sekki_index.resolve_month", "core", lambda: resolve_month(nxt_r()))
+    nxt_t = _feeder(table_dates)
+    add("get_month_kanshi_from_table[table]", "month_table", lambda: get_month_kanshi_from_table(nxt_t()))
+    for rule, (d, entries) in MONTH_TABLE_BRANCHES.items():
+        add(f"get_month_kanshi_from_table[{rule}]", "month_table",
+            lambda d=d: get_month_kanshi_from_table(d), ctx=lambda entries=entries: _month_entries(entries))
+    nxt_d = _feeder(table_dates)
+    add("get_day_kanshi_from_table", "core", lambda: get_day_kanshi_from_table(nxt_d()))
+    nxt_dt = _feeder(table_dates)
+    add("get_day_kanshi_from_table[trace]", "core", lambda: get_day_kanshi_from_table(nxt_dt(), trace=True))
+    nxt_di = _feeder(table_dates)
+    add("day_kanshi_index", "core", lambda: day_kanshi_index(nxt_di()))
+    idxs = _feeder(list(range(1, 61)))
+    add("tenchusatsu_from_index", "core", lambda: tenchusatsu_from_index(idxs()))
+    idxs_n = _feeder(list(range(1, 61)))
+    add("kanshi_name", "core", lambda: kanshi_name(idxs_n()))
+    idxs_k = _feeder(list(range(1, 61)))
+    add("Kanshi(idx).tenchusatsu", "core", lambda: Kanshi(idxs_k()).tenchusatsu)
+
+    # _as_date の入力型ごと
+    samples = {
+        "date": table_dates,
+        "datetime": [datetime(d.year, d.month, d.day, 12, 0) for d in table_dates],
+        "str_iso": [d.isoformat() for d in table_dates],
+        "str_kanji": [f"{d.year}年{d.month:02d}月{d.day:02d}日" for d in table_dates],
+        "str_slash": [d.strftime("%Y/%m/%d") for d in table_dates],
+        "str_wareki": [_wareki(d) for d in table_dates],
+        "date_like": [_DateLike(d) for d in table_dates],
+    }
+    for kind, vals in samples.items():
+        f = _feeder(vals)
+        add(f"_as_date[{kind}]", "parse", lambda f=f: _as_date(f()))
+    # CSV の自由入力を想定した混在（同じ文字列の繰り返しを含む）
+    dirty = [fmt(d) for d in _dates(TABLE_START, TABLE_END, n=1_000) for fmt in _DIRTY_FORMATS] * 2
+    add("parse_many[10k dirty]", "parse", lambda: parse_many(dirty), per_call=len(dirty))
+
+    # 旧暦 ⇔ 新暦（月の表の bisect）
+    lunar = [solar_to_lunar(d) for d in table_dates]
+    nxt_l = _feeder(lunar)
+    add("lunar_to_solar", "lunar", lambda: lunar_to_solar(*nxt_l()))
+    nxt_sl = _feeder(table_dates)
+    add("solar_to_lunar", "lunar", lambda: solar_to_lunar(nxt_sl()))
+
+    # 展開済みカレンダー表・列指向API
+    engine = get_engine()
+    nxt_e = _feeder(table_dates)
+    add("CalendarEngine.lookup", "engine", lambda: engine.lookup(nxt_e()))
+    nxt_e2 = _feeder(table_dates)
+    add("CalendarEngine.diagnose", "engine", lambda: engine.diagnose(nxt_e2()))
+    batch = _dates(RANGE_START, RANGE_END, n=10_000)
+    add("batch_diagnosis.diagnose_many[10k]", "engine", lambda: diagnose_many(batch), per_call=len(batch))
+
+    # sanmeigaku.py（年支による簡易版）
+    nxt_s = _feeder(table_dates)
+    add("get_year_eto", "sanmeigaku", lambda: get_year_eto(nxt_s()))
+    etos = _feeder(list(ETO))
+    add("tenchusatsu_from_eto", "sanmeigaku", lambda: tenchusatsu_from_eto(etos()))
+
+    if include_imports:
+        for mod in IMPORT_MODULES:
+            cases.append((f"import {mod}", "import", ("import", mod), 1, None))
+    if include_app:
+        cases.append(("AppTest tentyuusatsu_app.py", "app", ("app", "tentyuusatsu_app.py"), 1, None))
+    return cases
+
+
+def _import_samples(module: str, repeat: int) -> list:
+    """新しいインタプリタで module を import したときの累積時間（秒、-X importtime）。"""
+    samples = []
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                              cwd=_HERE, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else "import failed")
+        for line in proc.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module:
+                samples.append(int(parts[1].split(":")[-1]) / 1e6)
+                break
+    return samples
+
+
+def _app_samples(script: str, repeat: int) -> list:
+    """AppTest でスクリプトを最後まで実行し、生年月日を入れて「診断する」まで押す時間（秒）。"""
+    from streamlit.testing.v1 import AppTest
+    path = os.path.join(_HERE, script)
+    samples = []
+    for i in range(repeat + 1):
+        t0 = time.perf_counter()
+        at = AppTest.from_file(path, default_timeout=60).run()
+        at.date_input[0].set_value(date(1985, 2, 3)).run()
+        at.button[0].click().run()
+        elapsed = time.perf_counter() - t0
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        if i:  # 1回目（キャッシュが空の状態）は外す
+            samples.append(elapsed)
+    return samples
+
+
+def run(cases, repeat: int, min_time: float, pattern: str | None = None, verbose: bool = True) -> list:
+    results = []
+    for name, group, fn, per_call, ctx in cases:
+        if pattern and pattern not in name:
+            continue
+        try:
+            if isinstance(fn, tuple) and fn[0] == "import":
+                samples, inner = _import_samples(fn[1], max(3, repeat // 5)), 1
+            elif isinstance(fn, tuple) and fn[0] == "app":
+                try:
+                    import streamlit  # noqa: F401
+                except ImportError:
+                    results.append({"name": name, "group": group, "skipped": "streamlit がインストールされていません"})
+                    continue
+                samples, inner = _app_samples(fn[1], max(3, repeat // 10)), 1
+            else:
+                with ctx() if ctx else contextlib.nullcontext():
+                    samples, inner = measure(fn, repeat, min_time)
+        except Exception as e:  # 1件の失敗で全体を止めない
+            results.append({"name": name, "group": group, "error": f"{type(e).__name__}: {e}"})
+            continue
+        res = _summary(name, samples, inner, per_call, group)
+        results.append(res)
+        if verbose:
+            print(f"{name:<48}{res['ops_per_sec']:>14,.0f} ops/s   p50 {res['p50_us']:>10.2f}us   p99 {res['p99_us']:>10.2f}us",
+                  file=sys.stderr)
+    return results
+
+
+def environment() -> dict:
+    try:
+        import numpy
+        np_version = numpy.__version__
+    except ImportError:
+        np_version = None
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=_HERE,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "numpy": np_version,
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def compare(results: list, baseline: list):
+    """baseline と同じ名前の結果について ops/sec の比（>1 で速くなった）を表示する。"""
+    base = {r["name"]: r for r in baseline if "ops_per_sec" in r}
+    print(f"{'name':<48}{'baseline':>14}{'current':>14}{'ratio':>9}")
+    for r in results:
+        b = base.get(r["name"])
+        if not b or "ops_per_sec" not in r:
+            continue
+        ratio = r["ops_per_sec"] / b["ops_per_sec"] if b["ops_per_sec"] else float("nan")
+        print(f"{r['name']:<48}{b['ops_per_sec']:>14,.0f}{r['ops_per_sec']:>14,.0f}{ratio:>8.2f}x")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks.py", description="計算の入口ごとのマイクロベンチマーク")
+    parser.add_argument("-o", "--output", default="-", help="結果の JSON（既定: 標準出力）")
+    parser.add_argument("-k", "--filter", help="名前にこの文字列を含むケースだけ実行する")
+    parser.add_argument("--repeat", type=int, default=50, help="1ケースあたりの計測回数（既定: 50）")
+    parser.add_argument("--min-time", type=float, default=0.002, help="1回の計測の最短時間（秒、既定: 0.002）")
+    parser.add_argument("--no-app", action="store_true", help="AppTest での Streamlit 実行を省く")
+    parser.add_argument("--no-imports", action="store_true", help="モジュールの import 時間を省く")
+    parser.add_argument("--compare", help="比較する過去の結果 JSON")
+    parser.add_argument("-q", "--quiet", action="store_true", help="途中経過を表示しない")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, _HERE)
+    cases = build_cases(include_app=not args.no_app, include_imports=not args.no_imports)
+    results = run(cases, args.repeat, args.min_time, args.filter, verbose=not args.quiet)
+    doc = {"environment": environment(), "settings": {"repeat": args.repeat, "min_time": args.min_time,
+                                                      "seed": SEED, "n_dates": N_DATES}, "results": results}
+
+    text = json.dumps(doc, ensure_ascii=False, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(results, json.load(f)["results"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+# build_assets.py
+# 天中殺グラフ画像（sanmeigaku_images/*.png）から、幅違い・形式違い（WebP / PNG）の配信用画像を作る。
+# ファイル名に内容ハッシュを入れる（inui.720w.1a2b3c4d5e.webp）ので、配信側は immutable でキャッシュさせてよい。
+# 結果は manifest.json（天中殺グループ → 画像一覧）にまとめ、graph_assets.AssetStore が読む。
+#
+#   python build_assets.py                     # 既定の幅で作り直す
+#   python build_assets.py --widths 480 960    # 幅を指定
+#
+# Pillow が必要（配信側は Pillow なしで動く。manifest が無ければ元画像をそのまま使う）。
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+
+from graph_assets import TENCHUSATSU_GRAPH_PATHS, VARIANTS_DIR, MANIFEST_PATH, graph_file_for
+
+DEFAULT_WIDTHS = (480, 720, 1080, 1440)
+MANIFEST_VERSION = 1
+
+
+def _encode(im, fmt: str) -> bytes:
+    """
+    元画像と同じく 256 色に減色してから保存する（写真ではないので見た目は変わらない）。
+    WebP は減色後の可逆圧縮の方が、非可逆より小さく線もにじまない。可逆時の quality は圧縮の手間で、
+    method=6/quality=100 は数十倍遅いわりにほとんど縮まないので軽めの設定にしている。
+    """
+    q = im.quantize(colors=256, method=2)
+    buf = io.BytesIO()
+    if fmt == "webp":
+        q.convert(im.mode).save(buf, "WEBP", lossless=True, quality=50, method=2)
+    else:
+        q.save(buf, "PNG", optimize=True)
+    return buf.getvalue()
+
+
+def build_variants(widths=DEFAULT_WIDTHS, out_dir: str = VARIANTS_DIR) -> dict:
+    """全グループの画像を作って out_dir に書き、manifest の dict を返す。"""
+    try:
+        from PIL import Image
+    except ImportError:
+        raise RuntimeError("Pillow がインストールされていません（pip install pillow）") from None
+
+    os.makedirs(out_dir, exist_ok=True)
+    groups = {}
+    for ts_group, rel in TENCHUSATSU_GRAPH_PATHS.items():
+        src = graph_file_for(ts_group)
+        if not src:
+            print(f"skip {ts_group}: {rel} が見つかりません", file=sys.stderr)
+            continue
+        stem = os.path.splitext(os.path.basename(rel))[0]
+        with Image.open(src) as original:
+            base = original.convert("RGBA" if "transparency" in original.info else "RGB")
+
+        variants = []
+        for w in sorted({min(w, base.width) for w in widths}):
+            h = round(base.height * w / base.width)
+            im = base if w == base.width else base.resize((w, h), Image.LANCZOS)
+            for fmt in ("webp", "png"):
+                data = _encode(im, fmt)
+                digest = hashlib.sha256(data).hexdigest()
+                name = f"{stem}.{w}w.{digest[:10]}.{fmt}"
+                with open(os.path.join(out_dir, name), "wb") as f:
+                    f.write(data)
+                variants.append({"name": name, "format": fmt, "width": w, "height": h,
+                                 "bytes": len(data), "sha256": digest})
+        groups[ts_group] = {"source": rel, "source_bytes": os.path.getsize(src), "variants": variants}
+
+    return {"version": MANIFEST_VERSION, "widths": sorted(set(widths)), "groups": groups}
+
+
+def write_manifest(manifest: dict, path: str = MANIFEST_PATH) -> str:
+    """manifest を原子的に書き込み、使われなくなった古い画像を消す。"""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+    keep = {v["name"] for g in manifest["groups"].values() for v in g["variants"]}
+    out_dir = os.path.dirname(path)
+    for name in os.listdir(out_dir):
+        if name.endswith((".webp", ".png")) and name not in keep:
+            os.remove(os.path.join(out_dir, name))
+    return path
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="build_assets.py", description="天中殺グラフ画像の配信用バリアントを作る")
+    parser.add_argument("--widths", type=int, nargs="+", default=list(DEFAULT_WIDTHS), help="出力する幅（px）")
+    args = parser.parse_args(argv)
+
+    try:
+        manifest = build_variants(args.widths)
+    except RuntimeError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    print(write_manifest(manifest))
+    for ts_group, g in manifest["groups"].items():
+        sizes = "  ".join(f"{v['width']}w.{v['format']}={v['bytes'] / 1024:.1f}KB" for v in g["variants"])
+        print(f"{ts_group}: {g['source_bytes'] / 1024:.1f}KB -> {sizes}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,9 @@
+# calendar_engine.py
+# 互換用。実装は sanmeigaku_core/calendar_engine.py に移った。
+# import calendar_engine は sanmeigaku_core.calendar_engine そのもの（同じモジュールオブジェクト）を返す。
+
+import sys
+
+from sanmeigaku_core import calendar_engine as _module
+
+sys.modules[__name__] = _module
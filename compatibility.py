@@ -0,0 +1,9 @@
+# compatibility.py
+# 互換用。実装は sanmeigaku_core/compat.py に移った。
+# import compatibility は sanmeigaku_core.compat そのもの（同じモジュールオブジェクト）を返す。
+
+import sys
+
+from sanmeigaku_core import compat as _module
+
+sys.modules[__name__] = _module
@@ -0,0 +1,9 @@
+# data_access.py
+# 互換用。実装は sanmeigaku_core/data_access.py に移った。
+# import data_access は sanmeigaku_core.data_access そのもの（同じモジュールオブジェクト）を返す。
+
+import sys
+
+from sanmeigaku_core import data_access as _module
+
+sys.modules[__name__] = _module
@@ -0,0 +1,13 @@
+# data_pack.py
+# 互換用。実装は sanmeigaku_core/data_pack.py に移った。
+# import data_pack は sanmeigaku_core.data_pack そのもの（同じモジュールオブジェクト）を返す。
+# python data_pack.py ... は python -m sanmeigaku_core.data_pack ... と同じ。
+
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("sanmeigaku_core.data_pack", run_name="__main__", alter_sys=True)
+else:
+    from sanmeigaku_core import data_pack as _module
+    sys.modules[__name__] = _module
@@ -0,0 +1,9 @@
+# date_parser.py
+# 互換用。実装は sanmeigaku_core/date_parser.py に移った。
+# import date_parser は sanmeigaku_core.date_parser そのもの（同じモジュールオブジェクト）を返す。
+
+import sys
+
+from sanmeigaku_core import date_parser as _module
+
+sys.modules[__name__] = _module
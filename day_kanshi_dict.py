@@ -1,136 +1,9 @@
-kanshi_index_table = {
-    1900: {1: 10, 2: 41, 3: 9, 4: 40, 5: 10, 6: 41, 7: 11, 8: 42, 9: 13, 10: 43, 11: 14, 12: 44},
-    1901: {1: 15, 2: 46, 3: 14, 4: 45, 5: 15, 6: 46, 7: 16, 8: 47, 9: 18, 10: 48, 11: 19, 12: 49},
-    1902: {1: 20, 2: 51, 3: 19, 4: 50, 5: 20, 6: 51, 7: 21, 8: 52, 9: 23, 10: 53, 11: 24, 12: 54},
-    1903: {1: 25, 2: 56, 3: 24, 4: 55, 5: 25, 6: 56, 7: 26, 8: 57, 9: 28, 10: 58, 11: 29, 12: 59},
-    1904: {1: 30, 2: 1, 3: 30, 4: 1, 5: 31, 6: 2, 7: 32, 8: 3, 9: 34, 10: 4, 11: 35, 12: 5},
-    1905: {1: 36, 2: 7, 3: 35, 4: 6, 5: 36, 6: 7, 7: 37, 8: 8, 9: 39, 10: 9, 11: 40, 12: 10},
-    1906: {1: 41, 2: 12, 3: 40, 4: 11, 5: 41, 6: 12, 7: 42, 8: 13, 9: 44, 10: 14, 11: 45, 12: 15},
-    1907: {1: 46, 2: 17, 3: 45, 4: 16, 5: 46, 6: 17, 7: 47, 8: 18, 9: 49, 10: 19, 11: 50, 12: 20},
-    1908: {1: 51, 2: 22, 3: 51, 4: 22, 5: 52, 6: 23, 7: 53, 8: 24, 9: 55, 10: 25, 11: 56, 12: 26},
-    1909: {1: 57, 2: 28, 3: 56, 4: 27, 5: 57, 6: 28, 7: 58, 8: 29, 9: 0, 10: 30, 11: 1, 12: 31},
-    1910: {1: 2, 2: 33, 3: 1, 4: 32, 5: 2, 6: 33, 7: 3, 8: 34, 9: 5, 10: 35, 11: 6, 12: 36},
-    1911: {1: 7, 2: 38, 3: 6, 4: 37, 5: 7, 6: 38, 7: 8, 8: 39, 9: 10, 10: 40, 11: 11, 12: 41},
-    1912: {1: 12, 2: 43, 3: 12, 4: 43, 5: 13, 6: 44, 7: 14, 8: 45, 9: 16, 10: 46, 11: 17, 12: 47},
-    1913: {1: 18, 2: 49, 3: 17, 4: 48, 5: 18, 6: 49, 7: 19, 8: 50, 9: 21, 10: 51, 11: 22, 12: 52},
-    1914: {1: 23, 2: 54, 3: 22, 4: 53, 5: 23, 6: 54, 7: 24, 8: 55, 9: 26, 10: 56, 11: 27, 12: 57},
-    1915: {1: 28, 2: 59, 3: 27, 4: 58, 5: 28, 6: 59, 7: 29, 8: 0, 9: 31, 10: 1, 11: 32, 12: 2},
-    1916: {1: 33, 2: 4, 3: 33, 4: 4, 5: 34, 6: 5, 7: 35, 8: 6, 9: 37, 10: 7, 11: 38, 12: 8},
-    1917: {1: 39, 2: 10, 3: 38, 4: 9, 5: 39, 6: 10, 7: 40, 8: 11, 9: 42, 10: 12, 11: 43, 12: 13},
-    1918: {1: 44, 2: 15, 3: 43, 4: 14, 5: 44, 6: 15, 7: 45, 8: 16, 9: 47, 10: 17, 11: 48, 12: 18},
-    1919: {1: 49, 2: 20, 3: 48, 4: 19, 5: 49, 6: 20, 7: 50, 8: 21, 9: 52, 10: 22, 11: 53, 12: 23},
-    1920: {1: 54, 2: 25, 3: 54, 4: 25, 5: 55, 6: 26, 7: 56, 8: 27, 9: 58, 10: 28, 11: 59, 12: 29},
-    1921: {1: 0, 2: 31, 3: 59, 4: 30, 5: 0, 6: 31, 7: 1, 8: 32, 9: 3, 10: 33, 11: 4, 12: 34},
-    1922: {1: 5, 2: 36, 3: 4, 4: 35, 5: 5, 6: 36, 7: 6, 8: 37, 9: 8, 10: 38, 11: 9, 12: 39},
-    1923: {1: 10, 2: 41, 3: 9, 4: 40, 5: 10, 6: 41, 7: 11, 8: 42, 9: 13, 10: 43, 11: 14, 12: 44},
-    1924: {1: 15, 2: 46, 3: 15, 4: 46, 5: 16, 6: 47, 7: 17, 8: 48, 9: 19, 10: 49, 11: 20, 12: 50},
-    1925: {1: 21, 2: 52, 3: 20, 4: 51, 5: 21, 6: 52, 7: 22, 8: 53, 9: 24, 10: 54, 11: 25, 12: 55},
-    1926: {1: 26, 2: 57, 3: 25, 4: 56, 5: 26, 6: 57, 7: 27, 8: 58, 9: 29, 10: 59, 11: 30, 12: 60},
-    1927: {1: 31, 2: 2, 3: 30, 4: 1, 5: 31, 6: 2, 7: 32, 8: 3, 9: 34, 10: 4, 11: 35, 12: 5},
-    1928: {1: 36, 2: 7, 3: 36, 4: 7, 5: 37, 6: 8, 7: 38, 8: 9, 9: 40, 10: 10, 11: 41, 12: 11},
-    1929: {1: 42, 2: 13, 3: 41, 4: 12, 5: 42, 6: 13, 7: 43, 8: 14, 9: 45, 10: 15, 11: 46, 12: 16},
-    1930: {1: 47, 2: 18, 3: 46, 4: 17, 5: 47, 6: 18, 7: 48, 8: 19, 9: 50, 10: 20, 11: 51, 12: 21},
-    1931: {1: 52, 2: 23, 3: 51, 4: 22, 5: 52, 6: 23, 7: 53, 8: 24, 9: 55, 10: 25, 11: 56, 12: 26},
-    1932: {1: 57, 2: 28, 3: 57, 4: 28, 5: 58, 6: 29, 7: 59, 8: 30, 9: 1, 10: 31, 11: 2, 12: 32},
-    1933: {1: 3, 2: 34, 3: 2, 4: 33, 5: 3, 6: 34, 7: 4, 8: 35, 9: 6, 10: 36, 11: 7, 12: 37},
-    1934: {1: 8, 2: 39, 3: 7, 4: 38, 5: 8, 6: 39, 7: 9, 8: 40, 9: 11, 10: 41, 11: 12, 12: 42},
-    1935: {1: 13, 2: 44, 3: 12, 4: 43, 5: 13, 6: 44, 7: 14, 8: 45, 9: 16, 10: 46, 11: 17, 12: 47},
-    1936: {1: 18, 2: 49, 3: 18, 4: 49, 5: 19, 6: 50, 7: 20, 8: 51, 9: 22, 10: 52, 11: 23, 12: 53},
-    1937: {1: 24, 2: 55, 3: 23, 4: 54, 5: 24, 6: 55, 7: 25, 8: 56, 9: 27, 10: 57, 11: 28, 12: 58},
-    1938: {1: 29, 2: 0, 3: 28, 4: 59, 5: 29, 6: 0, 7: 30, 8: 1, 9: 32, 10: 2, 11: 33, 12: 3},
-    1939: {1: 34, 2: 5, 3: 33, 4: 4, 5: 34, 6: 5, 7: 35, 8: 6, 9: 37, 10: 7, 11: 38, 12: 8},
-    1940: {1: 39, 2: 10, 3: 39, 4: 10, 5: 40, 6: 11, 7: 41, 8: 12, 9: 43, 10: 13, 11: 44, 12: 14},
-    1941: {1: 45, 2: 16, 3: 44, 4: 15, 5: 45, 6: 16, 7: 46, 8: 17, 9: 48, 10: 18, 11: 49, 12: 19},
-    1942: {1: 50, 2: 51, 3: 49, 4: 20, 5: 50, 6: 21, 7: 51, 8: 22, 9: 53, 10: 23, 11: 54, 12: 24},
-    1943: {1: 55, 2: 26, 3: 54, 4: 25, 5: 55, 6: 26, 7: 56, 8: 27, 9: 58, 10: 28, 11: 59, 12: 29},
-    1944: {1: 0, 2: 31, 3: 0, 4: 31, 5: 1, 6: 32, 7: 2, 8: 33, 9: 4, 10: 34, 11: 5, 12: 35},
-    1945: {1: 6, 2: 37, 3: 5, 4: 36, 5: 6, 6: 37, 7: 7, 8: 38, 9: 9, 10: 39, 11: 10, 12: 40},
-    1946: {1: 11, 2: 42, 3: 10, 4: 41, 5: 11, 6: 42, 7: 12, 8: 43, 9: 14, 10: 44, 11: 15, 12: 45},
-    1947: {1: 16, 2: 47, 3: 15, 4: 46, 5: 16, 6: 47, 7: 17, 8: 48, 9: 19, 10: 49, 11: 20, 12: 50},
-    1948: {1: 21, 2: 52, 3: 21, 4: 52, 5: 22, 6: 53, 7: 23, 8: 54, 9: 25, 10: 55, 11: 26, 12: 56},
-    1949: {1: 27, 2: 58, 3: 26, 4: 57, 5: 27, 6: 58, 7: 28, 8: 59, 9: 30, 10: 0, 11: 31, 12: 1},
-    1950: {1: 32, 2: 3, 3: 31, 4: 2, 5: 32, 6: 3, 7: 33, 8: 4, 9: 35, 10: 5, 11: 36, 12: 6},
-    1951: {1: 37, 2: 8, 3: 36, 4: 7, 5: 37, 6: 8, 7: 38, 8: 9, 9: 40, 10: 10, 11: 41, 12: 11},
-    1952: {1: 42, 2: 13, 3: 42, 4: 13, 5: 43, 6: 14, 7: 44, 8: 15, 9: 46, 10: 16, 11: 47, 12: 17},
-    1953: {1: 48, 2: 19, 3: 47, 4: 18, 5: 48, 6: 19, 7: 49, 8: 20, 9: 51, 10: 21, 11: 52, 12: 22},
-    1954: {1: 53, 2: 24, 3: 52, 4: 23, 5: 53, 6: 24, 7: 54, 8: 25, 9: 56, 10: 26, 11: 57, 12: 27},
-    1955: {1: 58, 2: 29, 3: 57, 4: 28, 5: 58, 6: 29, 7: 59, 8: 30, 9: 1, 10: 31, 11: 2, 12: 32},
-    1956: {1: 3, 2: 34, 3: 3, 4: 34, 5: 4, 6: 35, 7: 5, 8: 36, 9: 7, 10: 37, 11: 8, 12: 38},
-    1957: {1: 9, 2: 40, 3: 8, 4: 39, 5: 9, 6: 40, 7: 10, 8: 41, 9: 12, 10: 42, 11: 13, 12: 43},
-    1958: {1: 14, 2: 45, 3: 13, 4: 44, 5: 14, 6: 45, 7: 15, 8: 46, 9: 17, 10: 47, 11: 18, 12: 48},
-    1959: {1: 19, 2: 50, 3: 18, 4: 49, 5: 19, 6: 50, 7: 20, 8: 51, 9: 22, 10: 52, 11: 23, 12: 53},
-    1960: {1: 24, 2: 55, 3: 24, 4: 55, 5: 25, 6: 56, 7: 26, 8: 57, 9: 28, 10: 58, 11: 29, 12: 59},
-    1961: {1: 30, 2: 1, 3: 29, 4: 0, 5: 30, 6: 1, 7: 31, 8: 2, 9: 33, 10: 3, 11: 34, 12: 4},
-    1962: {1: 35, 2: 6, 3: 34, 4: 5, 5: 35, 6: 6, 7: 36, 8: 7, 9: 38, 10: 8, 11: 39, 12: 9},
-    1963: {1: 40, 2: 11, 3: 39, 4: 10, 5: 40, 6: 11, 7: 41, 8: 12, 9: 43, 10: 13, 11: 44, 12: 14},
-    1964: {1: 45, 2: 16, 3: 45, 4: 16, 5: 46, 6: 17, 7: 47, 8: 18, 9: 49, 10: 19, 11: 50, 12: 20},
-    1965: {1: 51, 2: 22, 3: 50, 4: 21, 5: 51, 6: 22, 7: 52, 8: 23, 9: 54, 10: 24, 11: 55, 12: 25},
-    1966: {1: 56, 2: 27, 3: 55, 4: 26, 5: 56, 6: 27, 7: 57, 8: 28, 9: 59, 10: 29, 11: 0, 12: 30},
-    1967: {1: 1, 2: 32, 3: 0, 4: 31, 5: 1, 6: 32, 7: 2, 8: 33, 9: 4, 10: 34, 11: 5, 12: 35},
-    1968: {1: 6, 2: 37, 3: 6, 4: 37, 5: 7, 6: 38, 7: 8, 8: 39, 9: 10, 10: 40, 11: 11, 12: 41},
-    1969: {1: 12, 2: 43, 3: 11, 4: 42, 5: 12, 6: 43, 7: 13, 8: 44, 9: 15, 10: 45, 11: 16, 12: 46},
-    1970: {1: 17, 2: 48, 3: 16, 4: 47, 5: 17, 6: 48, 7: 18, 8: 49, 9: 20, 10: 50, 11: 21, 12: 51},
-    1971: {1: 22, 2: 53, 3: 21, 4: 52, 5: 22, 6: 53, 7: 23, 8: 54, 9: 25, 10: 55, 11: 26, 12: 56},
-    1972: {1: 27, 2: 58, 3: 27, 4: 58, 5: 28, 6: 59, 7: 29, 8: 0, 9: 31, 10: 1, 11: 32, 12: 2},
-    1973: {1: 33, 2: 4, 3: 32, 4: 3, 5: 33, 6: 4, 7: 34, 8: 5, 9: 36, 10: 6, 11: 37, 12: 7},
-    1974: {1: 38, 2: 9, 3: 37, 4: 8, 5: 38, 6: 9, 7: 39, 8: 10, 9: 41, 10: 11, 11: 42, 12: 12},
-    1975: {1: 43, 2: 14, 3: 42, 4: 13, 5: 43, 6: 14, 7: 44, 8: 15, 9: 46, 10: 16, 11: 47, 12: 17},
-    1976: {1: 48, 2: 19, 3: 48, 4: 19, 5: 49, 6: 20, 7: 50, 8: 21, 9: 52, 10: 22, 11: 53, 12: 23},
-    1977: {1: 54, 2: 25, 3: 53, 4: 24, 5: 54, 6: 25, 7: 55, 8: 26, 9: 57, 10: 27, 11: 58, 12: 28},
-    1978: {1: 59, 2: 30, 3: 58, 4: 29, 5: 59, 6: 30, 7: 0, 8: 31, 9: 2, 10: 32, 11: 3, 12: 33},
-    1979: {1: 4, 2: 35, 3: 3, 4: 34, 5: 4, 6: 35, 7: 5, 8: 36, 9: 7, 10: 37, 11: 8, 12: 38},
-    1980: {1: 9, 2: 40, 3: 9, 4: 40, 5: 10, 6: 41, 7: 11, 8: 42, 9: 13, 10: 43, 11: 14, 12: 44},
-    1981: {1: 15, 2: 46, 3: 14, 4: 45, 5: 15, 6: 46, 7: 16, 8: 47, 9: 18, 10: 48, 11: 19, 12: 49},
-    1982: {1: 20, 2: 51, 3: 19, 4: 50, 5: 20, 6: 51, 7: 21, 8: 52, 9: 23, 10: 53, 11: 24, 12: 54},
-    1983: {1: 25, 2: 56, 3: 24, 4: 55, 5: 25, 6: 56, 7: 26, 8: 57, 9: 28, 10: 58, 11: 29, 12: 59},
-    1984: {1: 30, 2: 1, 3: 30, 4: 1, 5: 31, 6: 2, 7: 32, 8: 3, 9: 34, 10: 4, 11: 35, 12: 5},
-    1985: {1: 36, 2: 7, 3: 35, 4: 6, 5: 36, 6: 7, 7: 37, 8: 8, 9: 39, 10: 9, 11: 40, 12: 10},
-    1986: {1: 41, 2: 12, 3: 40, 4: 11, 5: 41, 6: 12, 7: 42, 8: 13, 9: 44, 10: 14, 11: 45, 12: 15},
-    1987: {1: 46, 2: 17, 3: 45, 4: 16, 5: 46, 6: 17, 7: 47, 8: 18, 9: 49, 10: 19, 11: 50, 12: 20},
-    1988: {1: 51, 2: 22, 3: 51, 4: 22, 5: 52, 6: 23, 7: 53, 8: 24, 9: 55, 10: 25, 11: 56, 12: 26},
-    1989: {1: 57, 2: 28, 3: 56, 4: 27, 5: 57, 6: 28, 7: 58, 8: 29, 9: 0, 10: 30, 11: 1, 12: 31},
-    1990: {1: 2, 2: 33, 3: 1, 4: 32, 5: 2, 6: 33, 7: 3, 8: 34, 9: 5, 10: 35, 11: 6, 12: 36},
-    1991: {1: 7, 2: 38, 3: 6, 4: 37, 5: 7, 6: 38, 7: 8, 8: 39, 9: 10, 10: 40, 11: 11, 12: 41},
-    1992: {1: 12, 2: 43, 3: 12, 4: 43, 5: 13, 6: 44, 7: 14, 8: 45, 9: 16, 10: 46, 11: 17, 12: 47},
-    1993: {1: 18, 2: 49, 3: 17, 4: 48, 5: 18, 6: 49, 7: 19, 8: 50, 9: 21, 10: 51, 11: 22, 12: 52},
-    1994: {1: 23, 2: 54, 3: 22, 4: 53, 5: 23, 6: 54, 7: 24, 8: 55, 9: 26, 10: 56, 11: 27, 12: 57},
-    1995: {1: 28, 2: 59, 3: 27, 4: 58, 5: 28, 6: 59, 7: 29, 8: 0, 9: 31, 10: 1, 11: 32, 12: 2},
-    1996: {1: 33, 2: 4, 3: 33, 4: 4, 5: 34, 6: 5, 7: 35, 8: 6, 9: 37, 10: 7, 11: 38, 12: 8},
-    1997: {1: 39, 2: 10, 3: 38, 4: 9, 5: 39, 6: 10, 7: 40, 8: 11, 9: 42, 10: 12, 11: 43, 12: 13},
-    1998: {1: 44, 2: 15, 3: 43, 4: 14, 5: 44, 6: 15, 7: 45, 8: 16, 9: 47, 10: 17, 11: 48, 12: 18},
-    1999: {1: 49, 2: 20, 3: 48, 4: 19, 5: 49, 6: 20, 7: 50, 8: 21, 9: 52, 10: 22, 11: 53, 12: 23},
-    2000: {1: 54, 2: 25, 3: 54, 4: 25, 5: 55, 6: 26, 7: 56, 8: 27, 9: 58, 10: 28, 11: 59, 12: 29},
-    2001: {1: 0, 2: 31, 3: 59, 4: 30, 5: 0, 6: 31, 7: 1, 8: 32, 9: 3, 10: 33, 11: 4, 12: 34},
-    2002: {1: 5, 2: 36, 3: 4, 4: 35, 5: 5, 6: 36, 7: 6, 8: 37, 9: 8, 10: 38, 11: 9, 12: 39},
-    2003: {1: 10, 2: 41, 3: 9, 4: 40, 5: 10, 6: 41, 7: 11, 8: 42, 9: 13, 10: 43, 11: 14, 12: 44},
-    2004: {1: 15, 2: 46, 3: 15, 4: 46, 5: 16, 6: 47, 7: 17, 8: 48, 9: 19, 10: 49, 11: 20, 12: 50},
-    2005: {1: 21, 2: 52, 3: 20, 4: 51, 5: 21, 6: 52, 7: 22, 8: 53, 9: 24, 10: 54, 11: 25, 12: 55},
-    2006: {1: 26, 2: 57, 3: 25, 4: 56, 5: 26, 6: 57, 7: 27, 8: 58, 9: 29, 10: 59, 11: 30, 12: 0},
-    2007: {1: 31, 2: 2, 3: 30, 4: 1, 5: 31, 6: 2, 7: 32, 8: 3, 9: 34, 10: 4, 11: 35, 12: 5},
-    2008: {1: 36, 2: 7, 3: 36, 4: 7, 5: 37, 6: 8, 7: 38, 8: 9, 9: 40, 10: 1, 11: 41, 12: 11},
-    2009: {1: 42, 2: 13, 3: 41, 4: 12, 5: 42, 6: 13, 7: 43, 8: 14, 9: 45, 10: 15, 11: 46, 12: 16},
-    2010: {1: 47, 2: 18, 3: 46, 4: 17, 5: 47, 6: 18, 7: 48, 8: 19, 9: 50, 10: 20, 11: 51, 12: 21},
-    2011: {1: 52, 2: 23, 3: 51, 4: 22, 5: 52, 6: 23, 7: 53, 8: 24, 9: 55, 10: 25, 11: 56, 12: 26},
-    2012: {1: 57, 2: 28, 3: 57, 4: 28, 5: 58, 6: 29, 7: 59, 8: 30, 9: 1, 10: 31, 11: 2, 12: 32},
-    2013: {1: 3, 2: 34, 3: 2, 4: 33, 5: 3, 6: 34, 7: 4, 8: 35, 9: 6, 10: 36, 11: 7, 12: 37},
-    2014: {1: 8, 2: 39, 3: 7, 4: 38, 5: 8, 6: 39, 7: 9, 8: 40, 9: 11, 10: 41, 11: 12, 12: 42},
-    2015: {1: 13, 2: 44, 3: 12, 4: 43, 5: 13, 6: 44, 7: 14, 8: 45, 9: 16, 10: 46, 11: 17, 12: 47},
-    2016: {1: 18, 2: 49, 3: 18, 4: 49, 5: 19, 6: 50, 7: 20, 8: 51, 9: 22, 10: 52, 11: 23, 12: 53},
-    2017: {1: 24, 2: 55, 3: 23, 4: 54, 5: 24, 6: 55, 7: 25, 8: 56, 9: 27, 10: 57, 11: 28, 12: 58},
-    2018: {1: 29, 2: 0, 3: 28, 4: 59, 5: 29, 6: 0, 7: 30, 8: 1, 9: 32, 10: 2, 11: 33, 12: 3},
-    2019: {1: 34, 2: 5, 3: 33, 4: 4, 5: 34, 6: 5, 7: 35, 8: 6, 9: 37, 10: 7, 11: 38, 12: 8},
-    2020: {1: 39, 2: 10, 3: 39, 4: 10, 5: 40, 6: 11, 7: 41, 8: 12, 9: 43, 10: 13, 11: 44, 12: 14},
-    2021: {1: 45, 2: 16, 3: 44, 4: 15, 5: 45, 6: 16, 7: 46, 8: 17, 9: 48, 10: 18, 11: 49, 12: 19},
-    2022: {1: 50, 2: 20, 3: 50, 4: 20, 5: 51, 6: 21, 7: 52, 8: 22, 9: 54, 10: 23, 11: 55, 12: 24},
-    2023: {1: 55, 2: 26, 3: 54, 4: 25, 5: 55, 6: 26, 7: 56, 8: 27, 9: 58, 10: 28, 11: 59, 12: 29},
-    2024: {1: 0, 2: 31, 3: 0, 4: 31, 5: 1, 6: 32, 7: 2, 8: 33, 9: 4, 10: 34, 11: 5, 12: 35},
-    2025: {1: 6, 2: 37, 3: 5, 4: 36, 5: 6, 6: 37, 7: 7, 8: 38, 9: 9, 10: 39, 11: 10, 12: 40},
-    2026: {1: 11, 2: 42, 3: 10, 4: 41, 5: 11, 6: 42, 7: 12, 8: 43, 9: 14, 10: 44, 11: 15, 12: 45},
-    2027: {1: 16, 2: 47, 3: 15, 4: 46, 5: 16, 6: 47, 7: 17, 8: 48, 9: 19, 10: 49, 11: 20, 12: 50},
-    2028: {1: 21, 2: 52, 3: 21, 4: 52, 5: 22, 6: 53, 7: 23, 8: 54, 9: 25, 10: 55, 11: 26, 12: 56},
-    2029: {1: 27, 2: 58, 3: 26, 4: 57, 5: 27, 6: 58, 7: 28, 8: 59, 9: 30, 10: 0, 11: 31, 12: 1},
-    2030: {1: 32, 2: 3, 3: 31, 4: 2, 5: 32, 6: 3, 7: 33, 8: 4, 9: 35, 10: 5, 11: 36, 12: 6},
-    2031: {1: 37, 2: 8, 3: 36, 4: 7, 5: 37, 6: 8, 7: 38, 8: 9, 9: 40, 10: 10, 11: 41, 12: 11},
-    2032: {1: 42, 2: 13, 3: 42, 4: 13, 5: 43, 6: 14, 7: 44, 8: 15, 9: 46, 10: 16, 11: 47, 12: 17},
-    2033: {1: 48, 2: 19, 3: 47, 4: 18, 5: 48, 6: 19, 7: 49, 8: 20, 9: 51, 10: 21, 11: 52, 12: 22},
-}
+# day_kanshi_dict.py
+# 互換用。実装は sanmeigaku_core/day_kanshi_dict.py に移った。
+# import day_kanshi_dict は sanmeigaku_core.day_kanshi_dict そのもの（同じモジュールオブジェクト）を返す。
+
+import sys
+
+from sanmeigaku_core import day_kanshi_dict as _module
+
+sys.modules[__name__] = _module
@@ -0,0 +1,153 @@
+# graph_assets.py
+# 天中殺グラフ（バイオリズム）画像の置き場所。UI（tentyuusatsu_app）と HTTP サービス（server）で共有する。
+# build_assets.py で作った幅違い・形式違いの画像があれば AssetStore がメモリに載せて配る
+# （無ければ元の PNG をそのまま使う）。実行時に画像を作ったり消したりはしない。
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+VARIANTS_DIR = os.path.join(_HERE, "sanmeigaku_images", "variants")
+MANIFEST_PATH = os.path.join(VARIANTS_DIR, "manifest.json")
+DEFAULT_WIDTH = 720  # スマホ表示（2x）で足りる幅
+CONTENT_TYPES = {"webp": "image/webp", "png": "image/png"}
+
+# 1) GitHub の raw ベースURL（例）を設定
+#    例: https://raw.githubusercontent.com/<user>/<repo>/<branch>
+GRAPH_BASE_URL = "https://raw.githubusercontent.com/<ユーザー名>/<リポジトリ名>/main"
+
+# 2) あなたのファイル名（相対パス）のマッピング
+TENCHUSATSU_GRAPH_PATHS = {
+    "子丑": "sanmeigaku_images/neushi.png",
+    "寅卯": "sanmeigaku_images/torau.png",
+    "辰巳": "sanmeigaku_images/tatsumi.png",
+    "午未": "sanmeigaku_images/umahitsujiI.png",
+    "申酉": "sanmeigaku_images/sarutori.png",
+    "戌亥": "sanmeigaku_images/inui.png",
+}
+
+
+def graph_path_for(ts_group: str) -> str | None:
+    """リポジトリ内の相対パス（未登録のグループは None）。"""
+    return TENCHUSATSU_GRAPH_PATHS.get(ts_group)
+
+
+def graph_file_for(ts_group: str) -> str | None:
+    """同梱画像の絶対パス（未登録・ファイルが無い場合は None）。"""
+    rel = graph_path_for(ts_group)
+    if not rel:
+        return None
+    path = os.path.join(_HERE, rel)
+    return path if os.path.isfile(path) else None
+
+
+def graph_url_for(ts_group: str) -> str | None:
+    """GitHub raw かローカルを解決して返す。GRAPH_BASE_URLが未設定ならそのままパスを返す。"""
+    rel = graph_path_for(ts_group)
+    if not rel:
+        return None
+    if GRAPH_BASE_URL and "<ユーザー名>" not in GRAPH_BASE_URL:
+        return f"{GRAPH_BASE_URL.rstrip('/')}/{rel.lstrip('/')}"
+    # ベース未設定なら相対パスのまま（ローカル同梱運用）
+    return rel
+
+
+# ---------------- 配信用の画像ストア ----------------
+_UNKNOWN_WIDTH = 1 << 30
+
+class Asset:
+    """メモリ上の画像1枚。name はハッシュ入りなら immutable（内容が変われば名前も変わる）。"""
+
+    __slots__ = ("name", "format", "width", "data", "etag", "immutable")
+
+    def __init__(self, name: str, fmt: str, width, data: bytes, digest: str, immutable: bool):
+        self.name = name
+        self.format = fmt
+        self.width = width
+        self.data = data
+        self.etag = f'"{digest[:16]}"'
+        self.immutable = immutable
+
+    @property
+    def content_type(self) -> str:
+        return CONTENT_TYPES.get(self.format, "application/octet-stream")
+
+
+class AssetStore:
+    """
+    manifest.json の画像をすべてメモリに読み込み、グループ・幅・形式から1枚を選ぶ。
+    manifest が無い（build_assets.py 未実行）場合は元の PNG だけを載せる。
+    """
+
+    __slots__ = ("_by_name", "_by_group")
+
+    def __init__(self, manifest_path: str = MANIFEST_PATH):
+        self._by_name = {}
+        self._by_group = {}
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                groups = json.load(f)["groups"]
+        except (OSError, ValueError, KeyError):
+            groups = {}
+
+        base = os.path.dirname(manifest_path)
+        for ts_group in TENCHUSATSU_GRAPH_PATHS:
+            assets = []
+            for v in groups.get(ts_group, {}).get("variants", []):
+                try:
+                    with open(os.path.join(base, v["name"]), "rb") as f:
+                        data = f.read()
+                except OSError:
+                    continue
+                assets.append(Asset(v["name"], v["format"], v["width"], data, v["sha256"], True))
+            if not assets:
+                assets = self._original(ts_group)
+            self._by_group[ts_group] = assets
+            for a in assets:
+                self._by_name[a.name] = a
+
+    @staticmethod
+    def _original(ts_group: str) -> list:
+        path = graph_file_for(ts_group)
+        if not path:
+            return []
+        with open(path, "rb") as f:
+            data = f.read()
+        return [Asset(os.path.basename(path), "png", None, data, hashlib.sha256(data).hexdigest(), False)]
+
+    def get(self, name: str):
+        """ファイル名から（無ければ None）。"""
+        return self._by_name.get(name)
+
+    def pick(self, ts_group: str, width: int | None = DEFAULT_WIDTH, webp: bool = True):
+        """
+        表示幅 width 以上で最小の画像（無ければ最大のもの）。webp=False なら PNG だけから選ぶ。
+        width=None は最大幅。グループが未登録なら None。
+        """
+        assets = self._by_group.get(ts_group) or []
+        fmts = ("webp", "png") if webp else ("png",)
+        cands = [a for a in assets if a.format in fmts] or assets
+        if not cands:
+            return None
+        # 幅の不明な元画像は最大扱い。同じ幅なら fmts の順（WebP 優先）
+        cands = sorted(cands, key=lambda a: (a.width or _UNKNOWN_WIDTH, fmts.index(a.format) if a.format in fmts else len(fmts)))
+        if width:
+            for a in cands:
+                if (a.width or _UNKNOWN_WIDTH) >= width:
+                    return a
+        widest = cands[-1].width
+        return next(a for a in cands if a.width == widest)
+
+    def total_bytes(self) -> int:
+        return sum(len(a.data) for a in self._by_name.values())
+
+
+@lru_cache(maxsize=None)
+def get_asset_store() -> AssetStore:
+    """
+    プロセス内で1回だけ読み込んで使い回す。画像はビルド時に build_assets.py で作るもので、ここでは作らない
+    （manifest が無ければ元の PNG をそのまま配る）。
+    """
+    return AssetStore()
@@ -1,64 +1,5 @@
-# 干支インデックス（1～60）に対応する天中殺と干支名
-kanshi_data = {
-    1: {"tensatsu": "戌亥", "kanshi": "甲子"},
-    2: {"tensatsu": "戌亥", "kanshi": "乙丑"},
-    3: {"tensatsu": "戌亥", "kanshi": "丙寅"},
-    4: {"tensatsu": "戌亥", "kanshi": "丁卯"},
-    5: {"tensatsu": "戌亥", "kanshi": "戊辰"},
-    6: {"tensatsu": "戌亥", "kanshi": "己巳"},
-    7: {"tensatsu": "戌亥", "kanshi": "庚午"},
-    8: {"tensatsu": "戌亥", "kanshi": "辛未"},
-    9: {"tensatsu": "戌亥", "kanshi": "壬申"},
-    10: {"tensatsu": "戌亥", "kanshi": "癸酉"},
-    11: {"tensatsu": "申酉", "kanshi": "甲戌"},
-    12: {"tensatsu": "申酉", "kanshi": "乙亥"},
-    13: {"tensatsu": "申酉", "kanshi": "丙子"},
-    14: {"tensatsu": "申酉", "kanshi": "丁丑"},
-    15: {"tensatsu": "申酉", "kanshi": "戊寅"},
-    16: {"tensatsu": "申酉", "kanshi": "己卯"},
-    17: {"tensatsu": "申酉", "kanshi": "庚辰"},
-    18: {"tensatsu": "申酉", "kanshi": "辛巳"},
-    19: {"tensatsu": "申酉", "kanshi": "壬午"},
-    20: {"tensatsu": "申酉", "kanshi": "癸未"},
-    21: {"tensatsu": "午未", "kanshi": "甲申"},
-    22: {"tensatsu": "午未", "kanshi": "乙酉"},
-    23: {"tensatsu": "午未", "kanshi": "丙戌"},
-    24: {"tensatsu": "午未", "kanshi": "丁亥"},
-    25: {"tensatsu": "午未", "kanshi": "戊子"},
-    26: {"tensatsu": "午未", "kanshi": "己丑"},
-    27: {"tensatsu": "午未", "kanshi": "庚寅"},
-    28: {"tensatsu": "午未", "kanshi": "辛卯"},
-    29: {"tensatsu": "午未", "kanshi": "壬辰"},
-    30: {"tensatsu": "午未", "kanshi": "癸巳"},
-    31: {"tensatsu": "辰巳", "kanshi": "甲午"},
-    32: {"tensatsu": "辰巳", "kanshi": "乙未"},
-    33: {"tensatsu": "辰巳", "kanshi": "丙申"},
-    34: {"tensatsu": "辰巳", "kanshi": "丁酉"},
-    35: {"tensatsu": "辰巳", "kanshi": "戊戌"},
-    36: {"tensatsu": "辰巳", "kanshi": "己亥"},
-    37: {"tensatsu": "辰巳", "kanshi": "庚子"},
-    38: {"tensatsu": "辰巳", "kanshi": "辛丑"},
-    39: {"tensatsu": "辰巳", "kanshi": "壬寅"},
-    40: {"tensatsu": "辰巳", "kanshi": "癸卯"},
-    41: {"tensatsu": "寅卯", "kanshi": "甲辰"},
-    42: {"tensatsu": "寅卯", "kanshi": "乙巳"},
-    43: {"tensatsu": "寅卯", "kanshi": "丙午"},
-    44: {"tensatsu": "寅卯", "kanshi": "丁未"},
-    45: {"tensatsu": "寅卯", "kanshi": "戊申"},
-    46: {"tensatsu": "寅卯", "kanshi": "己酉"},
-    47: {"tensatsu": "寅卯", "kanshi": "庚戌"},
-    48: {"tensatsu": "寅卯", "kanshi": "辛亥"},
-    49: {"tensatsu": "寅卯", "kanshi": "壬子"},
-    50: {"tensatsu": "寅卯", "kanshi": "癸丑"},
-    51: {"tensatsu": "子丑", "kanshi": "甲寅"},
-    52: {"tensatsu": "子丑", "kanshi": "乙卯"},
-    53: {"tensatsu": "子丑", "kanshi": "丙辰"},
-    54: {"tensatsu": "子丑", "kanshi": "丁巳"},
-    55: {"tensatsu": "子丑", "kanshi": "戊午"},
-    56: {"tensatsu": "子丑", "kanshi": "己未"},
-    57: {"tensatsu": "子丑", "kanshi": "庚申"},
-    58: {"tensatsu": "子丑", "kanshi": "辛酉"},
-    59: {"tensatsu": "子丑", "kanshi": "壬戌"},
-    60: {"tensatsu": "子丑", "kanshi": "癸亥"},
-}
-
+# 干支インデックス（1～60）に対応する天中殺と干支名
+# 互換用の表。中身は kanshi_type の配列から作る（新しいコードは kanshi_type.Kanshi を使う）
+from sanmeigaku_core.kanshi_type import ALL
+
+kanshi_data = {int(k): {"tensatsu": k.tenchusatsu, "kanshi": k.name} for k in ALL}
@@ -0,0 +1,97 @@
+# importtime_report.py
+# 各モジュールの import コストと、各データテーブルの初回アクセスコストを表示する。
+# どれも新しいインタプリタ（python -X importtime）で測るので、計測同士が影響しない。
+#
+#   python importtime_report.py            # 既定のモジュール一覧
+#   python importtime_report.py sanmeigaku_core.kanshi_core batch_cli
+
+import os
+import subprocess
+import sys
+
+# UI を描画しない（streamlit を import しない）モジュール
+DEFAULT_MODULES = [
+    "sanmeigaku_core",
+    "sanmeigaku_core.kanshi_core",
+    "sanmeigaku_core.calendar_engine",
+    "sanmeigaku_core.batch_diagnosis",
+    "batch_cli",
+    "server",
+    "sanmeigaku_core.month_table",
+    "sanmeigaku_core.data_pack",
+    "sanmeigaku_core.data_access",
+    "sanmeigaku_core.risshun_data",
+    "sanmeigaku_core.tenchusatsu_messages",
+    "sanmeigaku_core.day_kanshi_dict",
+    "sanmeigaku_core.month_kanshi_index_dict",
+]
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _run(code: str):
+    """-X importtime 付きで code を実行し、(stderr の行, stdout) を返す。"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=_HERE, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else "failed")
+    return proc.stderr.splitlines(), proc.stdout
+
+
+def import_cost(module: str):
+    """module を import したときの (自身のμs, 累積μs, 一緒に読まれた自作モジュール) 。"""
+    lines, _ = _run(f"import {module}")
+    self_us = cum_us = 0
+    local = []
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            s, c = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # ヘッダー行
+        name = parts[2].strip()
+        if name == module:
+            self_us, cum_us = s, c
+        elif name.startswith("sanmeigaku_core") or os.path.exists(os.path.join(_HERE, name + ".py")):
+            local.append(name)
+    return self_us, cum_us, local
+
+
+def access_cost(accessor: str) -> float:
+    """sanmeigaku_core.data_access.<accessor>() の初回呼び出しにかかる時間（ms、import data_access 後から）。"""
+    code = (
+        "import time\nfrom sanmeigaku_core import data_access\n"
+        "t = time.perf_counter()\n"
+        f"data_access.{accessor}()\n"
+        "print((time.perf_counter() - t) * 1000)\n"
+    )
+    _, out = _run(code)
+    return float(out.strip())
+
+
+def main(argv=None) -> int:
+    modules = (sys.argv[1:] if argv is None else argv) or DEFAULT_MODULES
+
+    print(f"{'module':<40}{'self(ms)':>10}{'cumul(ms)':>11}  local deps")
+    for mod in modules:
+        try:
+            s, c, local = import_cost(mod)
+        except RuntimeError as e:
+            print(f"{mod:<40}{'-':>10}{'-':>11}  error: {e}")
+            continue
+        print(f"{mod:<40}{s / 1000:>10.2f}{c / 1000:>11.2f}  {', '.join(local)}")
+
+    from sanmeigaku_core.data_access import ACCESSORS
+    print()
+    print(f"{'first access':<40}{'ms':>10}")
+    for name, fn in ACCESSORS.items():
+        print(f"{name:<40}{access_cost(fn.__name__):>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,26 +1,51 @@
-
 """kanshi_calc.py
 
-このモジュールでは、干支や天中殺の計算に関するロジックをまとめています。
-年干支・月干支のインデックス計算を行い、その結果から干支名や天中殺グループを取得するための
-関数群を提供します。日付から直接天中殺グループを求める補助関数も用意しています。
+天中殺診断のステップ式画面（生年月日入力 → 確認 → 診断結果）。計算は sanmeigaku_core を呼ぶだけです。
 
-従来の `kanshi_month_start_index` を用いた方式は一部の年にしか対応しておらず、
-算命学で一般的に用いられる月干支計算には「年ごとの揺らぎ」を考慮する必要があります。
-ここでは `day_kanshi_dict.py` に定義されている `kanshi_index_table` を利用して、
-年・節月ごとに正確な干支インデックスを取得できるようにしています。
+年・日干支と天中殺はカレンダー表（get_engine().diagnose）、月干支は `resolve_month()` で引きます。
+`resolve_month()` は節入り境界の索引を bisect して (節月, 月干支idx, 節入りからの日数) を返すので、
+立春前の日付を前年の丑月として扱う補正も索引の側で済んでいます。
+診断は生年月日ごとに1回だけ行い（キャッシュ）、確認と結果の画面は同じ結果を表示します。
 
-注意: 月干支インデックスの計算では、立春前の場合に前年の12月節として扱うため、
-`get_setsuge_month()` と `get_year_kanshi_index()` の結果を組み合わせて計算します。
+`get_setsuge_month()` / `get_month_kanshi_name()` は `resolve_month()` の節月・月干支名を返す補助関数です。
 """
 
 # app.py
 import streamlit as st
 from datetime import datetime, date
 
-# --- 既存ロジック（インポート or 同ファイルに定義） ---
-# from kanshi_calc import get_year_kanshi_from_risshun, get_day_kanshi_from_table, get_tenchusatsu_from_day_index
-# from tenchusatsu_messages import tentyuusatsu_messages
+# 計算は sanmeigaku_core（UIなし）から呼ぶ。月干支は節入り境界の索引から引く
+from sanmeigaku_core import RANGE_START, RANGE_END, kanshi_name, resolve_month, get_engine, get_messages
+
+# -----------------------------------------
+# キャッシュ
+# -----------------------------------------
+# 表（カレンダー表・メッセージ）はプロセスで1つだけ
+@st.cache_resource
+def _engine():
+    return get_engine()
+
+@st.cache_resource
+def _messages():
+    return get_messages()
+
+# 診断は生年月日ごとに1回だけ。確認（STEP 2）と結果（STEP 3）は同じオブジェクトを読むので、書き換えない。
+# セッションには生年月日と、診断済みの日付（このキャッシュを引くキー）だけを持つ
+@st.cache_resource(max_entries=10_000)
+def _diagnose(birth_date: date) -> dict:
+    res = _engine().diagnose(birth_date)
+    # 月干支は節入り境界の索引から（節月と節入りからの日数も一緒に引ける）
+    sekki_month, month_idx, days = resolve_month(birth_date)
+    res["month_kanshi"], res["month_index"] = kanshi_name(month_idx), month_idx
+    res["sekki_month"], res["sekki_days"] = sekki_month, days
+    res["birth_date"] = birth_date
+    res["messages"] = _messages().get(res["tenchusatsu"], ())
+    return res
+
+def _month_pillar(r: dict) -> str:
+    """月干支の表示（例: "丁丑（丑月・節入りの29日後）"）。節月の支は月干支の支と同じ。"""
+    since = "節入り当日" if r["sekki_days"] == 0 else f"節入りの{r['sekki_days']}日後"
+    return f"{r['month_kanshi']}（{r['month_kanshi'][1]}月・{since}）"
 
 # -----------------------------------------
 # ウィザード共通設定
@@ -33,8 +58,8 @@ if "step" not in st.session_state:
     st.session_state.step = 0
 if "birth_date" not in st.session_state:
     st.session_state.birth_date = None
-if "result" not in st.session_state:
-    st.session_state.result = {}
+if "result_key" not in st.session_state:
+    st.session_state.result_key = None
 
 def go_next():
     st.session_state.step = min(st.session_state.step + 1, len(STEPS)-1)
@@ -45,7 +70,7 @@ def go_prev():
 def reset_all():
     st.session_state.step = 0
     st.session_state.birth_date = None
-    st.session_state.result = {}
+    st.session_state.result_key = None
 
 # -----------------------------------------
 # ヘッダー／進捗
@@ -65,8 +90,8 @@ if st.session_state.step == 0:
         bd = st.date_input(
             "生年月日",
             value=st.session_state.birth_date or date(2000, 1, 1),
-            min_value=date(1900, 1, 1),
-            max_value=date(2033, 12, 31),
+            min_value=RANGE_START,
+            max_value=RANGE_END,
             help="※ 立春（2/3〜2/5頃）をまたぐ場合は内部で前年扱いになります。"
         )
         col1, col2 = st.columns([1,1])
@@ -87,40 +112,31 @@ elif st.session_state.step == 1:
     with st.container(border=True):
         st.write("**生年月日**：", bd.strftime("%Y年 %m月 %d日（%a）"))
 
-        # プレビュー（任意）：ここで年干支・日干支の“予定値”を一旦計算して見せることも可能
+        # プレビュー：ここで引いた診断を STEP 3 でもそのまま使う（再計算しない）
         try:
-            year_kanshi = get_year_kanshi_from_risshun(bd)
-            day_kanshi, idx = get_day_kanshi_from_table(bd)
-            st.write("**年干支（立春基準）**：", year_kanshi)
-            st.write("**日干支（伝統方式）**：", f"{day_kanshi}（index: {idx}）")
-        except Exception:
-            st.write("プレビューは省略します。")
+            r = _diagnose(bd)
+        except ValueError as e:
+            r = None
+            st.error(f"計算できません: {e}")
+        else:
+            st.write("**年干支（立春基準）**：", r["year_kanshi"])
+            st.write("**月干支（節入り基準）**：", _month_pillar(r))
+            st.write("**日干支（伝統方式）**：", f"{r['day_kanshi']}（index: {r['day_index']}）")
 
     col1, col2 = st.columns([1,1])
     col1.button("◀ 戻る", on_click=go_prev, use_container_width=True)
     def _run_calc():
-        bd2 = st.session_state.birth_date
-        # --- ここで本計算 ---
-        yk = get_year_kanshi_from_risshun(bd2)                  # 文字列（例: '甲子'）
-        dk, idx = get_day_kanshi_from_table(bd2)                # ('丁巳', 54) のような戻り値を想定
-        ts = get_tenchusatsu_from_day_index(idx) if idx else "該当なし"
-        msg = tentyuusatsu_messages.get(ts, [])
-        st.session_state.result = {
-            "birth_date": bd2,
-            "year_kanshi": yk,
-            "day_kanshi": dk,
-            "day_index": idx,
-            "tenchusatsu": ts,
-            "messages": msg,
-        }
+        # 診断はプレビューで済んでいる。結果の画面はこの日付でキャッシュを引く
+        st.session_state.result_key = st.session_state.birth_date
         go_next()
-    col2.button("診断する ✅", on_click=_run_calc, type="primary", use_container_width=True)
+    col2.button("診断する ✅", on_click=_run_calc, type="primary", use_container_width=True, disabled=r is None)
 
 # -----------------------------------------
 # STEP 3: 結果
 # -----------------------------------------
 else:
-    r = st.session_state.result
+    key = st.session_state.result_key
+    r = _diagnose(key) if key is not None else None
     if not r:
         st.warning("結果が見つかりません。最初からやり直してください。")
         st.button("最初に戻る", on_click=reset_all)
@@ -129,6 +145,7 @@ else:
             st.subheader("診断結果")
             st.write("**生年月日**：", r["birth_date"].strftime("%Y年 %m月 %d日"))
             st.write("**年干支（立春基準）**：", r["year_kanshi"])
+            st.write("**月干支（節入り基準）**：", _month_pillar(r))
             st.write("**日干支（伝統方式）**：", f"{r['day_kanshi']}（index: {r['day_index']}）")
             st.write("**天中殺**：", r["tenchusatsu"])
 
@@ -154,18 +171,14 @@ with st.sidebar:
     st.divider()
     st.caption("※ サイドバーはナビの表示のみで、直接のスキップはできません。")
 
+def get_setsuge_month(birth_date):
+    """節月（1=寅月〈立春〜〉… 11=子月〈大雪〜〉, 12=丑月〈小寒〜〉）を返す"""
+    month, _, _ = resolve_month(birth_date)
+    return month
+
 def get_month_kanshi_name(birth_date):
-    """月干支の名前（立春基準）を返す"""
-    # 月干支インデックス取得
-    year = birth_date.year
-    month = get_setsuge_month(birth_date)
-    risshun = risshun_dict.get(year)
-    if risshun and birth_date < risshun:
-        year -= 1
-    index = month_kanshi_index_dict.get((year, month))
-    if not index:
-        return None
-    # 干支名に変換
-    data = kanshi_data.get(index)
-    return data["kanshi"] if data else None
+    """月干支の名前（節入り基準）を返す"""
+    # 節入り境界を bisect で引くので、立春前の前年扱いも含めて年の補正は不要
+    _, index, _ = resolve_month(birth_date)
+    return kanshi_name(index)
 
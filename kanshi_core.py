@@ -0,0 +1,9 @@
+# kanshi_core.py
+# 互換用。実装は sanmeigaku_core/kanshi_core.py に移った。
+# import kanshi_core は sanmeigaku_core.kanshi_core そのもの（同じモジュールオブジェクト）を返す。
+
+import sys
+
+from sanmeigaku_core import kanshi_core as _module
+
+sys.modules[__name__] = _module
@@ -0,0 +1,9 @@
+# kanshi_type.py
+# 互換用。実装は sanmeigaku_core/kanshi_type.py に移った。
+# import kanshi_type は sanmeigaku_core.kanshi_type そのもの（同じモジュールオブジェクト）を返す。
+
+import sys
+
+from sanmeigaku_core import kanshi_type as _module
+
+sys.modules[__name__] = _module
@@ -0,0 +1,9 @@
+# lunar_calendar.py
+# 互換用。実装は sanmeigaku_core/lunar_calendar.py に移った。
+# import lunar_calendar は sanmeigaku_core.lunar_calendar そのもの（同じモジュールオブジェクト）を返す。
+
+import sys
+
+from sanmeigaku_core import lunar_calendar as _module
+
+sys.modules[__name__] = _module
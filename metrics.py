@@ -0,0 +1,9 @@
+# metrics.py
+# 互換用。実装は sanmeigaku_core/metrics.py に移った。
+# import metrics は sanmeigaku_core.metrics そのもの（同じモジュールオブジェクト）を返す。
+
+import sys
+
+from sanmeigaku_core import metrics as _module
+
+sys.modules[__name__] = _module
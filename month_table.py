@@ -0,0 +1,9 @@
+# month_table.py
+# 互換用。実装は sanmeigaku_core/month_table.py に移った。
+# import month_table は sanmeigaku_core.month_table そのもの（同じモジュールオブジェクト）を返す。
+
+import sys
+
+from sanmeigaku_core import month_table as _module
+
+sys.modules[__name__] = _module
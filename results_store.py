@@ -0,0 +1,206 @@
+# results_store.py
+# 対応範囲の全日付の診断結果を SQLite に書き出した「結果ストア」。
+# 1件の参照は主キー（日付）で、期間・天中殺グループ・日干支での絞り込みは索引で引ける。
+# 作成時のデータパックのハッシュなどを meta 表に残すので、監査用の固定スナップショットとしても使える。
+#
+#   python results_store.py build                               # diagnoses.sqlite を作り直す
+#   python results_store.py query 1985-02-03
+#   python results_store.py query 1985-01-01 1985-12-31 --group 午未
+#   python results_store.py info
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from bisect import bisect_right
+from datetime import date
+
+from sanmeigaku_core.kanshi_core import (
+    RANGE_START, RANGE_END, TABLE_START, TABLE_END,
+    _as_date, kanshi_name, get_month_kanshi_from_table, tenchusatsu_from_index,
+)
+from sanmeigaku_core.calendar_engine import get_engine
+from sanmeigaku_core.sekki_index import get_sekki_index
+
+SCHEMA_VERSION = 1
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "diagnoses.sqlite")
+
+_SCHEMA = """
+CREATE TABLE meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE diagnoses (
+    date              TEXT PRIMARY KEY,   -- YYYY-MM-DD
+    year_index        INTEGER NOT NULL,
+    year_kanshi       TEXT NOT NULL,
+    month_index       INTEGER NOT NULL,
+    month_kanshi      TEXT NOT NULL,
+    month_rule        TEXT NOT NULL,      -- 月干支の決め方（sekki = 節入り基準）
+    sekki             TEXT NOT NULL,      -- その月が始まった節の名前
+    sekki_start       TEXT NOT NULL,      -- その節入り日
+    month_index_table INTEGER,            -- 旧方式（固定辞書A）の月干支idx（表の範囲外は NULL）
+    day_index         INTEGER NOT NULL,
+    day_kanshi        TEXT NOT NULL,
+    tenchusatsu       TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX diagnoses_day_index ON diagnoses (day_index, date);
+CREATE INDEX diagnoses_tenchusatsu ON diagnoses (tenchusatsu, date);
+"""
+
+COLUMNS = (
+    "date", "year_index", "year_kanshi", "month_index", "month_kanshi", "month_rule",
+    "sekki", "sekki_start", "month_index_table", "day_index", "day_kanshi", "tenchusatsu",
+)
+
+
+def _rows(start: date, end: date):
+    """start〜end の全日付の行（COLUMNS の順）を日付順に返すジェネレータ。"""
+    engine = get_engine()
+    if not engine.start <= start <= end <= engine.end:
+        raise ValueError(f"対応範囲外の期間です: {start}〜{end}（{engine.start}〜{engine.end}）")
+    si = get_sekki_index()
+    base = engine.start.toordinal()
+    lo, hi = start.toordinal(), end.toordinal()
+    table_lo, table_hi = TABLE_START.toordinal(), TABLE_END.toordinal()
+
+    # 節入り索引は日付順に1つずつ進めるだけ
+    j = bisect_right(si.ordinals, lo) - 1
+    for o in range(lo, hi + 1):
+        while j + 1 < len(si.ordinals) and si.ordinals[j + 1] <= o:
+            j += 1
+        i = o - base
+        d = date.fromordinal(o)
+        y_idx, m_idx, d_idx = engine.year_idx[i], engine.month_idx[i], engine.day_idx[i]
+        m_table = get_month_kanshi_from_table(d)[1] if table_lo <= o <= table_hi else None
+        yield (
+            d.isoformat(), y_idx, kanshi_name(y_idx), m_idx, kanshi_name(m_idx), "sekki",
+            si.names[j], date.fromordinal(si.ordinals[j]).isoformat(), m_table,
+            d_idx, kanshi_name(d_idx), tenchusatsu_from_index(d_idx),
+        )
+
+
+def build_store(path: str = DEFAULT_PATH, start: date = RANGE_START, end: date = RANGE_END) -> int:
+    """start〜end の全日付を計算して path に書き出す（原子的に置き換える）。書いた行数を返す。"""
+    from sanmeigaku_core.data_pack import load_pack
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    try:
+        n = _write_store(tmp, start, end, load_pack().digest.hex())
+        os.replace(tmp, path)
+    finally:
+        # 途中で失敗したら書きかけを残さない（置き換え済みなら消すものは無い）
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+    return n
+
+
+def _write_store(tmp: str, start: date, end: date, pack_digest: str) -> int:
+    """tmp に表を作って start〜end の行と meta を書き込む。書いた行数を返す。"""
+    con = sqlite3.connect(tmp)
+    try:
+        # 作り捨てのファイルなのでジャーナル・同期は切る
+        con.execute("PRAGMA journal_mode = OFF")
+        con.execute("PRAGMA synchronous = OFF")
+        con.executescript(_SCHEMA)
+        with con:
+            cur = con.executemany(
+                f"INSERT INTO diagnoses ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                _rows(start, end),
+            )
+            n = cur.rowcount
+            con.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", [
+                ("schema_version", str(SCHEMA_VERSION)),
+                ("range_start", start.isoformat()),
+                ("range_end", end.isoformat()),
+                ("rows", str(n)),
+                ("data_pack_sha256", pack_digest),
+                ("created_at", time.strftime("%Y-%m-%dT%H:%M:%S%z")),
+            ])
+        con.execute("ANALYZE")
+    finally:
+        con.close()
+    return n
+
+
+class ResultsStore:
+    """結果ストアの読み取り専用ラッパー。行は COLUMNS をキーにした dict で返す。"""
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"結果ストアがありません: {path}（python results_store.py build で作成）")
+        # 読むだけなので、スレッドをまたいで使えるよう check_same_thread=False
+        self._con = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        self._con.row_factory = sqlite3.Row
+
+    def close(self):
+        self._con.close()
+
+    def meta(self) -> dict:
+        return dict(self._con.execute("SELECT key, value FROM meta").fetchall())
+
+    def lookup(self, birth_date):
+        """1日分（無ければ None）。"""
+        row = self._con.execute(
+            "SELECT * FROM diagnoses WHERE date = ?", (_as_date(birth_date).isoformat(),)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def scan(self, start, end, tenchusatsu: str | None = None, day_index: int | None = None) -> list:
+        """start〜end（両端含む）の行を日付順に。天中殺グループ・日干支idxで絞り込める。"""
+        sql = "SELECT * FROM diagnoses WHERE date BETWEEN ? AND ?"
+        args = [_as_date(start).isoformat(), _as_date(end).isoformat()]
+        if tenchusatsu is not None:
+            sql += " AND tenchusatsu = ?"
+            args.append(tenchusatsu)
+        if day_index is not None:
+            sql += " AND day_index = ?"
+            args.append(int(day_index))
+        return [dict(r) for r in self._con.execute(sql + " ORDER BY date", args)]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="results_store.py", description="全日付の診断結果ストア（SQLite）")
+    parser.add_argument("--path", default=DEFAULT_PATH, help=f"SQLite ファイル（既定: {os.path.basename(DEFAULT_PATH)}）")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="全日付を計算して作り直す")
+    sub.add_parser("info", help="作成時の情報を表示する")
+    q = sub.add_parser("query", help="1日分、または期間の行を表示する")
+    q.add_argument("start", help="日付（end を付けると期間の開始日）")
+    q.add_argument("end", nargs="?", help="期間の終了日")
+    q.add_argument("--group", help="天中殺グループで絞り込む（例: 午未）")
+    q.add_argument("--day-index", type=int, help="日干支idxで絞り込む（1..60）")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        t0 = time.perf_counter()
+        n = build_store(args.path)
+        print(f"{args.path}: {n:,} rows in {time.perf_counter() - t0:.1f}s")
+        return 0
+
+    try:
+        store = ResultsStore(args.path)
+    except FileNotFoundError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    if args.command == "info":
+        for k, v in store.meta().items():
+            print(f"{k:<18}{v}")
+        return 0
+
+    if args.end is None and args.group is None and args.day_index is None:
+        rows = [r for r in [store.lookup(args.start)] if r]
+    else:
+        rows = store.scan(args.start, args.end or args.start, args.group, args.day_index)
+    for r in rows:
+        print("\t".join("" if r[c] is None else str(r[c]) for c in COLUMNS))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,13 @@
+# reverse_index.py
+# 互換用。実装は sanmeigaku_core/reverse_index.py に移った。
+# import reverse_index は sanmeigaku_core.reverse_index そのもの（同じモジュールオブジェクト）を返す。
+# python reverse_index.py ... は python -m sanmeigaku_core.reverse_index ... と同じ。
+
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("sanmeigaku_core.reverse_index", run_name="__main__", alter_sys=True)
+else:
+    from sanmeigaku_core import reverse_index as _module
+    sys.modules[__name__] = _module
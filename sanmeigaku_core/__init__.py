@@ -0,0 +1,89 @@
+# sanmeigaku_core
+# 干支・節入り・天中殺の計算の公開窓口（Streamlit などの UI は import しない）。
+# 各アプリ（tentyuusatsu_app.py / kanshi_calc.py / sanmeigaku.py）はここから計算を呼ぶだけの画面にする。
+#
+# 名前は最初に使われたときに実装モジュール（このパッケージの kanshi_core・calendar_engine など）から
+# 読み込むので、import sanmeigaku_core 自体はほぼ何も読まない。バッチや CLI は使う分の表だけを読む。
+#
+# 実装モジュールはすべてこのパッケージの中にあり、互いに相対 import する。パッケージのディレクトリだけを
+# どこに置いても（その親が sys.path にあれば）動く。リポジトリ直下の kanshi_core.py などは
+# 以前の import 名のための薄い互換モジュールで、このパッケージの対応するモジュールをそのまま返す。
+# 公開関数と名前がぶつかる2つは、モジュール名を compat（相性）・periods（天中殺の期間）にしている
+# （サブモジュールを import するとパッケージの同名の属性が上書きされるため）。
+#
+#   import sanmeigaku_core as core
+#   core.diagnose("1985-02-03")          # {"year_kanshi": ..., "tenchusatsu": ...}
+#   core.get_day_kanshi("1985-02-03")    # ("癸酉", 10, None)。trace=True なら None の代わりに debug
+#   core.day_kanshi_index("1985-02-03")  # 10（idx だけ。バッチ・API 向け）
+#   core.Kanshi(54).tenchusatsu          # 干支idx → 名前・十干・十二支・五行・陰陽・天中殺
+#   python -m sanmeigaku_core 1985-02-03
+
+from importlib import import_module
+
+# 公開名 → (実装モジュール, 名前)
+_EXPORTS = {
+    # 範囲・干支表
+    "RANGE_START": ("kanshi_core", "RANGE_START"),
+    "RANGE_END": ("kanshi_core", "RANGE_END"),
+    "TABLE_START": ("kanshi_core", "TABLE_START"),
+    "TABLE_END": ("kanshi_core", "TABLE_END"),
+    "Kanshi": ("kanshi_type", "Kanshi"),
+    "KANSHI": ("kanshi_core", "KANSHI"),
+    "kanshi_list": ("kanshi_core", "kanshi_list"),
+    "ETO": ("kanshi_core", "ETO"),
+    "kanshi_name": ("kanshi_core", "kanshi_name"),
+    "as_date": ("kanshi_core", "_as_date"),
+    "parse_date": ("date_parser", "parse_date"),
+    "parse_many": ("date_parser", "parse_many"),
+    "lunar_to_solar": ("lunar_calendar", "lunar_to_solar"),
+    "solar_to_lunar": ("lunar_calendar", "solar_to_lunar"),
+    "lunar_label": ("lunar_calendar", "lunar_label"),
+    # 年・月・日
+    "get_year_kanshi": ("kanshi_core", "get_year_kanshi"),
+    "get_year_kanshi_index": ("kanshi_core", "get_year_kanshi_index"),
+    "get_year_eto": ("kanshi_core", "get_year_eto"),
+    "get_month_kanshi": ("kanshi_core", "get_month_kanshi"),
+    "month_kanshi_index": ("kanshi_core", "month_kanshi_index"),
+    "get_month_kanshi_from_table": ("kanshi_core", "get_month_kanshi_from_table"),
+    "get_day_kanshi": ("kanshi_core", "get_day_kanshi"),
+    "get_day_kanshi_from_table": ("kanshi_core", "get_day_kanshi_from_table"),
+    "day_kanshi_index": ("kanshi_core", "day_kanshi_index"),
+    "resolve_month": ("sekki_index", "resolve_month"),
+    "get_sekki_index": ("sekki_index", "get_sekki_index"),
+    # 天中殺
+    "tenchusatsu_from_index": ("kanshi_core", "tenchusatsu_from_index"),
+    "tenchusatsu_from_eto": ("kanshi_core", "tenchusatsu_from_eto"),
+    "tenchusatsu_periods": ("periods", "tenchusatsu_periods"),
+    "get_messages": ("data_access", "get_messages"),
+    "get_risshun_dict": ("data_access", "get_risshun_dict"),
+    # 展開済みカレンダー表・まとめて処理
+    "get_engine": ("calendar_engine", "get_engine"),
+    "diagnose_many": ("batch_diagnosis", "diagnose_many"),
+    "find_dates": ("reverse_index", "find_dates"),
+    "compatibility": ("compat", "compatibility"),
+    "top_matches": ("compat", "top_matches"),
+}
+
+__all__ = sorted([*_EXPORTS, "diagnose"])
+
+
+def diagnose(birth_date) -> dict:
+    """
+    1日分の診断（年・月・日の干支名とidx、天中殺グループ）。展開済みカレンダー表を引く。
+    日付が読めない・範囲外なら ValueError / TypeError。
+    """
+    from .calendar_engine import get_engine
+    return get_engine().diagnose(birth_date)
+
+
+def __getattr__(name):
+    target = _EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module 'sanmeigaku_core' has no attribute {name!r}")
+    value = getattr(import_module("." + target[0], __name__), target[1])
+    globals()[name] = value  # 2回目からは普通の属性として引ける
+    return value
+
+
+def __dir__():
+    return __all__
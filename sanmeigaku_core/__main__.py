@@ -0,0 +1,76 @@
+# python -m sanmeigaku_core
+# Streamlit を読まずに診断する CLI。日付は引数で渡すか、"-" で標準入力から1行1件。
+#
+#   python -m sanmeigaku_core 1985-02-03 2000-01-01
+#   python -m sanmeigaku_core 昭和60年2月3日 H2.1.1       # 和暦・1985年2月3日 などの書き方も読む
+#   python -m sanmeigaku_core 1985-02-03 --json
+#   python -m sanmeigaku_core 1985-02-03 --periods 12      # これからの天中殺の期間
+#   cat dates.txt | python -m sanmeigaku_core - --json
+
+import argparse
+import json
+import sys
+
+FIELDS = ("year_kanshi", "month_kanshi", "day_kanshi", "day_index", "tenchusatsu")
+
+
+def _values(args_dates):
+    for value in args_dates:
+        if value == "-":
+            yield from (line.strip() for line in sys.stdin if line.strip())
+        else:
+            yield value
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m sanmeigaku_core", description="生年月日から干支・天中殺を診断する")
+    parser.add_argument("dates", nargs="+", help='生年月日（"-" で標準入力から1行1件）')
+    parser.add_argument("--json", action="store_true", help="1件1行の JSON で出力する")
+    parser.add_argument("--periods", type=int, metavar="YEARS", help="今日から YEARS 年先までの天中殺の期間も出す")
+    args = parser.parse_args(argv)
+
+    # 件数が少ないうちは展開済みカレンダー表を作らず、列指向API（節入り日の bisect）でまとめて引く
+    from .batch_diagnosis import TENCHUSATSU_GROUPS, diagnose_many
+    from .kanshi_core import RANGE_START, RANGE_END, _as_date, kanshi_name
+
+    # 読めない・範囲外の行はその行だけエラーにして、残りは診断する
+    values, dates, status = [], [], 0
+    for value in _values(args.dates):
+        try:
+            d = _as_date(value)
+            if not RANGE_START <= d <= RANGE_END:
+                raise ValueError(f"対応範囲外の日付です: {d}（{RANGE_START}〜{RANGE_END}）")
+        except (TypeError, ValueError) as e:
+            print(f"error: {value}: {e}", file=sys.stderr)
+            status = 1
+            continue
+        values.append(value)
+        dates.append(d)
+    cols = diagnose_many(dates)
+
+    for i, value in enumerate(values):
+        rec = {
+            "date": value,
+            "year_kanshi": kanshi_name(int(cols["year_index"][i])),
+            "month_kanshi": kanshi_name(int(cols["month_index"][i])),
+            "day_kanshi": kanshi_name(int(cols["day_index"][i])),
+            "day_index": int(cols["day_index"][i]),
+            "tenchusatsu": TENCHUSATSU_GROUPS[int(cols["group"][i])],
+        }
+        if args.periods is not None:
+            from .periods import tenchusatsu_periods
+            rec["periods"] = [
+                {"kind": p["kind"], "start": p["start"].isoformat(), "end": p["end"].isoformat(), "label": p["label"]}
+                for p in tenchusatsu_periods(dates[i], years=args.periods)
+            ]
+        if args.json:
+            print(json.dumps(rec, ensure_ascii=False))
+            continue
+        print("\t".join([value] + [str(rec[k]) for k in FIELDS]))
+        for p in rec.get("periods", ()):
+            print(f"\t{p['kind']}\t{p['start']}〜{p['end']}\t{p['label']}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
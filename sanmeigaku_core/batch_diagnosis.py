@@ -0,0 +1,113 @@
+# sanmeigaku_core/batch_diagnosis.py
+# 顧客テーブルなどをまとめて診断するための列指向API。
+# 日干支は JDN 算術、年干支・月干支は節入り境界（年は立春）への searchsorted で求める。
+# NumPy があればベクトル化、無ければ array モジュールでの純Python実装にフォールバックする。
+
+from array import array
+from bisect import bisect_right
+from datetime import date
+from functools import lru_cache
+
+from .kanshi_core import RANGE_START, RANGE_END, _as_date, _jdn_ymd
+from .sekki_index import get_sekki_index
+
+try:  # NumPy は任意
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# 天中殺グループのコード（(日干支idx-1)//10 の順）
+from .kanshi_type import TENCHUSATSU_GROUPS, STEMS, BRANCHES  # noqa: F401（コードの対応表として公開）
+
+_JDN_REF = _jdn_ymd(1900, 2, 20)  # 甲子
+_EPOCH_ORD = date(1970, 1, 1).toordinal()  # datetime64[D] の 0
+
+
+@lru_cache(maxsize=None)
+def _tables():
+    """
+    searchsorted 用の定数表を1回だけ作る（sekki_index と共有）。
+    - sk_ord: 節入りの ordinal（昇順）
+    - year_pillars / month_pillars: その節入りから次の節入りの前日までの年・月干支idx
+    """
+    si = get_sekki_index()
+    sk_ord = array("q", si.ordinals)
+    year_pillars = array("B", ((y - 1984) % 60 + 1 for y in si.years))
+    return sk_ord, year_pillars, si.pillars
+
+
+def _check_range(lo: int, hi: int):
+    if lo < RANGE_START.toordinal() or hi > RANGE_END.toordinal():
+        raise ValueError(f"対応範囲外の日付が含まれています（{RANGE_START}〜{RANGE_END}）")
+
+
+def _diagnose_numpy(days):
+    """days: datetime64[D] の ndarray"""
+    sk_ord, year_pillars, month_pillars = _tables()
+    ords = days.astype("int64") + _EPOCH_ORD
+    if ords.size:
+        _check_range(int(ords.min()), int(ords.max()))
+
+    y = days.astype("datetime64[Y]").astype("int64") + 1970
+    m = days.astype("datetime64[M]").astype("int64") % 12 + 1
+    d = (days - days.astype("datetime64[M]")).astype("int64") + 1
+
+    # 日干支：JDN（_jdn_ymd は配列でもそのまま動く）
+    day_idx = ((_jdn_ymd(y, m, d) - _JDN_REF) % 60 + 1).astype(np.uint8)
+
+    # 年・月干支：節入り境界への searchsorted（先頭の節は必ず範囲開始日以前）
+    j = np.searchsorted(np.frombuffer(sk_ord, dtype=np.int64), ords, side="right") - 1
+    year_idx = np.frombuffer(year_pillars, dtype=np.uint8)[j]
+    month_idx = np.frombuffer(month_pillars, dtype=np.uint8)[j]
+
+    i0 = day_idx.astype(np.int64) - 1
+    return {
+        "year_index": year_idx,
+        "month_index": month_idx,
+        "day_index": day_idx,
+        "day_stem": (i0 % 10).astype(np.uint8),
+        "day_branch": (i0 % 12).astype(np.uint8),
+        "group": (i0 // 10).astype(np.uint8),
+    }
+
+
+def _diagnose_python(ords):
+    """ords: date.toordinal() の並び（NumPy なし版）"""
+    sk_ord, year_pillars, month_pillars = _tables()
+    out = {k: array("B") for k in ("year_index", "month_index", "day_index", "day_stem", "day_branch", "group")}
+    if ords:
+        _check_range(min(ords), max(ords))
+
+    for o in ords:
+        dt = date.fromordinal(o)
+        i0 = (_jdn_ymd(dt.year, dt.month, dt.day) - _JDN_REF) % 60
+        j = bisect_right(sk_ord, o) - 1
+
+        out["year_index"].append(year_pillars[j])
+        out["month_index"].append(month_pillars[j])
+        out["day_index"].append(i0 + 1)
+        out["day_stem"].append(i0 % 10)
+        out["day_branch"].append(i0 % 12)
+        out["group"].append(i0 // 10)
+    return out
+
+
+def diagnose_many(dates):
+    """
+    複数日付をまとめて診断し、列ごとの配列を dict で返す。
+      dates: datetime64[D] の ndarray、または _as_date が受け付ける値の並び（date, str など）
+    返り値のキー:
+      year_index / month_index / day_index : 干支idx（1..60）
+      day_stem / day_branch                : 日干支の十干・十二支コード（STEMS / BRANCHES の添字）
+      group                                : 天中殺グループコード（TENCHUSATSU_GROUPS の添字）
+    NumPy があれば各列は uint8 の ndarray、無ければ array('B')。
+    範囲外の日付が含まれていれば ValueError。
+    """
+    if np is not None and isinstance(dates, np.ndarray) and np.issubdtype(dates.dtype, np.datetime64):
+        return _diagnose_numpy(dates.astype("datetime64[D]"))
+
+    ords = [_as_date(x).toordinal() for x in dates]
+    if np is not None:
+        days = (np.asarray(ords, dtype=np.int64) - _EPOCH_ORD).astype("datetime64[D]")
+        return _diagnose_numpy(days)
+    return _diagnose_python(ords)
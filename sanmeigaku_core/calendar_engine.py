@@ -0,0 +1,116 @@
+# sanmeigaku_core/calendar_engine.py
+# 年・月・日干支のインデックスを対応範囲（kanshi_core.RANGE_START〜RANGE_END）の全日について一度だけ展開しておく
+# 密なカレンダー表。date.toordinal() を添字にして 3 本の uint8 配列を引くだけで診断できる。
+# 値は kanshi_core の各関数（立春基準の年・節入り基準の月・JDN の日）と完全に一致するように作る。
+
+from array import array
+from datetime import date
+from functools import lru_cache
+
+from .kanshi_core import (
+    RANGE_START,
+    RANGE_END,
+    _as_date,
+    day_kanshi_index,
+    kanshi_name,
+    tenchusatsu_from_index,
+)
+from .sekki_index import get_sekki_index
+from .metrics import instrument
+
+try:  # NumPy は任意（あれば uint8 ビューを提供）
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def _year_index(sekki_year: int) -> int:
+    return (sekki_year - 1984) % 60 + 1  # 1984=甲子
+
+
+class CalendarEngine:
+    """
+    年・月・日干支インデックス（1..60、0は該当なし）を日付ごとに保持する読み取り専用の表。
+    - year_idx / month_idx / day_idx は array('B')。添字は d.toordinal() - start.toordinal()。
+    - lookup() は範囲外の日付で ValueError。
+    """
+
+    __slots__ = ("start", "end", "_base", "year_idx", "month_idx", "day_idx")
+
+    def __init__(self, start: date = RANGE_START, end: date = RANGE_END):
+        self.start = start
+        self.end = end
+        self._base = start.toordinal()
+        self.year_idx = array("B")
+        self.month_idx = array("B")
+        self.day_idx = array("B")
+        self._build()
+
+    def _build(self):
+        total = self.end.toordinal() - self._base + 1
+        years, months = array("B"), array("B")
+
+        # 年・月干支：節入りから次の節入りの前日まで同じ値を並べる（年は立春の節で切り替わる）
+        si = get_sekki_index()
+        bounds = [max(o - self._base, 0) for o in si.ordinals[1:]] + [total]
+        lo = 0
+        for sekki_year, pillar, hi in zip(si.years, si.pillars, bounds):
+            hi = min(hi, total)
+            if hi > lo:
+                years.extend([_year_index(sekki_year)] * (hi - lo))
+                months.extend([pillar] * (hi - lo))
+            lo = max(lo, hi)
+        self.year_idx = years
+        self.month_idx = months
+
+        # 日干支：60日周期をそのまま並べる
+        head = day_kanshi_index(self.start)
+        cycle = bytes(((head - 1 + i) % 60) + 1 for i in range(60))
+        self.day_idx = array("B", (cycle * (total // 60 + 1))[:total])
+
+        # 展開後のサイズ検証（取りこぼしがあれば起動時に落とす）
+        for col in (self.year_idx, self.month_idx):
+            if len(col) != total:
+                raise ValueError(f"カレンダー表の日数が一致しません: {len(col)} != {total}")
+
+    def __len__(self):
+        return len(self.day_idx)
+
+    def _offset(self, birth_date) -> int:
+        d = _as_date(birth_date)
+        i = d.toordinal() - self._base
+        if not 0 <= i < len(self.day_idx):
+            raise ValueError(f"対応範囲外の日付です: {d}（{self.start}〜{self.end}）")
+        return i
+
+    def lookup(self, birth_date):
+        """(年干支idx, 月干支idx, 日干支idx) を返す。月が未登録なら月idxは None。"""
+        i = self._offset(birth_date)
+        return self.year_idx[i], (self.month_idx[i] or None), self.day_idx[i]
+
+    @instrument("CalendarEngine.diagnose")
+    def diagnose(self, birth_date) -> dict:
+        """UI 表示用の一式（干支名・インデックス・天中殺グループ）。"""
+        y_idx, m_idx, d_idx = self.lookup(birth_date)
+        return {
+            "year_kanshi": kanshi_name(y_idx),
+            "year_index": y_idx,
+            "month_kanshi": kanshi_name(m_idx) if m_idx else "該当なし",
+            "month_index": m_idx,
+            "day_kanshi": kanshi_name(d_idx),
+            "day_index": d_idx,
+            "tenchusatsu": tenchusatsu_from_index(d_idx),
+        }
+
+    def columns(self):
+        """NumPy があれば uint8 配列（コピーなし）で、無ければ array('B') のまま返す。"""
+        cols = (self.year_idx, self.month_idx, self.day_idx)
+        if np is None:
+            return cols
+        return tuple(np.frombuffer(c, dtype=np.uint8) for c in cols)
+
+
+@lru_cache(maxsize=None)
+def get_engine() -> CalendarEngine:
+    """プロセス内で1回だけ構築して使い回す。"""
+    return CalendarEngine()
@@ -0,0 +1,165 @@
+# sanmeigaku_core/compat.py
+# 日干支どうしの相性（干合・支合・三合・冲・害・天中殺の重なり）を 60×60 の表に一度だけまとめ、
+# 名簿（数千〜数万人）の全員について相性の良い相手の上位 k 人を求める。
+#
+# 相性は日干支だけで決まるので、同じ日干支の人は相手の並びも同じになる。そこで名簿を日干支ごとの
+# 60 個のバケツに分け、「自分の日干支から見て点数の高い日干支の順」にバケツを覗いて k 人集まったら止める。
+# N×N の点数行列は作らず、1人あたり O(60 + k) で済む。
+#
+#   from compatibility import compatibility, top_matches
+#   compatibility("1985-02-03", "1990-06-15")        # 2人の関係と点数
+#   top_matches([("A", "1985-02-03"), ("B", "1990-06-15"), ...], k=5)
+
+from array import array
+from functools import lru_cache
+
+from .kanshi_core import RANGE_START, RANGE_END, _as_date, day_kanshi_index, kanshi_name
+from .kanshi_type import BRANCH, BRANCHES, GROUP, STEM, TENCHUSATSU_GROUPS
+
+# 関係のビット（表は uint8）と、表示名・点数
+KANGOU = 1            # 干合（甲己・乙庚・丙辛・丁壬・戊癸）
+SHIGOU = 2            # 支合（子丑・寅亥・卯戌・辰酉・巳申・午未）
+SANGOU = 4            # 三合（申子辰・亥卯未・寅午戌・巳酉丑 のうち2支）
+CHUU = 8              # 冲（向かい合う支）
+GAI = 16              # 害（子未・丑午・寅巳・卯辰・申亥・酉戌）
+SAME_GROUP = 32       # 同じ天中殺グループ
+IN_TENCHUSATSU = 64   # 相手の日支が自分の天中殺の支（向きあり）
+SAME_KANSHI = 128     # 同じ日干支
+
+RELATIONS = (
+    (KANGOU, "干合", 3),
+    (SHIGOU, "支合", 3),
+    (SANGOU, "三合", 2),
+    (SAME_GROUP, "同じ天中殺", 2),
+    (SAME_KANSHI, "同じ日干支", 1),
+    (CHUU, "冲", -3),
+    (GAI, "害", -2),
+    (IN_TENCHUSATSU, "相手が天中殺の支", -1),
+)
+
+
+def _relation_bits(a: int, b: int) -> int:
+    """日干支idx a（自分）から見た b（相手）との関係のビット。"""
+    sa, sb = STEM[a], STEM[b]
+    ba, bb = BRANCH[a], BRANCH[b]
+    bits = 0
+    if abs(sa - sb) == 5:
+        bits |= KANGOU
+    if (ba + bb) % 12 == 1:
+        bits |= SHIGOU
+    if ba != bb and ba % 4 == bb % 4:
+        bits |= SANGOU
+    if abs(ba - bb) == 6:
+        bits |= CHUU
+    if (ba + bb) % 12 == 7:
+        bits |= GAI
+    if GROUP[a] == GROUP[b]:
+        bits |= SAME_GROUP
+    if BRANCHES[bb] in TENCHUSATSU_GROUPS[GROUP[a]]:
+        bits |= IN_TENCHUSATSU
+    if a == b:
+        bits |= SAME_KANSHI
+    return bits
+
+
+class CompatibilityTables:
+    """
+    60×60 の関係ビット（array('B')）と点数（array('b')）。添字は (a-1)*60 + (b-1)。
+    partner_order[a] は a から見て点数の高い順（同点は idx 順）に並べた相手の日干支idx。
+    """
+
+    __slots__ = ("relations", "scores", "partner_order")
+
+    def __init__(self):
+        self.relations = array("B", bytes(3600))
+        self.scores = array("b", bytes(3600))
+        for a in range(1, 61):
+            for b in range(1, 61):
+                bits = _relation_bits(a, b)
+                self.relations[(a - 1) * 60 + b - 1] = bits
+                self.scores[(a - 1) * 60 + b - 1] = sum(pt for bit, _, pt in RELATIONS if bits & bit)
+        self.partner_order = [()] + [
+            tuple(sorted(range(1, 61), key=lambda b: (-self.scores[(a - 1) * 60 + b - 1], b)))
+            for a in range(1, 61)
+        ]
+
+    def score(self, a: int, b: int) -> int:
+        return self.scores[(a - 1) * 60 + b - 1]
+
+    def labels(self, a: int, b: int) -> list:
+        bits = self.relations[(a - 1) * 60 + b - 1]
+        return [name for bit, name, _ in RELATIONS if bits & bit]
+
+
+@lru_cache(maxsize=None)
+def get_tables() -> CompatibilityTables:
+    """プロセス内で1回だけ構築して使い回す。"""
+    return CompatibilityTables()
+
+
+def _day_index(birth_date) -> int:
+    """日干支idx（60日周期の計算だけ。カレンダー表は作らない）。範囲外は ValueError。"""
+    d = _as_date(birth_date)
+    if not RANGE_START <= d <= RANGE_END:
+        raise ValueError(f"対応範囲外の日付です: {d}（{RANGE_START}〜{RANGE_END}）")
+    return day_kanshi_index(d)
+
+
+def compatibility(a_date, b_date) -> dict:
+    """2人の日干支・関係・点数（a から見た向き）。"""
+    t = get_tables()
+    a, b = _day_index(a_date), _day_index(b_date)
+    return {
+        "a_kanshi": kanshi_name(a), "a_index": a,
+        "b_kanshi": kanshi_name(b), "b_index": b,
+        "relations": t.labels(a, b),
+        "score": t.score(a, b),
+    }
+
+
+def _day_indices(dates) -> list:
+    """名簿の日干支idx（batch_diagnosis の列指向APIでまとめて求める）。"""
+    from .batch_diagnosis import diagnose_many
+    # NumPy の uint8 のままだと表の添字 (a - 1) * 60 があふれるので、Python の int にする
+    return diagnose_many(dates)["day_index"].tolist()
+
+
+def iter_top_matches(roster, k: int = 5, min_score: int | None = None):
+    """
+    roster: (id, 生年月日) の並び。1人ずつ (id, [(相手id, 点数, 関係名のタプル), ...]) を返すジェネレータ。
+    相手は点数の高い順、同点は日干支idx・名簿の順。min_score 未満の相手は含めない。
+    日付が読めない・範囲外の人が含まれていれば ValueError。
+    """
+    if k < 1:
+        raise ValueError(f"k は 1 以上です: {k}")
+    roster = list(roster)
+    ids = [r[0] for r in roster]
+    day_idx = _day_indices([r[1] for r in roster])
+
+    buckets = [[] for _ in range(61)]
+    for pos, d in enumerate(day_idx):
+        buckets[d].append(pos)
+
+    t = get_tables()
+    for pos, a in enumerate(day_idx):
+        matches = []
+        for b in t.partner_order[a]:
+            if not buckets[b]:
+                continue
+            sc = t.score(a, b)
+            if min_score is not None and sc < min_score:
+                break
+            labels = tuple(t.labels(a, b))
+            for q in buckets[b]:
+                if q != pos:
+                    matches.append((ids[q], sc, labels))
+                    if len(matches) == k:
+                        break
+            if len(matches) == k:
+                break
+        yield ids[pos], matches
+
+
+def top_matches(roster, k: int = 5, min_score: int | None = None) -> dict:
+    """iter_top_matches の結果を {id: [(相手id, 点数, 関係名のタプル), ...]} にまとめたもの。"""
+    return dict(iter_top_matches(roster, k, min_score))
@@ -0,0 +1,78 @@
+# sanmeigaku_core/data_access.py
+# データモジュールの遅延読み込み。各テーブルは最初にアクセスされたときに1回だけ読み込む。
+# 日干支（JDN計算）だけの経路ではどのテーブルも読まれない。
+#
+#   from data_access import get_risshun_dict
+#   rs = get_risshun_dict().get(year)
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_month_table():
+    """正規化済みの月干支・日干支アンカー表（month_table.MonthTable、データパック経由）。"""
+    from .month_table import _load_default
+    return _load_default()
+
+
+@lru_cache(maxsize=None)
+def get_risshun_dict() -> dict:
+    """{年: 立春日(date)}（データパック経由）。"""
+    from .data_pack import load_pack
+    return load_pack().risshun_dict()
+
+
+@lru_cache(maxsize=None)
+def get_risshun_date(year: int):
+    """year 年の立春日。risshun_dict にある年は表の日付を優先し、無い年は計算値。"""
+    rs = get_risshun_dict().get(year)
+    if rs is not None:
+        return rs
+    from .solar_terms import RISSHUN
+    return get_sekki_dates(year)[RISSHUN]
+
+
+@lru_cache(maxsize=None)
+def get_sekki_dates(year: int) -> tuple:
+    """year 年の24節気（小寒〜冬至）の日本時間の日付。パックに無い年はその場で計算する。"""
+    from .data_pack import load_pack
+    dates = load_pack().sekki_dates(year)
+    if dates is None:
+        from .solar_terms import sekki_dates
+        dates = sekki_dates(year)
+    return dates
+
+
+@lru_cache(maxsize=None)
+def get_messages() -> dict:
+    """天中殺グループ → メッセージ行のリスト。"""
+    from .tenchusatsu_messages import tentyuusatsu_messages
+    return tentyuusatsu_messages
+
+
+@lru_cache(maxsize=None)
+def get_month_kanshi_index_dict() -> dict:
+    """原本の月干支辞書（検証・パック作成用。通常の計算では使わない）。"""
+    from .month_kanshi_index_dict import month_kanshi_index_dict
+    return month_kanshi_index_dict
+
+
+@lru_cache(maxsize=None)
+def get_kanshi_index_table() -> dict:
+    """原本の日干支月数値表（検証・パック作成用。通常の計算では使わない）。"""
+    from .day_kanshi_dict import kanshi_index_table
+    return kanshi_index_table
+
+
+ACCESSORS = {
+    "month_table": get_month_table,
+    "risshun_dict": get_risshun_dict,
+    "messages": get_messages,
+    "month_kanshi_index_dict": get_month_kanshi_index_dict,
+    "kanshi_index_table": get_kanshi_index_table,
+}
+
+
+def loaded() -> list:
+    """このプロセスで既に読み込まれたテーブル名。"""
+    return [name for name, fn in ACCESSORS.items() if fn.cache_info().currsize]
@@ -0,0 +1,265 @@
+# sanmeigaku_core/data_pack.py
+# 干支テーブル（month_kanshi_index_dict / kanshi_index_table / risshun_dict）と
+# solar_terms で計算した節気日付・lunar_calendar で計算した旧暦の月を、小さなバイナリファイルに詰めて mmap でゼロコピーに読む。
+# Python のデータモジュールは「原本」としてだけ使い、原本のハッシュが変わったら自動で作り直す。
+# 起動のたびに原本を読んでハッシュを取らないよう、原本の更新時刻とサイズ（stamp）もパックに入れておき、
+# それが一致すればそのまま使う。違うときだけハッシュを比べ、中身が同じなら stamp だけ書き直す。
+#
+#   python -m sanmeigaku_core.data_pack build   # 明示的に作り直す
+#   python -m sanmeigaku_core.data_pack info    # ヘッダーを表示
+#
+# パックは生成物（.gitignore 済み）。配布・デプロイ先のディレクトリが読み取り専用なら、ビルド時に
+# `python -m sanmeigaku_core.data_pack build` で作っておく（または SANMEIGAKU_PACK で書き込める場所を指す）。
+# 作り直せないとプロセスごとに数秒かけてメモリ上で組み立てることになるので、そのときは RuntimeWarning を出す。
+#
+# ファイル形式（リトルエンディアン）:
+#   header : magic(8) version(u16) base_year(u16) n_years(u16) rs_base(u16) rs_count(u16)
+#            sk_base(u16) sk_count(u16) lu_year(u16) lu_count(u16) lu_first(u32) sha256(32)
+#   stamp  : SOURCE_FILES ごとの (mtime_ns(i64), size(i64))
+#   body   : idx[n] start_day[n] prev_idx[n] day_anchor[n]   (n = n_years*12, 各 uint8)
+#            risshun[rs_count*2]                              (月, 日 の uint8 ペア。0 は未登録)
+#            sekki[sk_count*48]                               (1年24節気ぶんの 月, 日 ペア。小寒〜冬至)
+#            lunar[lu_count]                                  (旧暦の月。lunar_calendar.encode_months の1バイト形式。
+#                                                              最初の月は旧暦 lu_year 年、月初は ordinal lu_first)
+
+import mmap
+import os
+import struct
+import sys
+import warnings
+from datetime import date
+from functools import lru_cache
+
+MAGIC = b"SMGKPACK"
+VERSION = 4
+_HEADER = struct.Struct("<8sHHHHHHHHHI32s")
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCE_FILES = ("month_kanshi_index_dict.py", "day_kanshi_dict.py", "risshun_data.py", "solar_terms.py",
+                "lunar_calendar.py")
+DEFAULT_PATH = os.path.join(_HERE, "kanshi_tables.pack")
+_STAMP = struct.Struct("<%dq" % (2 * len(SOURCE_FILES)))
+
+
+def pack_path() -> str:
+    return os.environ.get("SANMEIGAKU_PACK") or DEFAULT_PATH
+
+
+def source_stamp() -> tuple | None:
+    """原本モジュールの (更新時刻 ns, サイズ) を並べたもの（原本が無い配布形態では None）。読まずに stat だけ。"""
+    stamp = []
+    for name in SOURCE_FILES:
+        try:
+            st = os.stat(os.path.join(_HERE, name))
+        except OSError:
+            return None
+        stamp += (st.st_mtime_ns, st.st_size)
+    return tuple(stamp)
+
+
+def source_hash() -> bytes | None:
+    """原本モジュールと節気の収録年のハッシュ（原本が無い配布形態では None）。"""
+    import hashlib  # stamp が一致する通常の起動では読まない
+    years = sekki_pack_years()
+    h = hashlib.sha256(b"%d:%d-%d" % (VERSION, years.start, years.stop))
+    for name in SOURCE_FILES:
+        try:
+            with open(os.path.join(_HERE, name), "rb") as f:
+                h.update(f.read())
+        except OSError:
+            return None
+    return h.digest()
+
+
+class DataPack:
+    """mmap 上の各セクションを memoryview で公開する（コピーしない）。"""
+
+    __slots__ = ("base_year", "last_year", "idx", "start_day", "prev_idx", "day_anchor",
+                 "rs_base", "_risshun", "sk_base", "_sekki", "lu_year", "lu_first", "_lunar", "digest", "stamp",
+                 "_buf")
+
+    def __init__(self, buf):
+        if len(buf) < _HEADER.size + _STAMP.size:
+            raise ValueError("データパックのサイズが不正です")
+        (magic, version, base, n_years, rs_base, rs_count, sk_base, sk_count,
+         lu_year, lu_count, lu_first, digest) = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("データパックの形式が違います")
+        n = n_years * 12
+        if len(buf) != _HEADER.size + _STAMP.size + n * 4 + rs_count * 2 + sk_count * 48 + lu_count:
+            raise ValueError("データパックのサイズが不正です")
+        mv = memoryview(buf)
+        self.stamp = _STAMP.unpack_from(buf, _HEADER.size)
+        o = _HEADER.size + _STAMP.size
+        self.idx = mv[o:o + n]
+        self.start_day = mv[o + n:o + 2 * n]
+        self.prev_idx = mv[o + 2 * n:o + 3 * n]
+        self.day_anchor = mv[o + 3 * n:o + 4 * n]
+        o += 4 * n
+        self._risshun = mv[o:o + rs_count * 2]
+        o += rs_count * 2
+        self._sekki = mv[o:o + sk_count * 48]
+        o += sk_count * 48
+        self._lunar = mv[o:o + lu_count]
+        self.lu_year, self.lu_first = lu_year, lu_first
+        self.base_year, self.last_year = base, base + n_years - 1
+        self.rs_base = rs_base
+        self.sk_base = sk_base
+        self.digest = digest
+        self._buf = buf
+
+    def risshun_dict(self) -> dict:
+        """{年: 立春日(date)}（risshun_data.risshun_dict と同じ形）"""
+        rs = self._risshun
+        return {
+            self.rs_base + i: date(self.rs_base + i, rs[2 * i], rs[2 * i + 1])
+            for i in range(len(rs) // 2) if rs[2 * i]
+        }
+
+    def sekki_years(self) -> range:
+        return range(self.sk_base, self.sk_base + len(self._sekki) // 48)
+
+    def sekki_dates(self, year: int):
+        """year 年の24節気の日付（solar_terms.sekki_dates と同じ並び）。パックに無い年は None。"""
+        i = year - self.sk_base
+        if not 0 <= i < len(self._sekki) // 48:
+            return None
+        sk = self._sekki[i * 48:(i + 1) * 48]
+        return tuple(date(year, sk[2 * k], sk[2 * k + 1]) for k in range(24))
+
+    def lunar_months(self):
+        """(最初の月の旧暦年, 最初の月の月初の ordinal, 1か月1バイトの memoryview)。lunar_calendar.LunarTable の引数。"""
+        return self.lu_year, self.lu_first, self._lunar
+
+
+def sekki_pack_years() -> range:
+    """パックに入れる節気の年（対応範囲の全年。開始年の前年の大雪から参照するので1年前から）。"""
+    from .kanshi_core import RANGE_START, RANGE_END
+    return range(RANGE_START.year - 1, RANGE_END.year + 1)
+
+
+def build_pack_bytes(digest: bytes | None = None, stamp: tuple | None = None) -> bytes:
+    """原本モジュールを読み込み、節気を計算してパックのバイト列を作る。"""
+    from .month_table import load_month_table
+    from .month_kanshi_index_dict import month_kanshi_index_dict
+    from .day_kanshi_dict import kanshi_index_table
+    from .risshun_data import risshun_dict
+    from .solar_terms import sekki_table
+    from .lunar_calendar import compute_months, encode_months, lunar_years
+
+    t = load_month_table(month_kanshi_index_dict, kanshi_index_table)
+    n_years = t.last_year - t.base_year + 1
+    rs_base, rs_last = min(risshun_dict), max(risshun_dict)
+    rs = bytearray((rs_last - rs_base + 1) * 2)
+    for y, d in risshun_dict.items():
+        rs[2 * (y - rs_base)], rs[2 * (y - rs_base) + 1] = d.month, d.day
+
+    sk_years = sekki_pack_years()
+    sk = bytearray()
+    for y, dates in sorted(sekki_table(sk_years).items()):
+        for d in dates:
+            sk += bytes((d.month, d.day))
+
+    lu_years = lunar_years()
+    months, end = compute_months(lu_years.start, lu_years.stop - 1)
+    lu = encode_months(months, end)
+
+    header = _HEADER.pack(MAGIC, VERSION, t.base_year, n_years, rs_base, len(rs) // 2,
+                          sk_years.start, len(sk_years), months[0][0], len(lu), months[0][3],
+                          digest or source_hash() or bytes(32))
+    stamp = _STAMP.pack(*(stamp or source_stamp() or (0,) * (_STAMP.size // 8)))
+    return b"".join((header, stamp, t.idx.tobytes(), t.start_day.tobytes(), t.prev_idx.tobytes(),
+                     t.day_anchor.tobytes(), bytes(rs), bytes(sk), lu))
+
+
+def _write_atomic(path: str, data: bytes) -> str:
+    """一時ファイルに書いてから置き換える。失敗したら一時ファイルは消す（壊れたファイルも残さない）。"""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    finally:
+        try:
+            os.unlink(tmp)  # 置き換えに成功していれば既に無い
+        except OSError:
+            pass
+    return path
+
+
+def write_pack(path: str | None = None) -> str:
+    """パックを作って原子的に書き込む（途中で落ちても壊れたファイルを残さない）。"""
+    return _write_atomic(path or pack_path(), build_pack_bytes())
+
+
+def _restamp(path: str, pack: DataPack, stamp: tuple):
+    """中身はそのままで stamp だけ書き直す（書き込めなければ何もしない。次の起動でまたハッシュを比べる）。"""
+    data = bytearray(pack._buf)
+    _STAMP.pack_into(data, _HEADER.size, *stamp)
+    try:
+        _write_atomic(path, bytes(data))
+    except OSError:
+        pass
+
+
+def _open_mmap(path: str):
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+@lru_cache(maxsize=None)
+def load_pack() -> DataPack:
+    """
+    パックを mmap で開く。原本の stamp（更新時刻・サイズ）が一致すればハッシュを取らずにそのまま使う。
+    stamp が違えばハッシュを比べ、同じなら stamp だけ更新、違う・無い・版が違う場合は作り直す。
+    書き込めない環境ではメモリ上で組み立てたものを使う。
+    """
+    path = pack_path()
+    stamp = source_stamp()
+    digest = None
+    try:
+        pack = DataPack(_open_mmap(path))
+        if stamp is None or (pack.stamp == stamp and pack.sekki_years() == sekki_pack_years()):
+            return pack
+        digest = source_hash()
+        if pack.digest == digest:  # checkout などで更新時刻だけ変わった
+            _restamp(path, pack, stamp)
+            return pack
+    except (OSError, ValueError, struct.error):
+        pass
+    try:
+        return DataPack(_open_mmap(write_pack(path)))
+    except OSError as e:
+        warnings.warn(
+            f"データパックを書き込めないため、メモリ上で組み立てます（プロセスごとに数秒かかります）: {e}。"
+            f"ビルド時に `python -m sanmeigaku_core.data_pack build` で作っておくか、SANMEIGAKU_PACK で書き込める場所を指してください",
+            RuntimeWarning, stacklevel=2,
+        )
+        return DataPack(build_pack_bytes(digest, stamp))
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    cmd = argv[0] if argv else "info"
+    if cmd == "build":
+        print(write_pack())
+        return 0
+    if cmd == "info":
+        p = load_pack()
+        print(f"path      : {pack_path()}")
+        print(f"months    : {p.base_year}-01 .. {p.last_year}-12")
+        rs = p.risshun_dict()
+        print(f"risshun   : {min(rs)} .. {max(rs)} ({len(rs)} years)")
+        sk = p.sekki_years()
+        print(f"sekki     : {sk.start} .. {sk.stop - 1} ({len(sk)} years)")
+        from .lunar_calendar import LunarTable
+        lu = LunarTable(*p.lunar_months())
+        print(f"lunar     : {lu.start} .. {lu.end} ({len(lu.keys)} months)")
+        print(f"sha256    : {p.digest.hex()}")
+        return 0
+    print("usage: python -m sanmeigaku_core.data_pack [build|info]", file=sys.stderr)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+# sanmeigaku_core/date_parser.py
+# 生年月日の文字列 → date。CSV の自由入力（全角数字・空白・和暦の混在）を1本の正規表現で読む。
+#
+#   parse_date("1985-02-03") / parse_date("1985/2/3") / parse_date("1985.02.03") / parse_date("19850203")
+#   parse_date("1985年2月3日") / parse_date("昭和60年2月3日") / parse_date("S60.2.3") / parse_date("令和元年5月1日")
+#   parse_date("旧暦1985年1月1日") / parse_date("旧2023年閏2月1日")   # 旧暦は lunar_calendar で新暦に直す
+#   dates, errors = parse_many(rows)   # 読めない行は dates[i] が None、errors[i] に理由（例外は出さない）
+#
+# 和暦は明治〜令和。元号の期間外（昭和64年2月1日、平成31年5月1日 など）は ValueError。
+# 旧暦の和暦（旧暦明治5年12月2日）は、新暦に直した日付が元号の期間内かどうかで判定する。
+# 同じ文字列は何度も出てくる（顧客名簿の生年月日）ので、結果を lru_cache で覚えておく。
+
+import re
+from datetime import date, datetime
+from functools import lru_cache
+
+# (元号, 略号, 開始日)。次の元号の開始日の前日までがその元号
+ERAS = (
+    ("明治", "M", date(1868, 10, 23)),
+    ("大正", "T", date(1912, 7, 30)),
+    ("昭和", "S", date(1926, 12, 25)),
+    ("平成", "H", date(1989, 1, 8)),
+    ("令和", "R", date(2019, 5, 1)),
+)
+# 元号名・略号 → (元号, 開始日, 次の元号の開始日 or None)
+_ERA_BY_NAME = {
+    key: (name, start, nxt)
+    for (name, abbr, start), nxt in zip(ERAS, [e[2] for e in ERAS[1:]] + [None])
+    for key in (name, abbr, abbr.lower())
+}
+
+# 全角の記号・英字と、ハイフンに見える文字を半角にそろえる（全角数字は \d がそのまま読むので、
+# そろえるのは1回目の照合で読めなかったときだけ）
+_NORMALIZE = str.maketrans(
+    "０１２３４５６７８９" "／．－：　" "ー―‐−" "ＭＴＳＨＲ" "ｍｔｓｈｒ",
+    "0123456789" "/.-: " "----" "MTSHR" "MTSHR",
+)
+
+_DATE_RE = re.compile(r"""
+    (?P<lunar>旧暦?)? \s*
+    (?:
+        (?:
+            (?P<era>明治|大正|昭和|平成|令和|[MTSHRmtshr]) \s* (?P<ey>元|\d{1,2})
+          | (?P<y>\d{4})
+        )
+        \s* [-/.年] \s* (?P<leap>閏)? \s* (?P<m>\d{1,2}) \s* [-/.月] \s* (?P<d>\d{1,2}) \s* 日?
+      | (?P<cy>\d{4}) (?P<cm>\d{2}) (?P<cd>\d{2})                  # 19850203
+    )
+    (?: (?:\s+|T) \d{1,2}:\d{2} (?::\d{2} (?:\.\d+)?)? (?:Z|[+-]\d{2}:?\d{2})? )?  # 時刻は読み捨てる
+""", re.X)
+
+
+@lru_cache(maxsize=4096)
+def _parse(text: str):
+    """date か、読めなかった理由（str）を返す。例外を覚えられないので理由は戻り値で返す。"""
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":  # いちばん多い YYYY-MM-DD は C 実装で
+        try:
+            return date.fromisoformat(text)
+        except ValueError:
+            pass
+    s = text.strip()
+    m = _DATE_RE.fullmatch(s)
+    if m is None and not s.isascii():
+        s = s.translate(_NORMALIZE).strip()
+        m = _DATE_RE.fullmatch(s)
+    if m is None:
+        try:  # 正規表現に無い ISO 形式（週番号など）
+            return datetime.fromisoformat(s).date()
+        except ValueError:
+            return f"日付として読めません: {text!r}"
+
+    lunar, era, ey, y, leap, mo, d, cy, cm, cd = m.groups()
+    if cy:
+        y, mo, d = cy, cm, cd
+    elif era:
+        name, start, nxt = _ERA_BY_NAME[era]
+        ey = 1 if ey == "元" else int(ey)
+        if ey < 1:
+            return f"{name}{ey}年はありません: {text!r}"
+        y = start.year + ey - 1
+    if lunar:
+        from .lunar_calendar import lunar_to_solar
+        try:
+            result = lunar_to_solar(int(y), int(mo), int(d), bool(leap))
+        except ValueError as e:
+            return f"{e}: {text!r}"
+    elif leap:
+        return f"閏月は旧暦の日付にだけあります: {text!r}"
+    else:
+        try:
+            result = date(int(y), int(mo), int(d))
+        except ValueError:
+            return f"存在しない日付です: {text!r}"
+    if era and (result < start or (nxt is not None and result >= nxt)):
+        last = date.fromordinal(nxt.toordinal() - 1) if nxt is not None else ""
+        return f"{name}の期間外です: {text!r}（{start}〜{last}）"
+    return result
+
+
+def parse_date(text: str) -> date:
+    """文字列1件を date に。読めない・存在しない日付・元号の期間外は ValueError。"""
+    r = _parse(text)
+    if type(r) is str:
+        raise ValueError(r)
+    return r
+
+
+def parse_many(values):
+    """
+    まとめて date にする。戻り値は (dates, errors) で、どちらも values と同じ長さの list。
+    読めた行は dates[i] が date・errors[i] が None、読めない行は dates[i] が None・errors[i] に理由。
+    str 以外（date、datetime、pandas.Timestamp など）は kanshi_core._as_date と同じ扱い。
+    """
+    from .kanshi_core import _as_date
+    parse = _parse
+    dates, errors = [], []
+    for v in values:
+        if type(v) is str:
+            r = parse(v)
+            if type(r) is str:
+                dates.append(None)
+                errors.append(r)
+                continue
+        elif type(v) is date:
+            r = v
+        else:
+            try:
+                r = _as_date(v)
+            except (TypeError, ValueError) as e:
+                dates.append(None)
+                errors.append(str(e))
+                continue
+        dates.append(r)
+        errors.append(None)
+    return dates, errors
@@ -0,0 +1,283 @@
+# sanmeigaku_core/kanshi_core.py
+# 干支・天中殺の計算ロジック（UIなし）。tentyuusatsu_app.py から切り出したもの。
+# 年干支：立春基準（risshun_dict に無い年は計算した立春）
+# 月干支：節入り基準（sekki_index の節入り日で bisect）。旧来の固定辞書A方式は get_month_kanshi_from_table
+# 日干支：1900-02-20(甲子)アンカーの60日周期（JDN）
+# 年・月・日とも計算で求めるので、固定テーブルの収録範囲（TABLE_START〜TABLE_END）の外でも使える。
+#
+# (干支名, index, debug) を返す関数は、debug（どの分岐で決めたか等）を trace=True か
+# 環境変数 SANMEIGAKU_TRACE=1 のときだけ作り、既定では None を返す。idx だけ欲しいバッチ・API は
+# get_year_kanshi_index・month_kanshi_index・day_kanshi_index（int を返すだけの速い版）を使う。
+# 計測（SANMEIGAKU_METRICS=1）中は、月干支の決め方（rule_total）を数えるために @instrument(rules=True) が
+# trace=True で呼ぶ（呼び出し側への戻り値は変わらない）。
+
+import os
+from datetime import datetime, date
+
+# テーブルは最初に使うときに読む（日干支だけならどれも読まない）
+from .data_access import get_month_table, get_risshun_date, get_risshun_dict
+# 六十干支のメタデータ（干支名・十二支・天中殺グループ）は kanshi_type の配列を引く
+from .kanshi_type import NAMES, BRANCHES, GROUP, TENCHUSATSU_GROUPS
+# 呼び出し回数・所要時間の計測（SANMEIGAKU_METRICS=1 のときだけ。無効なら関数はそのまま）
+from .metrics import instrument
+
+# 対応範囲（節気を計算で求める範囲。節気の日付はデータパックにキャッシュされる）
+RANGE_START = date(1600, 1, 1)
+RANGE_END = date(2200, 12, 31)
+
+# 固定テーブル（立春・月干支・日干支月数値）の収録範囲。範囲内では立春だけ表の日付を優先し、
+# 月干支・日干支の表は検証用（get_month_kanshi_from_table など）にだけ使う
+TABLE_START = date(1900, 1, 1)
+TABLE_END = date(2033, 12, 31)
+
+# debug を既定で作るか（関数ごとに trace= で上書きできる）
+TRACE = os.environ.get("SANMEIGAKU_TRACE", "").lower() in ("1", "true", "yes", "on")
+
+# ---------------- 干支テーブル（1..60） ----------------
+# 配列名は既存互換のため kanshi_list も KANSHI も用意（同一オブジェクト。0 は未使用の ""）
+kanshi_list = list(NAMES)
+KANSHI = kanshi_list  # 互換
+
+# ---------------- 共通ユーティリティ ----------------
+def _wrap_1_60(n: int) -> int:
+    return ((int(n) - 1) % 60) + 1
+
+def _kanshi_name(idx):
+    try:
+        i = int(idx)
+    except Exception:
+        return "該当なし"
+    return NAMES[i] if 1 <= i <= 60 else "該当なし"
+
+# どちらの呼称でも動くように
+kanshi_name = _kanshi_name
+
+# 文字列の日付は date_parser で読む（re を使うので、最初に文字列が来たときに読み込む）
+_parse_date = None
+
+def _get_parse_date():
+    global _parse_date
+    if _parse_date is None:
+        from .date_parser import parse_date
+        _parse_date = parse_date
+    return _parse_date
+
+def _as_date(x) -> date:
+    """date_inputの戻り、str（和暦も）、datetime、pandas.Timestampなどをdateへ正規化"""
+    if isinstance(x, date) and not isinstance(x, datetime):
+        return x
+    if isinstance(x, datetime):
+        return x.date()
+    if isinstance(x, str):
+        return (_parse_date or _get_parse_date())(x)
+    if hasattr(x, "year") and hasattr(x, "month") and hasattr(x, "day"):
+        return date(int(getattr(x, "year")), int(getattr(x, "month")), int(getattr(x, "day")))
+    raise TypeError(f"date型に変換できません: {type(x)}")
+
+# ---------------- 年干支（立春基準） ----------------
+def get_year_kanshi_index(birth_date) -> int:
+    d = birth_date if type(birth_date) is date else _as_date(birth_date)
+    y = d.year
+    rs = get_risshun_date(y)
+    if rs and d < rs:
+        y -= 1
+    return _wrap_1_60((y - 1984) % 60 + 1)  # 1984=甲子
+
+@instrument()
+def get_year_kanshi(birth_date) -> str:
+    return kanshi_list[get_year_kanshi_index(birth_date)]
+
+# ---------------- 年支（立春基準）と年支による天中殺（sanmeigaku.py の簡易版） ----------------
+ETO = BRANCHES
+_TENCHUSATSU_BY_ETO = {
+    "子": "午未", "丑": "午未",
+    "寅": "申酉", "卯": "申酉",
+    "辰": "戌亥", "巳": "戌亥",
+    "午": "子丑", "未": "子丑",
+    "申": "寅卯", "酉": "寅卯",
+    "戌": "辰巳", "亥": "辰巳",
+}
+
+def get_year_eto(birth_date) -> str:
+    """年支（"子"〜"亥"）。立春前は前年。"""
+    return ETO[(get_year_kanshi_index(birth_date) - 1) % 12]
+
+def tenchusatsu_from_eto(eto: str) -> str:
+    """年支から天中殺グループ（簡易版の対応表）。不明な支は空文字。"""
+    return _TENCHUSATSU_BY_ETO.get(eto, "")
+
+# --- 月干支テーブル読み取り（正規化済みの月テーブルを引くだけ） ---
+def _read_month_entry(y: int, m: int):
+    """
+    (y,m) の (this_idx, start_day, prev_idx) を返す。無い項目は None。
+    キー形・値形の揺れや 0→60 の丸めは month_table で import 時に済ませてある。
+    """
+    return get_month_table().entry(y, m)
+
+# 前月キー
+def _prev_y_m(y: int, m: int):
+    return (y - 1, 12) if m == 1 else (y, m - 1)
+
+# ---------------- 月干支：節入り基準 ----------------
+# 節入りの索引は最初に月干支を引いたときに作る（日干支だけなら sekki_index も節気の計算も読まない）
+_sekki_index = None
+
+def _get_sekki_index():
+    global _sekki_index
+    if _sekki_index is None:
+        from .sekki_index import get_sekki_index
+        _sekki_index = get_sekki_index()
+    return _sekki_index
+
+def month_kanshi_index(birth_date) -> int:
+    """節入り基準の月干支idx（1..60）だけを返す。範囲外の日付は ValueError。"""
+    return (_sekki_index or _get_sekki_index()).month_index(birth_date)
+
+@instrument(rules=True)
+def get_month_kanshi(birth_date, trace: bool | None = None):
+    """
+    二十四節気の「節」（立春・啓蟄・…・小寒）で切り替わる月干支。
+    戻り値: (干支名, index, debug)。debug（節の名前・節入り日・節入りからの日数）は trace のときだけ、それ以外は None。
+    範囲外の日付は ValueError。
+    """
+    if trace or (trace is None and TRACE):
+        from .sekki_index import get_month_kanshi_by_sekki
+        return get_month_kanshi_by_sekki(birth_date, trace=True)
+    idx = (_sekki_index or _get_sekki_index()).month_index(birth_date)
+    return NAMES[idx], idx, None
+
+# ---------------- 月干支：固定辞書A方式（旧方式・検証用） ----------------
+@instrument(rules=True)
+def get_month_kanshi_from_table(birth_date, trace: bool | None = None):
+    """
+    二十四節気：各月の start_day（節入り）で切り替え。
+    - 当月 (y,m) のエントリに start_day があれば、
+        d >= start_day で this_idx、d < start_day で prev_idx（無ければ前月idx）。
+    - start_day が無い月は、
+        2月のみ立春（risshun_dict）で切替、それ以外は this_idx をそのまま採用。
+    - idx/prev_idx は 0→60、文字列→int に丸める。
+    debug（{"hit": 引いた (年, 月), "rule": 分岐}）は trace のときだけ、それ以外は None。
+    """
+    d = _as_date(birth_date)
+    y, m, day = d.year, d.month, d.day
+
+    this_idx, start_day, prev_idx = _read_month_entry(y, m)
+    # 分岐ごとに (採用した idx, 引いた年月, rule) を決め、debug は最後に trace のときだけ作る
+    idx, hy, hm, rule = None, y, m, None
+
+    # 1) start_day が定義されている月（推奨データ）
+    if start_day is not None:
+        if day >= start_day:
+            if this_idx:
+                idx, rule = this_idx, "start_day≥{}"
+        elif prev_idx:
+            idx, rule = prev_idx, "before start_day({})"
+        else:
+            # prev_idx 未設定 → 前月の this_idx を参照
+            py, pm = _prev_y_m(y, m)
+            p_idx, _, _ = _read_month_entry(py, pm)
+            if p_idx:
+                idx, hy, hm, rule = p_idx, py, pm, "fallback prev month"
+            # さらに無ければ this_idx を保険採用
+            elif this_idx:
+                idx, rule = this_idx, "fallback this_idx"
+
+    # 2) start_day が無い月
+    if not idx and this_idx:
+        idx, rule = this_idx, "no start_day"
+        if m == 2:
+            # 2月だけは立春基準で前後を分ける
+            rs = get_risshun_dict().get(y)
+            if rs and d < rs:
+                p_idx, _, _ = _read_month_entry(y - 1, 12)
+                if p_idx:
+                    idx, hy, hm, rule = p_idx, y - 1, 12, "risshun prev-month"
+
+    # 3) データ未整備 → day_kanshi_dict で前月推定の保険（任意）
+    #    前月のエントリがあればその idx を返す（ここで day_kanshi_dict を使う必然は薄いが温存）
+    if not idx:
+        hy, hm = _prev_y_m(y, m)
+        idx, _, _ = _read_month_entry(hy, hm)
+        rule = "no data: use prev"
+
+    if not idx:
+        if trace or (trace is None and TRACE):
+            return "該当なし", None, {"hit": None, "rule": "no data"}
+        return "該当なし", None, None
+    idx = ((idx - 1) % 60) + 1
+    if trace or (trace is None and TRACE):
+        return NAMES[idx], idx, {"hit": (hy, hm), "rule": rule.format(start_day)}
+    return NAMES[idx], idx, None
+
+# ---------------- 日干支：固定表A方式 ----------------
+def _day_anchor_from_table(year: int, month: int):
+    """kanshi_index_table の '月数値'(1..60, 0は60扱い) を取得。"""
+    return get_month_table().anchor(year, month)
+
+def _prev_month(y: int, m: int):
+    return (y - 1, 12) if m == 1 else (y, m - 1)
+
+def _read_month_idx_by_key(y: int, m: int):
+    """month_kanshi_index_dict から (y,m) の index を 1..60 で取得。0→60, 文字列→int。"""
+    return get_month_table().month_index(y, m)
+
+def get_prev_calendar_month_kanshi(birth_date):
+    """
+    暦月ベースの『前月』の月干支（注意表示用）。
+    例）8/3 → (年, 7) をそのまま引く。1月は (年-1, 12)。
+    """
+    d = _as_date(birth_date)
+    y, m = (d.year - 1, 12) if d.month == 1 else (d.year, d.month - 1)
+    idx = _read_month_idx_by_key(y, m)
+    return (kanshi_name(idx), idx, {"key": (y, m)}) if idx else ("該当なし", None, {"key": (y, m)})
+
+
+# ================= 日干支：1900-02-20(甲子)アンカーの60日周期 =================
+
+def _jdn_ymd(y: int, m: int, d: int) -> int:
+    """ユリウス通日（Fliegel–Van Flandern）。日付だけ使うのでタイムゾーンの影響なし。"""
+    a = (14 - m) // 12
+    yy = y + 4800 - a
+    mm = m + 12 * a - 3
+    return d + (153 * mm + 2) // 5 + 365 * yy + yy // 4 - yy // 100 + yy // 400 - 32045
+
+# 甲子の日（ordinal の差は JDN の差と同じ）
+_DAY_ANCHOR_ORD = date(1900, 2, 20).toordinal()
+_JDN_ANCHOR = _jdn_ymd(1900, 2, 20)
+
+def day_kanshi_index(birth_date) -> int:
+    """日干支idx（1..60）だけを返す。日付の範囲は問わない。"""
+    d = birth_date if type(birth_date) is date else _as_date(birth_date)
+    return (d.toordinal() - _DAY_ANCHOR_ORD) % 60 + 1
+
+@instrument()
+def get_day_kanshi_from_table(birth_date, trace: bool | None = None):
+    """
+    固定表は使わず、1900-02-20 を 甲子(=index 1) として 60日周期で計算。
+    ・閏年/各月の日数に依存せず、常にズレない。
+    ・戻り値の形は既存どおり (干支名, index, debug)。debug（JDN など）は trace のときだけ、それ以外は None。
+    """
+    d = birth_date if type(birth_date) is date else _as_date(birth_date)
+    idx = (d.toordinal() - _DAY_ANCHOR_ORD) % 60 + 1  # 1..60
+    if not (trace or (trace is None and TRACE)):
+        return NAMES[idx], idx, None
+    jdn = _jdn_ymd(d.year, d.month, d.day)
+    jdn_ref = _JDN_ANCHOR  # 甲子
+    return NAMES[idx], idx, {
+        "method": "JDN60",
+        "anchor": "1900-02-20(甲子)",
+        "jdn": jdn,
+        "delta_days": jdn - jdn_ref,
+    }
+
+# UI がこの名前で呼んでいる場合に合わせたラッパー（既存どおり）
+def get_day_kanshi(birth_date, trace: bool | None = None):
+    return get_day_kanshi_from_table(birth_date, trace)
+
+# ---------------- 天中殺グループ（6区分） ----------------
+def tenchusatsu_from_index(idx: int | None) -> str:
+    if idx is None:
+        return "該当なし"
+    if 1 <= idx <= 60:
+        return TENCHUSATSU_GROUPS[GROUP[idx]]
+    return "不明"
@@ -0,0 +1,119 @@
+# sanmeigaku_core/kanshi_type.py
+# 六十干支（1..60、1=甲子）のメタデータを1か所にまとめたもの。
+# 干支名・十干・十二支・五行・陰陽・天中殺グループを「添字=干支idx」の配列（struct-of-arrays）で持ち、
+# どれも配列を1回引くだけで求まる。Kanshi は int のサブクラス（不変・60個だけ）で、属性としても引ける。
+#
+#   from kanshi_type import Kanshi, NAMES, GROUP, TENCHUSATSU_GROUPS
+#   k = Kanshi(54)            # Kanshi("丁巳") でも同じオブジェクト
+#   k.name, k.stem_name, k.branch_name, k.gogyo, k.yin_yang, k.tenchusatsu
+#   str(k), f"{k}"            # "丁巳"（int(k) は 54）
+#   TENCHUSATSU_GROUPS[GROUP[54]]   # 属性を使わずに配列で引くこともできる
+
+from array import array
+
+STEMS = ("甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸")
+BRANCHES = ("子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥")
+GOGYO = ("木", "火", "土", "金", "水")
+YIN_YANG = ("陽", "陰")
+# (干支idx-1)//10 の順（甲子〜癸酉が戌亥、…、甲寅〜癸亥が子丑）
+TENCHUSATSU_GROUPS = ("戌亥", "申酉", "午未", "辰巳", "寅卯", "子丑")
+
+# 十干・十二支 → 五行（GOGYO の添字）
+STEM_GOGYO = (0, 0, 1, 1, 2, 2, 3, 3, 4, 4)
+BRANCH_GOGYO = (4, 2, 0, 0, 2, 1, 1, 2, 3, 3, 2, 4)
+
+# 添字 = 干支idx（0 は未使用）
+NAMES = ("",) + tuple(STEMS[i % 10] + BRANCHES[i % 12] for i in range(60))
+STEM = array("B", [0] + [i % 10 for i in range(60)])
+BRANCH = array("B", [0] + [i % 12 for i in range(60)])
+GROUP = array("B", [0] + [i // 10 for i in range(60)])
+
+_BY_NAME = {name: i for i, name in enumerate(NAMES) if name}
+
+
+class Kanshi(int):
+    """
+    六十干支の1つ（int としての値は干支idx 1..60）。Kanshi(54) / Kanshi("丁巳") は同じオブジェクトを返す。
+    範囲外の idx・不明な干支名は ValueError。
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, value):
+        if isinstance(value, Kanshi):
+            return value
+        if isinstance(value, str):
+            i = _BY_NAME.get(value.strip())
+            if i is None:
+                raise ValueError(f"干支名が不明です: {value}")
+        else:
+            i = int(value)
+            if not 1 <= i <= 60:
+                raise ValueError(f"干支idxは 1..60 です: {value}")
+        return _MEMBERS[i]
+
+    def __repr__(self):
+        return f"Kanshi({int(self)}, {NAMES[self]!r})"
+
+    # str()・f-string・ログでは干支名（"丁巳"）。数値が欲しいときは int(k)（JSON では int のまま 54）
+    def __str__(self):
+        return NAMES[self]
+
+    def __format__(self, spec):
+        return format(NAMES[self], spec)
+
+    def __reduce__(self):
+        return (Kanshi, (int(self),))
+
+    @property
+    def index(self) -> int:
+        return int(self)
+
+    @property
+    def name(self) -> str:
+        return NAMES[self]
+
+    @property
+    def stem(self) -> int:
+        """十干コード（STEMS の添字、0=甲）。"""
+        return STEM[self]
+
+    @property
+    def branch(self) -> int:
+        """十二支コード（BRANCHES の添字、0=子）。"""
+        return BRANCH[self]
+
+    @property
+    def stem_name(self) -> str:
+        return STEMS[STEM[self]]
+
+    @property
+    def branch_name(self) -> str:
+        return BRANCHES[BRANCH[self]]
+
+    @property
+    def gogyo(self) -> str:
+        """十干の五行。"""
+        return GOGYO[STEM_GOGYO[STEM[self]]]
+
+    @property
+    def branch_gogyo(self) -> str:
+        """十二支の五行。"""
+        return GOGYO[BRANCH_GOGYO[BRANCH[self]]]
+
+    @property
+    def yin_yang(self) -> str:
+        return YIN_YANG[STEM[self] & 1]
+
+    @property
+    def group(self) -> int:
+        """天中殺グループコード（TENCHUSATSU_GROUPS の添字）。"""
+        return GROUP[self]
+
+    @property
+    def tenchusatsu(self) -> str:
+        return TENCHUSATSU_GROUPS[GROUP[self]]
+
+
+_MEMBERS = (None,) + tuple(int.__new__(Kanshi, i) for i in range(1, 61))
+ALL = _MEMBERS[1:]
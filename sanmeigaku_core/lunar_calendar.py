@@ -0,0 +1,216 @@
+# sanmeigaku_core/lunar_calendar.py
+# 旧暦（太陰太陽暦）⇔ 新暦の変換。旧暦の月の表（月初の ordinal と 年・月・閏）を対応範囲の全期間ぶん
+# 1回だけ作っておき、変換は bisect と足し算だけで済ませる。表はデータパック（data_pack）に入る。
+#
+#   from lunar_calendar import lunar_to_solar, solar_to_lunar
+#   lunar_to_solar(1985, 1, 1)               # 旧暦1985年1月1日 → date(1985, 2, 20)
+#   lunar_to_solar(2023, 2, 1, leap=True)    # 旧暦2023年閏2月1日 → date(2023, 3, 22)
+#   solar_to_lunar(date(2023, 3, 22))        # (2023, 2, 1, True)
+#
+# 月の決め方:
+#   朔（新月）の瞬間は Meeus『Astronomical Algorithms』49章の式（平均朔 + 周期項 + 惑星項）、
+#   中気（大寒・雨水・…・冬至）は solar_terms の節気。どちらも日本時間の日付で比べる。
+#   冬至を含む月を11月とし、冬至から次の冬至までに月が13個あれば、11月の後で最初の
+#   中気を含まない月を閏月にする（前の月と同じ番号）。2033年は閏11月になる。
+
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from functools import lru_cache
+
+from .kanshi_core import RANGE_START, RANGE_END, _as_date
+
+_SYNODIC_MONTH = 29.530588861
+_K0_ORD = date(2000, 1, 6).toordinal()  # k=0 の朔の日
+
+# ---------------- 朔の瞬間（Meeus 49章） ----------------
+# 周期項 (係数, E の次数, M の倍数, M' の倍数, F の倍数)
+_NEW_MOON_TERMS = (
+    (-0.40720, 0, 0, 1, 0), (0.17241, 1, 1, 0, 0), (0.01608, 0, 0, 2, 0),
+    (0.01039, 0, 0, 0, 2), (0.00739, 1, -1, 1, 0), (-0.00514, 1, 1, 1, 0),
+    (0.00208, 2, 2, 0, 0), (-0.00111, 0, 0, 1, -2), (-0.00057, 0, 0, 1, 2),
+    (0.00056, 1, 1, 2, 0), (-0.00042, 0, 0, 3, 0), (0.00042, 1, 1, 0, 2),
+    (0.00038, 1, 1, 0, -2), (-0.00024, 1, -1, 2, 0), (-0.00007, 0, 2, 1, 0),
+    (0.00004, 0, 0, 2, -2), (0.00004, 0, 3, 0, 0), (0.00003, 0, 1, 1, -2),
+    (0.00003, 0, 0, 2, 2), (-0.00003, 0, 1, 1, 2), (0.00003, 0, -1, 1, 2),
+    (-0.00002, 0, -1, 1, -2), (-0.00002, 0, 1, 3, 0), (0.00002, 0, 0, 4, 0),
+)
+# 惑星による補正 (係数, A の定数, k の係数)。A1 だけ T² の項がある
+_PLANETARY_TERMS = (
+    (0.000325, 299.77, 0.107408), (0.000165, 251.88, 0.016321), (0.000164, 251.83, 26.651886),
+    (0.000126, 349.42, 36.412478), (0.000110, 84.66, 18.206239), (0.000062, 141.74, 53.303771),
+    (0.000060, 207.14, 2.453732), (0.000056, 154.84, 7.306860), (0.000047, 34.52, 27.261239),
+    (0.000042, 207.19, 0.121824), (0.000040, 291.34, 1.844379), (0.000037, 161.72, 24.198154),
+    (0.000035, 239.56, 25.513099), (0.000023, 331.55, 3.592518),
+)
+
+
+def new_moon_jde(k: int) -> float:
+    """k 番目の朔の瞬間（TT のユリウス日）。k=0 は 2000-01-06 の朔。"""
+    t = k / 1236.85
+    t2, t3, t4 = t * t, t * t * t, t * t * t * t
+    jde = 2451550.09766 + _SYNODIC_MONTH * k + 0.00015437 * t2 - 0.000000150 * t3 + 0.00000000073 * t4
+    e = 1 - 0.002516 * t - 0.0000074 * t2
+    m = math.radians(2.5534 + 29.10535670 * k - 0.0000014 * t2 - 0.00000011 * t3)
+    mp = math.radians(201.5643 + 385.81693528 * k + 0.0107582 * t2 + 0.00001238 * t3 - 0.000000058 * t4)
+    f = math.radians(160.7108 + 390.67050284 * k - 0.0016118 * t2 - 0.00000227 * t3 + 0.000000011 * t4)
+    omega = math.radians(124.7746 - 1.56375588 * k + 0.0020672 * t2 + 0.00000215 * t3)
+
+    jde += -0.00017 * math.sin(omega)
+    for c, ep, cm, cmp, cf in _NEW_MOON_TERMS:
+        jde += c * e ** ep * math.sin(cm * m + cmp * mp + cf * f)
+    for i, (c, a0, ak) in enumerate(_PLANETARY_TERMS):
+        a = a0 + ak * k - (0.009173 * t2 if i == 0 else 0.0)
+        jde += c * math.sin(math.radians(a))
+    return jde
+
+
+def new_moon_ordinals(start: date, end: date) -> list:
+    """start〜end（両端含む）にある朔の日本時間の日付（ordinal、昇順）。"""
+    from .solar_terms import JST_OFFSET_HOURS, _ORD_TO_JD, delta_t
+    lo, hi = start.toordinal(), end.toordinal()
+    k = math.floor((lo - _K0_ORD) / _SYNODIC_MONTH) - 1
+    out = []
+    while True:
+        jde = new_moon_jde(k)
+        year = 2000 + k / 12.3685
+        o = math.floor(jde - delta_t(year) / 86400.0 - _ORD_TO_JD + JST_OFFSET_HOURS / 24.0)
+        if o > hi:
+            return out
+        if o >= lo:
+            out.append(o)
+        k += 1
+
+
+# ---------------- 旧暦の月の並び ----------------
+def compute_months(first_year: int, last_year: int):
+    """
+    冬至 first_year-1 〜 冬至 last_year の月（旧暦 first_year-1 年11月 〜 last_year 年10月か閏10月）を作る。
+    戻り値: ([(旧暦年, 月, 閏か, 月初の ordinal), ...], 最後の月の翌月の月初の ordinal)。
+    """
+    # データパックを作る途中でも呼ばれるので、節気はパックを経由せずに計算する（パックの節気と同じ値）
+    from .solar_terms import sekki_table
+    sekki = sekki_table(range(first_year - 1, last_year + 1))
+    solstice = {y: dates[23].toordinal() for y, dates in sekki.items()}  # 冬至
+    # 中気は小寒〜冬至の奇数番目（大寒・雨水・春分・…・冬至）
+    zhongqi = sorted(d.toordinal() for dates in sekki.values() for d in dates[1::2])
+
+    starts = new_moon_ordinals(date(first_year - 1, 11, 1), date(last_year + 1, 1, 31))
+
+    def month_of(o: int) -> int:
+        return bisect_right(starts, o) - 1
+
+    def has_zhongqi(i: int) -> bool:
+        j = bisect_left(zhongqi, starts[i])
+        return j < len(zhongqi) and zhongqi[j] < starts[i + 1]
+
+    months = []
+    for y in range(first_year, last_year + 1):
+        a, b = month_of(solstice[y - 1]), month_of(solstice[y])  # 11月（前年）と 11月（今年）
+        leap = None
+        if b - a == 13:
+            leap = next(i for i in range(a + 1, b) if not has_zhongqi(i))
+        num, yr = 11, y - 1
+        for i in range(a, b):
+            if i == leap:
+                months.append((yr, num, True, starts[i]))
+                continue
+            if i > a:
+                num += 1
+                if num == 13:
+                    num, yr = 1, y
+            months.append((yr, num, False, starts[i]))
+    return months, starts[month_of(solstice[last_year])]
+
+
+def encode_months(months: list, end: int) -> bytes:
+    """1か月 1バイト（下位4ビット: 月、0x10: 閏、0x20: 大の月〈30日〉）。データパック用。"""
+    nexts = [m[3] for m in months[1:]] + [end]
+    return bytes(mo | (0x10 if leap else 0) | (0x20 if nxt - start == 30 else 0)
+                 for (_, mo, leap, start), nxt in zip(months, nexts))
+
+
+def _month_label(year: int, month: int, leap: bool) -> str:
+    return f"旧暦{year}年{'閏' if leap else ''}{month}月"
+
+
+class LunarTable:
+    """
+    旧暦の月の表。starts[i] は i 番目の月の月初（新暦の ordinal、最後に翌月初の番兵）、
+    keys[i] は 旧暦年*32 + 月*2 + 閏（昇順）。
+    """
+
+    __slots__ = ("starts", "keys")
+
+    def __init__(self, first_year: int, first_ord: int, codes):
+        starts, keys = array("l"), array("l")
+        o, y = first_ord, first_year
+        for c in codes:
+            mo, leap = c & 0x0F, (c >> 4) & 1
+            if mo == 1 and not leap and keys:
+                y += 1
+            starts.append(o)
+            keys.append(y * 32 + mo * 2 + leap)
+            o += 30 if c & 0x20 else 29
+        starts.append(o)
+        self.starts, self.keys = starts, keys
+
+    @property
+    def start(self) -> date:
+        return date.fromordinal(self.starts[0])
+
+    @property
+    def end(self) -> date:
+        return date.fromordinal(self.starts[-1] - 1)
+
+    def to_solar(self, year: int, month: int, day: int, leap: bool = False) -> date:
+        """旧暦 → 新暦。無い月（閏月でない月に閏を付けたなど）・月の日数を超える日は ValueError。"""
+        key = year * 32 + month * 2 + (1 if leap else 0)
+        keys = self.keys
+        i = bisect_left(keys, key)
+        if 1 <= month <= 12 and i < len(keys) and keys[i] == key:
+            n = self.starts[i + 1] - self.starts[i]
+            if 1 <= day <= n:
+                return date.fromordinal(self.starts[i] + day - 1)
+            raise ValueError(f"{_month_label(year, month, leap)}は{n}日までです: {day}日")
+        if 1 <= month <= 12 and not keys[0] <= key <= keys[-1]:
+            raise ValueError(f"{_month_label(year, month, leap)}は対応範囲外です（{self.start}〜{self.end}）")
+        raise ValueError(f"{_month_label(year, month, leap)}はありません")
+
+    def to_lunar(self, birth_date):
+        """新暦 → 旧暦の (年, 月, 日, 閏か)。"""
+        d = _as_date(birth_date)
+        o = d.toordinal()
+        if not self.starts[0] <= o < self.starts[-1]:
+            raise ValueError(f"対応範囲外の日付です: {d}（{self.start}〜{self.end}）")
+        i = bisect_right(self.starts, o) - 1
+        key = self.keys[i]
+        return key >> 5, (key & 31) >> 1, o - self.starts[i] + 1, bool(key & 1)
+
+
+@lru_cache(maxsize=None)
+def get_lunar_table() -> LunarTable:
+    """データパックの表から1回だけ組み立てる（対応範囲の新暦の日付をすべて含む）。"""
+    from .data_pack import load_pack
+    return LunarTable(*load_pack().lunar_months())
+
+
+def lunar_years() -> range:
+    """表に入れる旧暦年（冬至の年）。対応範囲の最初の日・最後の日を含む月まで。"""
+    return range(RANGE_START.year, RANGE_END.year + 2)
+
+
+def lunar_to_solar(year: int, month: int, day: int, leap: bool = False) -> date:
+    """旧暦の年・月・日（leap=True で閏月）→ 新暦の date。"""
+    return get_lunar_table().to_solar(year, month, day, leap)
+
+
+def solar_to_lunar(birth_date):
+    """新暦 → 旧暦の (年, 月, 日, 閏か)。"""
+    return get_lunar_table().to_lunar(birth_date)
+
+
+def lunar_label(year: int, month: int, day: int, leap: bool = False) -> str:
+    """"旧暦2023年閏2月1日" の形の文字列。"""
+    return f"{_month_label(year, month, leap)}{day}日"
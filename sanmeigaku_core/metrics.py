@@ -0,0 +1,230 @@
+# sanmeigaku_core/metrics.py
+# 計算関数の呼び出し回数・所要時間のヒストグラム・月干支の決め方（debug の "rule"）ごとの回数を数え、
+# Prometheus のテキスト形式で出す。環境変数 SANMEIGAKU_METRICS=1 のときだけ有効。
+#
+# 無効のとき @instrument は元の関数をそのまま返すので、呼び出しごとのコストは一切増えない
+# （有効・無効は import 時に決まる。途中で切り替えるにはプロセスの再起動が必要）。
+#
+#   SANMEIGAKU_METRICS=1 python server.py                  # GET /metrics で取得
+#   SANMEIGAKU_METRICS=1 SANMEIGAKU_METRICS_FILE=/tmp/sanmeigaku.prom streamlit run tentyuusatsu_app.py
+#                                                          # ファイルに書き出す（node_exporter の textfile 用）
+
+import atexit
+import os
+import time
+from _thread import allocate_lock  # threading・re・contextlib は読まない（kanshi_core の import を軽くする）
+from bisect import bisect_left
+from functools import wraps
+
+ENABLED = os.environ.get("SANMEIGAKU_METRICS", "").lower() in ("1", "true", "yes", "on")
+DUMP_PATH = os.environ.get("SANMEIGAKU_METRICS_FILE") or None
+DUMP_INTERVAL = 10.0  # ファイルへの書き出しはこの秒数に1回まで
+
+PREFIX = "sanmeigaku"
+# 所要時間のバケット（秒）。表引きは μs、Streamlit の1回の診断は ms のオーダー
+BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 1e-2, 0.1, 1.0)
+
+
+def rule_label(rule: str) -> str:
+    """debug の rule からラベル値を作る（"start_day≥6" → "start_day≥"、"before start_day(6)" → "before start_day"）。"""
+    i = rule.find("(")
+    return (rule[:i] if i >= 0 else rule).rstrip("0123456789 ")
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + "}"
+
+
+def _fmt(v: float) -> str:
+    return "+Inf" if v == float("inf") else repr(float(v)) if isinstance(v, float) else str(v)
+
+
+class Registry:
+    """カウンターとヒストグラムの入れ物。値の更新は1つのロックで守る（サーバーのスレッドから同時に呼ばれる）。"""
+
+    __slots__ = ("_lock", "_help", "_types", "_counters", "_histograms", "_label_names", "_last_dump")
+
+    def __init__(self):
+        self._lock = allocate_lock()
+        self._help = {}
+        self._types = {}
+        self._label_names = {}
+        self._counters = {}     # name -> {label_values: value}
+        self._histograms = {}   # name -> {label_values: [バケットごとの件数..., sum, count]}
+        self._last_dump = 0.0
+
+    def _declare(self, name: str, kind: str, help: str, labels: tuple):
+        if name not in self._types:
+            self._types[name], self._help[name], self._label_names[name] = kind, help, labels
+            (self._counters if kind == "counter" else self._histograms)[name] = {}
+
+    def counter(self, name: str, help: str, labels: tuple = ()):
+        self._declare(name, "counter", help, labels)
+
+    def histogram(self, name: str, help: str, labels: tuple = ()):
+        self._declare(name, "histogram", help, labels)
+
+    def inc(self, name: str, label_values: tuple = (), amount: float = 1):
+        with self._lock:
+            series = self._counters[name]
+            series[label_values] = series.get(label_values, 0) + amount
+
+    def observe(self, name: str, label_values: tuple, value: float):
+        i = bisect_left(BUCKETS, value)
+        with self._lock:
+            series = self._histograms[name]
+            h = series.get(label_values)
+            if h is None:
+                h = series[label_values] = [0] * (len(BUCKETS) + 2)
+            if i < len(BUCKETS):  # 最後のバケットを超えた分は +Inf（= count）にだけ入る
+                h[i] += 1
+            h[-2] += value
+            h[-1] += 1
+
+    def reset(self):
+        with self._lock:
+            for series in (*self._counters.values(), *self._histograms.values()):
+                series.clear()
+
+    def render(self) -> str:
+        """Prometheus のテキスト形式（text/plain; version=0.0.4）。"""
+        out = []
+        with self._lock:
+            for name, kind in self._types.items():
+                full = f"{PREFIX}_{name}"
+                out.append(f"# HELP {full} {self._help[name]}")
+                out.append(f"# TYPE {full} {kind}")
+                names = self._label_names[name]
+                if kind == "counter":
+                    for lv, v in sorted(self._counters[name].items()):
+                        out.append(f"{full}{_labels(names, lv)} {_fmt(v)}")
+                    continue
+                for lv, h in sorted(self._histograms[name].items()):
+                    cum = 0
+                    for le, c in zip(BUCKETS, h):
+                        cum += c
+                        out.append(f"{full}_bucket{_labels(names + ('le',), lv + (_fmt(le),))} {cum}")
+                    out.append(f"{full}_bucket{_labels(names + ('le',), lv + ('+Inf',))} {h[-1]}")
+                    out.append(f"{full}_sum{_labels(names, lv)} {_fmt(h[-2])}")
+                    out.append(f"{full}_count{_labels(names, lv)} {h[-1]}")
+        return "\n".join(out) + "\n"
+
+    def dump(self, path: str):
+        """render() の結果を path に原子的に書き出す。"""
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+        self._last_dump = time.monotonic()
+
+    def maybe_dump(self):
+        """SANMEIGAKU_METRICS_FILE が設定されていれば、DUMP_INTERVAL 秒に1回まで書き出す。"""
+        if DUMP_PATH and time.monotonic() - self._last_dump >= DUMP_INTERVAL:
+            self.dump(DUMP_PATH)
+
+
+REGISTRY = Registry()
+REGISTRY.counter("calls_total", "計算関数の呼び出し回数", ("function",))
+REGISTRY.counter("errors_total", "計算関数が例外を出した回数", ("function", "error"))
+REGISTRY.counter("rule_total", "月干支の決め方（debug の rule）ごとの回数。計測中は trace=True で呼んで数える", ("function", "rule"))
+REGISTRY.histogram("call_seconds", "計算関数の所要時間（秒）", ("function",))
+REGISTRY.histogram("diagnosis_seconds", "1回の診断（画面・API）の所要時間（秒）", ("source",))
+REGISTRY.counter("http_requests_total", "HTTP リクエスト数", ("path", "status"))
+REGISTRY.histogram("http_request_seconds", "HTTP リクエストの処理時間（秒）", ("path",))
+
+
+def instrument(name: str | None = None, rules: bool = False):
+    """
+    計算関数に付けるデコレーター。有効なら呼び出し回数・所要時間・例外を数え、
+    戻り値が (名前, idx, debug) で debug に "rule" があればその回数も数える。無効なら関数をそのまま返す。
+    debug は trace=True で呼んだとき・SANMEIGAKU_TRACE=1 のときだけ作られるので、rules=True の関数
+    （引数 trace を持つもの）は trace 未指定の呼び出しも trace=True で呼んで rule を数え、
+    呼び出し側には debug の代わりに None を返す（計測しないときと同じ戻り値）。
+    """
+    def deco(fn):
+        if not ENABLED:
+            return fn
+        label = (name or fn.__qualname__,)
+        perf_counter = time.perf_counter
+        pos = fn.__code__.co_varnames.index("trace") if rules else -1
+        trace_default = False
+        if rules:
+            # trace 未指定でも debug を返す設定か（SANMEIGAKU_TRACE）。判定は kanshi_core の1か所だけにする。
+            # rules=True の関数は kanshi_core の中で TRACE を定義した後に置くので、読み込み途中でも引ける
+            from .kanshi_core import TRACE as trace_default
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            hide = False
+            if rules and len(args) <= pos and kwargs.get("trace") is None:
+                kwargs["trace"], hide = True, not trace_default
+            t0 = perf_counter()
+            try:
+                res = fn(*args, **kwargs)
+            except Exception as e:
+                REGISTRY.inc("errors_total", label + (type(e).__name__,))
+                raise
+            finally:
+                REGISTRY.observe("call_seconds", label, perf_counter() - t0)
+                REGISTRY.inc("calls_total", label)
+            if type(res) is tuple and len(res) == 3 and type(res[2]) is dict:
+                rule = res[2].get("rule")
+                if rule:
+                    REGISTRY.inc("rule_total", label + (rule_label(rule),))
+                if hide:
+                    return res[0], res[1], None
+            return res
+        return wrapper
+    return deco
+
+
+class _Timer:
+    __slots__ = ("metric", "labels", "t0")
+
+    def __init__(self, metric: str, labels: tuple):
+        self.metric, self.labels = metric, labels
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        REGISTRY.observe(self.metric, self.labels, time.perf_counter() - self.t0)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _NullTimer()
+
+
+def timer(metric: str, *labels):
+    """with timer("diagnosis_seconds", "app"): ... の所要時間をヒストグラムに足す（無効なら何もしない）。"""
+    return _Timer(metric, labels) if ENABLED else _NULL
+
+
+def inc(metric: str, *labels, amount: float = 1):
+    if ENABLED:
+        REGISTRY.inc(metric, labels, amount)
+
+
+def render() -> str:
+    return REGISTRY.render()
+
+
+if ENABLED and DUMP_PATH:
+    atexit.register(lambda: REGISTRY.dump(DUMP_PATH))
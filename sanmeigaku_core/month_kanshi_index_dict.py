@@ -0,0 +1,1611 @@
+# 月干支インデックス辞書（{(year, month): kanshi_index}）
+month_kanshi_index_dict = {
+    (1900, 1): 14,
+    (1900, 2): 15,
+    (1900, 3): 16,
+    (1900, 4): 17,
+    (1900, 5): 18,
+    (1900, 6): 19,
+    (1900, 7): 20,
+    (1900, 8): 21,
+    (1900, 9): 22,
+    (1900, 10): 23,
+    (1900, 11): 24,
+    (1900, 12): 25,
+    (1901, 1): 26,
+    (1901, 2): 27,
+    (1901, 3): 28,
+    (1901, 4): 29,
+    (1901, 5): 30,
+    (1901, 6): 31,
+    (1901, 7): 32,
+    (1901, 8): 33,
+    (1901, 9): 34,
+    (1901, 10): 35,
+    (1901, 11): 36,
+    (1901, 12): 37,
+    (1902, 1): 38,
+    (1902, 2): 39,
+    (1902, 3): 40,
+    (1902, 4): 41,
+    (1902, 5): 42,
+    (1902, 6): 43,
+    (1902, 7): 44,
+    (1902, 8): 45,
+    (1902, 9): 46,
+    (1902, 10): 47,
+    (1902, 11): 48,
+    (1902, 12): 49,
+    (1903, 1): 50,
+    (1903, 2): 51,
+    (1903, 3): 52,
+    (1903, 4): 53,
+    (1903, 5): 54,
+    (1903, 6): 55,
+    (1903, 7): 56,
+    (1903, 8): 57,
+    (1903, 9): 58,
+    (1903, 10): 59,
+    (1903, 11): 60,
+    (1903, 12): 1,
+    (1904, 1): 2,
+    (1904, 2): 3,
+    (1904, 3): 4,
+    (1904, 4): 5,
+    (1904, 5): 6,
+    (1904, 6): 7,
+    (1904, 7): 8,
+    (1904, 8): 9,
+    (1904, 9): 10,
+    (1904, 10): 11,
+    (1904, 11): 12,
+    (1904, 12): 13,
+    (1905, 1): 14,
+    (1905, 2): 15,
+    (1905, 3): 16,
+    (1905, 4): 17,
+    (1905, 5): 18,
+    (1905, 6): 19,
+    (1905, 7): 20,
+    (1905, 8): 21,
+    (1905, 9): 22,
+    (1905, 10): 23,
+    (1905, 11): 24,
+    (1905, 12): 25,
+    (1906, 1): 26,
+    (1906, 2): 27,
+    (1906, 3): 28,
+    (1906, 4): 29,
+    (1906, 5): 30,
+    (1906, 6): 31,
+    (1906, 7): 32,
+    (1906, 8): 33,
+    (1906, 9): 34,
+    (1906, 10): 35,
+    (1906, 11): 36,
+    (1906, 12): 37,
+    (1907, 1): 38,
+    (1907, 2): 39,
+    (1907, 3): 40,
+    (1907, 4): 41,
+    (1907, 5): 42,
+    (1907, 6): 43,
+    (1907, 7): 44,
+    (1907, 8): 45,
+    (1907, 9): 46,
+    (1907, 10): 47,
+    (1907, 11): 48,
+    (1907, 12): 49,
+    (1908, 1): 50,
+    (1908, 2): 51,
+    (1908, 3): 52,
+    (1908, 4): 53,
+    (1908, 5): 54,
+    (1908, 6): 55,
+    (1908, 7): 56,
+    (1908, 8): 57,
+    (1908, 9): 58,
+    (1908, 10): 59,
+    (1908, 11): 60,
+    (1908, 12): 1,
+    (1909, 1): 2,
+    (1909, 2): 3,
+    (1909, 3): 4,
+    (1909, 4): 5,
+    (1909, 5): 6,
+    (1909, 6): 7,
+    (1909, 7): 8,
+    (1909, 8): 9,
+    (1909, 9): 10,
+    (1909, 10): 11,
+    (1909, 11): 12,
+    (1909, 12): 13,
+    (1910, 1): 14,
+    (1910, 2): 15,
+    (1910, 3): 16,
+    (1910, 4): 17,
+    (1910, 5): 18,
+    (1910, 6): 19,
+    (1910, 7): 20,
+    (1910, 8): 21,
+    (1910, 9): 22,
+    (1910, 10): 23,
+    (1910, 11): 24,
+    (1910, 12): 25,
+    (1911, 1): 26,
+    (1911, 2): 27,
+    (1911, 3): 28,
+    (1911, 4): 29,
+    (1911, 5): 30,
+    (1911, 6): 31,
+    (1911, 7): 32,
+    (1911, 8): 33,
+    (1911, 9): 34,
+    (1911, 10): 35,
+    (1911, 11): 36,
+    (1911, 12): 37,
+    (1912, 1): 38,
+    (1912, 2): 39,
+    (1912, 3): 40,
+    (1912, 4): 41,
+    (1912, 5): 42,
+    (1912, 6): 43,
+    (1912, 7): 44,
+    (1912, 8): 45,
+    (1912, 9): 46,
+    (1912, 10): 47,
+    (1912, 11): 48,
+    (1912, 12): 49,
+    (1913, 1): 50,
+    (1913, 2): 51,
+    (1913, 3): 52,
+    (1913, 4): 53,
+    (1913, 5): 54,
+    (1913, 6): 55,
+    (1913, 7): 56,
+    (1913, 8): 57,
+    (1913, 9): 58,
+    (1913, 10): 59,
+    (1913, 11): 60,
+    (1913, 12): 1,
+    (1914, 1): 2,
+    (1914, 2): 3,
+    (1914, 3): 4,
+    (1914, 4): 5,
+    (1914, 5): 6,
+    (1914, 6): 7,
+    (1914, 7): 8,
+    (1914, 8): 9,
+    (1914, 9): 10,
+    (1914, 10): 11,
+    (1914, 11): 12,
+    (1914, 12): 13,
+    (1915, 1): 14,
+    (1915, 2): 15,
+    (1915, 3): 16,
+    (1915, 4): 17,
+    (1915, 5): 18,
+    (1915, 6): 19,
+    (1915, 7): 20,
+    (1915, 8): 21,
+    (1915, 9): 22,
+    (1915, 10): 23,
+    (1915, 11): 24,
+    (1915, 12): 25,
+    (1916, 1): 26,
+    (1916, 2): 27,
+    (1916, 3): 28,
+    (1916, 4): 29,
+    (1916, 5): 30,
+    (1916, 6): 31,
+    (1916, 7): 32,
+    (1916, 8): 33,
+    (1916, 9): 34,
+    (1916, 10): 35,
+    (1916, 11): 36,
+    (1916, 12): 37,
+    (1917, 1): 38,
+    (1917, 2): 39,
+    (1917, 3): 40,
+    (1917, 4): 41,
+    (1917, 5): 42,
+    (1917, 6): 43,
+    (1917, 7): 44,
+    (1917, 8): 45,
+    (1917, 9): 46,
+    (1917, 10): 47,
+    (1917, 11): 48,
+    (1917, 12): 49,
+    (1918, 1): 50,
+    (1918, 2): 51,
+    (1918, 3): 52,
+    (1918, 4): 53,
+    (1918, 5): 54,
+    (1918, 6): 55,
+    (1918, 7): 56,
+    (1918, 8): 57,
+    (1918, 9): 58,
+    (1918, 10): 59,
+    (1918, 11): 60,
+    (1918, 12): 1,
+    (1919, 1): 2,
+    (1919, 2): 3,
+    (1919, 3): 4,
+    (1919, 4): 5,
+    (1919, 5): 6,
+    (1919, 6): 7,
+    (1919, 7): 8,
+    (1919, 8): 9,
+    (1919, 9): 10,
+    (1919, 10): 11,
+    (1919, 11): 12,
+    (1919, 12): 13,
+    (1920, 1): 14,
+    (1920, 2): 15,
+    (1920, 3): 16,
+    (1920, 4): 17,
+    (1920, 5): 18,
+    (1920, 6): 19,
+    (1920, 7): 20,
+    (1920, 8): 21,
+    (1920, 9): 22,
+    (1920, 10): 23,
+    (1920, 11): 24,
+    (1920, 12): 25,
+    (1921, 1): 26,
+    (1921, 2): 27,
+    (1921, 3): 28,
+    (1921, 4): 29,
+    (1921, 5): 30,
+    (1921, 6): 31,
+    (1921, 7): 32,
+    (1921, 8): 33,
+    (1921, 9): 34,
+    (1921, 10): 35,
+    (1921, 11): 36,
+    (1921, 12): 37,
+    (1922, 1): 38,
+    (1922, 2): 39,
+    (1922, 3): 40,
+    (1922, 4): 41,
+    (1922, 5): 42,
+    (1922, 6): 43,
+    (1922, 7): 44,
+    (1922, 8): 45,
+    (1922, 9): 46,
+    (1922, 10): 47,
+    (1922, 11): 48,
+    (1922, 12): 49,
+    (1923, 1): 50,
+    (1923, 2): 51,
+    (1923, 3): 52,
+    (1923, 4): 53,
+    (1923, 5): 54,
+    (1923, 6): 55,
+    (1923, 7): 56,
+    (1923, 8): 57,
+    (1923, 9): 58,
+    (1923, 10): 59,
+    (1923, 11): 60,
+    (1923, 12): 1,
+    (1924, 1): 2,
+    (1924, 2): 3,
+    (1924, 3): 4,
+    (1924, 4): 5,
+    (1924, 5): 6,
+    (1924, 6): 7,
+    (1924, 7): 8,
+    (1924, 8): 9,
+    (1924, 9): 10,
+    (1924, 10): 11,
+    (1924, 11): 12,
+    (1924, 12): 13,
+    (1925, 1): 14,
+    (1925, 2): 15,
+    (1925, 3): 16,
+    (1925, 4): 17,
+    (1925, 5): 18,
+    (1925, 6): 19,
+    (1925, 7): 20,
+    (1925, 8): 21,
+    (1925, 9): 22,
+    (1925, 10): 23,
+    (1925, 11): 24,
+    (1925, 12): 25,
+    (1926, 1): 26,
+    (1926, 2): 27,
+    (1926, 3): 28,
+    (1926, 4): 29,
+    (1926, 5): 30,
+    (1926, 6): 31,
+    (1926, 7): 32,
+    (1926, 8): 33,
+    (1926, 9): 34,
+    (1926, 10): 35,
+    (1926, 11): 36,
+    (1926, 12): 37,
+    (1927, 1): 38,
+    (1927, 2): 39,
+    (1927, 3): 40,
+    (1927, 4): 41,
+    (1927, 5): 42,
+    (1927, 6): 43,
+    (1927, 7): 44,
+    (1927, 8): 45,
+    (1927, 9): 46,
+    (1927, 10): 47,
+    (1927, 11): 48,
+    (1927, 12): 49,
+    (1928, 1): 50,
+    (1928, 2): 51,
+    (1928, 3): 52,
+    (1928, 4): 53,
+    (1928, 5): 54,
+    (1928, 6): 55,
+    (1928, 7): 56,
+    (1928, 8): 57,
+    (1928, 9): 58,
+    (1928, 10): 59,
+    (1928, 11): 60,
+    (1928, 12): 1,
+    (1929, 1): 2,
+    (1929, 2): 3,
+    (1929, 3): 4,
+    (1929, 4): 5,
+    (1929, 5): 6,
+    (1929, 6): 7,
+    (1929, 7): 8,
+    (1929, 8): 9,
+    (1929, 9): 10,
+    (1929, 10): 11,
+    (1929, 11): 12,
+    (1929, 12): 13,
+    (1930, 1): 14,
+    (1930, 2): 15,
+    (1930, 3): 16,
+    (1930, 4): 17,
+    (1930, 5): 18,
+    (1930, 6): 19,
+    (1930, 7): 20,
+    (1930, 8): 21,
+    (1930, 9): 22,
+    (1930, 10): 23,
+    (1930, 11): 24,
+    (1930, 12): 25,
+    (1931, 1): 26,
+    (1931, 2): 27,
+    (1931, 3): 28,
+    (1931, 4): 29,
+    (1931, 5): 30,
+    (1931, 6): 31,
+    (1931, 7): 32,
+    (1931, 8): 33,
+    (1931, 9): 34,
+    (1931, 10): 35,
+    (1931, 11): 36,
+    (1931, 12): 37,
+    (1932, 1): 38,
+    (1932, 2): 39,
+    (1932, 3): 40,
+    (1932, 4): 41,
+    (1932, 5): 42,
+    (1932, 6): 43,
+    (1932, 7): 44,
+    (1932, 8): 45,
+    (1932, 9): 46,
+    (1932, 10): 47,
+    (1932, 11): 48,
+    (1932, 12): 49,
+    (1933, 1): 50,
+    (1933, 2): 51,
+    (1933, 3): 52,
+    (1933, 4): 53,
+    (1933, 5): 54,
+    (1933, 6): 55,
+    (1933, 7): 56,
+    (1933, 8): 57,
+    (1933, 9): 58,
+    (1933, 10): 59,
+    (1933, 11): 60,
+    (1933, 12): 1,
+    (1934, 1): 2,
+    (1934, 2): 3,
+    (1934, 3): 4,
+    (1934, 4): 5,
+    (1934, 5): 6,
+    (1934, 6): 7,
+    (1934, 7): 8,
+    (1934, 8): 9,
+    (1934, 9): 10,
+    (1934, 10): 11,
+    (1934, 11): 12,
+    (1934, 12): 13,
+    (1935, 1): 14,
+    (1935, 2): 15,
+    (1935, 3): 16,
+    (1935, 4): 17,
+    (1935, 5): 18,
+    (1935, 6): 19,
+    (1935, 7): 20,
+    (1935, 8): 21,
+    (1935, 9): 22,
+    (1935, 10): 23,
+    (1935, 11): 24,
+    (1935, 12): 25,
+    (1936, 1): 26,
+    (1936, 2): 27,
+    (1936, 3): 28,
+    (1936, 4): 29,
+    (1936, 5): 30,
+    (1936, 6): 31,
+    (1936, 7): 32,
+    (1936, 8): 33,
+    (1936, 9): 34,
+    (1936, 10): 35,
+    (1936, 11): 36,
+    (1936, 12): 37,
+    (1937, 1): 38,
+    (1937, 2): 39,
+    (1937, 3): 40,
+    (1937, 4): 41,
+    (1937, 5): 42,
+    (1937, 6): 43,
+    (1937, 7): 44,
+    (1937, 8): 45,
+    (1937, 9): 46,
+    (1937, 10): 47,
+    (1937, 11): 48,
+    (1937, 12): 49,
+    (1938, 1): 50,
+    (1938, 2): 51,
+    (1938, 3): 52,
+    (1938, 4): 53,
+    (1938, 5): 54,
+    (1938, 6): 55,
+    (1938, 7): 56,
+    (1938, 8): 57,
+    (1938, 9): 58,
+    (1938, 10): 59,
+    (1938, 11): 60,
+    (1938, 12): 1,
+    (1939, 1): 2,
+    (1939, 2): 3,
+    (1939, 3): 4,
+    (1939, 4): 5,
+    (1939, 5): 6,
+    (1939, 6): 7,
+    (1939, 7): 8,
+    (1939, 8): 9,
+    (1939, 9): 10,
+    (1939, 10): 11,
+    (1939, 11): 12,
+    (1939, 12): 13,
+    (1940, 1): 14,
+    (1940, 2): 15,
+    (1940, 3): 16,
+    (1940, 4): 17,
+    (1940, 5): 18,
+    (1940, 6): 19,
+    (1940, 7): 20,
+    (1940, 8): 21,
+    (1940, 9): 22,
+    (1940, 10): 23,
+    (1940, 11): 24,
+    (1940, 12): 25,
+    (1941, 1): 26,
+    (1941, 2): 27,
+    (1941, 3): 28,
+    (1941, 4): 29,
+    (1941, 5): 30,
+    (1941, 6): 31,
+    (1941, 7): 32,
+    (1941, 8): 33,
+    (1941, 9): 34,
+    (1941, 10): 35,
+    (1941, 11): 36,
+    (1941, 12): 37,
+    (1942, 1): 38,
+    (1942, 2): 39,
+    (1942, 3): 40,
+    (1942, 4): 41,
+    (1942, 5): 42,
+    (1942, 6): 43,
+    (1942, 7): 44,
+    (1942, 8): 45,
+    (1942, 9): 46,
+    (1942, 10): 47,
+    (1942, 11): 48,
+    (1942, 12): 49,
+    (1943, 1): 50,
+    (1943, 2): 51,
+    (1943, 3): 52,
+    (1943, 4): 53,
+    (1943, 5): 54,
+    (1943, 6): 55,
+    (1943, 7): 56,
+    (1943, 8): 57,
+    (1943, 9): 58,
+    (1943, 10): 59,
+    (1943, 11): 60,
+    (1943, 12): 1,
+    (1944, 1): 2,
+    (1944, 2): 3,
+    (1944, 3): 4,
+    (1944, 4): 5,
+    (1944, 5): 6,
+    (1944, 6): 7,
+    (1944, 7): 8,
+    (1944, 8): 9,
+    (1944, 9): 10,
+    (1944, 10): 11,
+    (1944, 11): 12,
+    (1944, 12): 13,
+    (1945, 1): 14,
+    (1945, 2): 15,
+    (1945, 3): 16,
+    (1945, 4): 17,
+    (1945, 5): 18,
+    (1945, 6): 19,
+    (1945, 7): 20,
+    (1945, 8): 21,
+    (1945, 9): 22,
+    (1945, 10): 23,
+    (1945, 11): 24,
+    (1945, 12): 25,
+    (1946, 1): 26,
+    (1946, 2): 27,
+    (1946, 3): 28,
+    (1946, 4): 29,
+    (1946, 5): 30,
+    (1946, 6): 31,
+    (1946, 7): 32,
+    (1946, 8): 33,
+    (1946, 9): 34,
+    (1946, 10): 35,
+    (1946, 11): 36,
+    (1946, 12): 37,
+    (1947, 1): 38,
+    (1947, 2): 39,
+    (1947, 3): 40,
+    (1947, 4): 41,
+    (1947, 5): 42,
+    (1947, 6): 43,
+    (1947, 7): 44,
+    (1947, 8): 45,
+    (1947, 9): 46,
+    (1947, 10): 47,
+    (1947, 11): 48,
+    (1947, 12): 49,
+    (1948, 1): 50,
+    (1948, 2): 51,
+    (1948, 3): 52,
+    (1948, 4): 53,
+    (1948, 5): 54,
+    (1948, 6): 55,
+    (1948, 7): 56,
+    (1948, 8): 57,
+    (1948, 9): 58,
+    (1948, 10): 59,
+    (1948, 11): 60,
+    (1948, 12): 1,
+    (1949, 1): 2,
+    (1949, 2): 3,
+    (1949, 3): 4,
+    (1949, 4): 5,
+    (1949, 5): 6,
+    (1949, 6): 7,
+    (1949, 7): 8,
+    (1949, 8): 9,
+    (1949, 9): 10,
+    (1949, 10): 11,
+    (1949, 11): 12,
+    (1949, 12): 13,
+    (1950, 1): 14,
+    (1950, 2): 15,
+    (1950, 3): 16,
+    (1950, 4): 17,
+    (1950, 5): 18,
+    (1950, 6): 19,
+    (1950, 7): 20,
+    (1950, 8): 21,
+    (1950, 9): 22,
+    (1950, 10): 23,
+    (1950, 11): 24,
+    (1950, 12): 25,
+    (1951, 1): 26,
+    (1951, 2): 27,
+    (1951, 3): 28,
+    (1951, 4): 29,
+    (1951, 5): 30,
+    (1951, 6): 31,
+    (1951, 7): 32,
+    (1951, 8): 33,
+    (1951, 9): 34,
+    (1951, 10): 35,
+    (1951, 11): 36,
+    (1951, 12): 37,
+    (1952, 1): 38,
+    (1952, 2): 39,
+    (1952, 3): 40,
+    (1952, 4): 41,
+    (1952, 5): 42,
+    (1952, 6): 43,
+    (1952, 7): 44,
+    (1952, 8): 45,
+    (1952, 9): 46,
+    (1952, 10): 47,
+    (1952, 11): 48,
+    (1952, 12): 49,
+    (1953, 1): 50,
+    (1953, 2): 51,
+    (1953, 3): 52,
+    (1953, 4): 53,
+    (1953, 5): 54,
+    (1953, 6): 55,
+    (1953, 7): 56,
+    (1953, 8): 57,
+    (1953, 9): 58,
+    (1953, 10): 59,
+    (1953, 11): 60,
+    (1953, 12): 1,
+    (1954, 1): 2,
+    (1954, 2): 3,
+    (1954, 3): 4,
+    (1954, 4): 5,
+    (1954, 5): 6,
+    (1954, 6): 7,
+    (1954, 7): 8,
+    (1954, 8): 9,
+    (1954, 9): 10,
+    (1954, 10): 11,
+    (1954, 11): 12,
+    (1954, 12): 13,
+    (1955, 1): 14,
+    (1955, 2): 15,
+    (1955, 3): 16,
+    (1955, 4): 17,
+    (1955, 5): 18,
+    (1955, 6): 19,
+    (1955, 7): 20,
+    (1955, 8): 21,
+    (1955, 9): 22,
+    (1955, 10): 23,
+    (1955, 11): 24,
+    (1955, 12): 25,
+    (1956, 1): 26,
+    (1956, 2): 27,
+    (1956, 3): 28,
+    (1956, 4): 29,
+    (1956, 5): 30,
+    (1956, 6): 31,
+    (1956, 7): 32,
+    (1956, 8): 33,
+    (1956, 9): 34,
+    (1956, 10): 35,
+    (1956, 11): 36,
+    (1956, 12): 37,
+    (1957, 1): 38,
+    (1957, 2): 39,
+    (1957, 3): 40,
+    (1957, 4): 41,
+    (1957, 5): 42,
+    (1957, 6): 43,
+    (1957, 7): 44,
+    (1957, 8): 45,
+    (1957, 9): 46,
+    (1957, 10): 47,
+    (1957, 11): 48,
+    (1957, 12): 49,
+    (1958, 1): 50,
+    (1958, 2): 51,
+    (1958, 3): 52,
+    (1958, 4): 53,
+    (1958, 5): 54,
+    (1958, 6): 55,
+    (1958, 7): 56,
+    (1958, 8): 57,
+    (1958, 9): 58,
+    (1958, 10): 59,
+    (1958, 11): 60,
+    (1958, 12): 1,
+    (1959, 1): 2,
+    (1959, 2): 3,
+    (1959, 3): 4,
+    (1959, 4): 5,
+    (1959, 5): 6,
+    (1959, 6): 7,
+    (1959, 7): 8,
+    (1959, 8): 9,
+    (1959, 9): 10,
+    (1959, 10): 11,
+    (1959, 11): 12,
+    (1959, 12): 13,
+    (1960, 1): 14,
+    (1960, 2): 15,
+    (1960, 3): 16,
+    (1960, 4): 17,
+    (1960, 5): 18,
+    (1960, 6): 19,
+    (1960, 7): 20,
+    (1960, 8): 21,
+    (1960, 9): 22,
+    (1960, 10): 23,
+    (1960, 11): 24,
+    (1960, 12): 25,
+    (1961, 1): 26,
+    (1961, 2): 27,
+    (1961, 3): 28,
+    (1961, 4): 29,
+    (1961, 5): 30,
+    (1961, 6): 31,
+    (1961, 7): 32,
+    (1961, 8): 33,
+    (1961, 9): 34,
+    (1961, 10): 35,
+    (1961, 11): 36,
+    (1961, 12): 37,
+    (1962, 1): 38,
+    (1962, 2): 39,
+    (1962, 3): 40,
+    (1962, 4): 41,
+    (1962, 5): 42,
+    (1962, 6): 43,
+    (1962, 7): 44,
+    (1962, 8): 45,
+    (1962, 9): 46,
+    (1962, 10): 47,
+    (1962, 11): 48,
+    (1962, 12): 49,
+    (1963, 1): 50,
+    (1963, 2): 51,
+    (1963, 3): 52,
+    (1963, 4): 53,
+    (1963, 5): 54,
+    (1963, 6): 55,
+    (1963, 7): 56,
+    (1963, 8): 57,
+    (1963, 9): 58,
+    (1963, 10): 59,
+    (1963, 11): 60,
+    (1963, 12): 1,
+    (1964, 1): 2,
+    (1964, 2): 3,
+    (1964, 3): 4,
+    (1964, 4): 5,
+    (1964, 5): 6,
+    (1964, 6): 7,
+    (1964, 7): 8,
+    (1964, 8): 9,
+    (1964, 9): 10,
+    (1964, 10): 11,
+    (1964, 11): 12,
+    (1964, 12): 13,
+    (1965, 1): 14,
+    (1965, 2): 15,
+    (1965, 3): 16,
+    (1965, 4): 17,
+    (1965, 5): 18,
+    (1965, 6): 19,
+    (1965, 7): 20,
+    (1965, 8): 21,
+    (1965, 9): 22,
+    (1965, 10): 23,
+    (1965, 11): 24,
+    (1965, 12): 25,
+    (1966, 1): 26,
+    (1966, 2): 27,
+    (1966, 3): 28,
+    (1966, 4): 29,
+    (1966, 5): 30,
+    (1966, 6): 31,
+    (1966, 7): 32,
+    (1966, 8): 33,
+    (1966, 9): 34,
+    (1966, 10): 35,
+    (1966, 11): 36,
+    (1966, 12): 37,
+    (1967, 1): 38,
+    (1967, 2): 39,
+    (1967, 3): 40,
+    (1967, 4): 41,
+    (1967, 5): 42,
+    (1967, 6): 43,
+    (1967, 7): 44,
+    (1967, 8): 45,
+    (1967, 9): 46,
+    (1967, 10): 47,
+    (1967, 11): 48,
+    (1967, 12): 49,
+    (1968, 1): 50,
+    (1968, 2): 51,
+    (1968, 3): 52,
+    (1968, 4): 53,
+    (1968, 5): 54,
+    (1968, 6): 55,
+    (1968, 7): 56,
+    (1968, 8): 57,
+    (1968, 9): 58,
+    (1968, 10): 59,
+    (1968, 11): 60,
+    (1968, 12): 1,
+    (1969, 1): 2,
+    (1969, 2): 3,
+    (1969, 3): 4,
+    (1969, 4): 5,
+    (1969, 5): 6,
+    (1969, 6): 7,
+    (1969, 7): 8,
+    (1969, 8): 9,
+    (1969, 9): 10,
+    (1969, 10): 11,
+    (1969, 11): 12,
+    (1969, 12): 13,
+    (1970, 1): 14,
+    (1970, 2): 15,
+    (1970, 3): 16,
+    (1970, 4): 17,
+    (1970, 5): 18,
+    (1970, 6): 19,
+    (1970, 7): 20,
+    (1970, 8): 21,
+    (1970, 9): 22,
+    (1970, 10): 23,
+    (1970, 11): 24,
+    (1970, 12): 25,
+    (1971, 1): 26,
+    (1971, 2): 27,
+    (1971, 3): 28,
+    (1971, 4): 29,
+    (1971, 5): 30,
+    (1971, 6): 31,
+    (1971, 7): 32,
+    (1971, 8): 33,
+    (1971, 9): 34,
+    (1971, 10): 35,
+    (1971, 11): 36,
+    (1971, 12): 37,
+    (1972, 1): 38,
+    (1972, 2): 39,
+    (1972, 3): 40,
+    (1972, 4): 41,
+    (1972, 5): 42,
+    (1972, 6): 43,
+    (1972, 7): 44,
+    (1972, 8): 45,
+    (1972, 9): 46,
+    (1972, 10): 47,
+    (1972, 11): 48,
+    (1972, 12): 49,
+    (1973, 1): 50,
+    (1973, 2): 51,
+    (1973, 3): 52,
+    (1973, 4): 53,
+    (1973, 5): 54,
+    (1973, 6): 55,
+    (1973, 7): 56,
+    (1973, 8): 57,
+    (1973, 9): 58,
+    (1973, 10): 59,
+    (1973, 11): 60,
+    (1973, 12): 1,
+    (1974, 1): 2,
+    (1974, 2): 3,
+    (1974, 3): 4,
+    (1974, 4): 5,
+    (1974, 5): 6,
+    (1974, 6): 7,
+    (1974, 7): 8,
+    (1974, 8): 9,
+    (1974, 9): 10,
+    (1974, 10): 11,
+    (1974, 11): 12,
+    (1974, 12): 13,
+    (1975, 1): 14,
+    (1975, 2): 15,
+    (1975, 3): 16,
+    (1975, 4): 17,
+    (1975, 5): 18,
+    (1975, 6): 19,
+    (1975, 7): 20,
+    (1975, 8): 21,
+    (1975, 9): 22,
+    (1975, 10): 23,
+    (1975, 11): 24,
+    (1975, 12): 25,
+    (1976, 1): 26,
+    (1976, 2): 27,
+    (1976, 3): 28,
+    (1976, 4): 29,
+    (1976, 5): 30,
+    (1976, 6): 31,
+    (1976, 7): 32,
+    (1976, 8): 33,
+    (1976, 9): 34,
+    (1976, 10): 35,
+    (1976, 11): 36,
+    (1976, 12): 37,
+    (1977, 1): 38,
+    (1977, 2): 39,
+    (1977, 3): 40,
+    (1977, 4): 41,
+    (1977, 5): 42,
+    (1977, 6): 43,
+    (1977, 7): 44,
+    (1977, 8): 45,
+    (1977, 9): 46,
+    (1977, 10): 47,
+    (1977, 11): 48,
+    (1977, 12): 49,
+    (1978, 1): 50,
+    (1978, 2): 51,
+    (1978, 3): 52,
+    (1978, 4): 53,
+    (1978, 5): 54,
+    (1978, 6): 55,
+    (1978, 7): 56,
+    (1978, 8): 57,
+    (1978, 9): 58,
+    (1978, 10): 59,
+    (1978, 11): 60,
+    (1978, 12): 1,
+    (1979, 1): 2,
+    (1979, 2): 3,
+    (1979, 3): 4,
+    (1979, 4): 5,
+    (1979, 5): 6,
+    (1979, 6): 7,
+    (1979, 7): 8,
+    (1979, 8): 9,
+    (1979, 9): 10,
+    (1979, 10): 11,
+    (1979, 11): 12,
+    (1979, 12): 13,
+    (1980, 1): 14,
+    (1980, 2): 15,
+    (1980, 3): 16,
+    (1980, 4): 17,
+    (1980, 5): 18,
+    (1980, 6): 19,
+    (1980, 7): 20,
+    (1980, 8): 21,
+    (1980, 9): 22,
+    (1980, 10): 23,
+    (1980, 11): 24,
+    (1980, 12): 25,
+    (1981, 1): 26,
+    (1981, 2): 27,
+    (1981, 3): 28,
+    (1981, 4): 29,
+    (1981, 5): 30,
+    (1981, 6): 31,
+    (1981, 7): 32,
+    (1981, 8): 33,
+    (1981, 9): 34,
+    (1981, 10): 35,
+    (1981, 11): 36,
+    (1981, 12): 37,
+    (1982, 1): 38,
+    (1982, 2): 39,
+    (1982, 3): 40,
+    (1982, 4): 41,
+    (1982, 5): 42,
+    (1982, 6): 43,
+    (1982, 7): 44,
+    (1982, 8): 45,
+    (1982, 9): 46,
+    (1982, 10): 47,
+    (1982, 11): 48,
+    (1982, 12): 49,
+    (1983, 1): 50,
+    (1983, 2): 51,
+    (1983, 3): 52,
+    (1983, 4): 53,
+    (1983, 5): 54,
+    (1983, 6): 55,
+    (1983, 7): 56,
+    (1983, 8): 57,
+    (1983, 9): 58,
+    (1983, 10): 59,
+    (1983, 11): 60,
+    (1983, 12): 1,
+    (1984, 1): 2,
+    (1984, 2): 3,
+    (1984, 3): 4,
+    (1984, 4): 5,
+    (1984, 5): 6,
+    (1984, 6): 7,
+    (1984, 7): 8,
+    (1984, 8): 9,
+    (1984, 9): 10,
+    (1984, 10): 11,
+    (1984, 11): 12,
+    (1984, 12): 13,
+    (1985, 1): 14,
+    (1985, 2): 15,
+    (1985, 3): 16,
+    (1985, 4): 17,
+    (1985, 5): 18,
+    (1985, 6): 19,
+    (1985, 7): 20,
+    (1985, 8): 21,
+    (1985, 9): 22,
+    (1985, 10): 23,
+    (1985, 11): 24,
+    (1985, 12): 25,
+    (1986, 1): 26,
+    (1986, 2): 27,
+    (1986, 3): 28,
+    (1986, 4): 29,
+    (1986, 5): 30,
+    (1986, 6): 31,
+    (1986, 7): 32,
+    (1986, 8): 33,
+    (1986, 9): 34,
+    (1986, 10): 35,
+    (1986, 11): 36,
+    (1986, 12): 37,
+    (1987, 1): 38,
+    (1987, 2): 39,
+    (1987, 3): 40,
+    (1987, 4): 41,
+    (1987, 5): 42,
+    (1987, 6): 43,
+    (1987, 7): 44,
+    (1987, 8): 45,
+    (1987, 9): 46,
+    (1987, 10): 47,
+    (1987, 11): 48,
+    (1987, 12): 49,
+    (1988, 1): 50,
+    (1988, 2): 51,
+    (1988, 3): 52,
+    (1988, 4): 53,
+    (1988, 5): 54,
+    (1988, 6): 55,
+    (1988, 7): 56,
+    (1988, 8): 57,
+    (1988, 9): 58,
+    (1988, 10): 59,
+    (1988, 11): 60,
+    (1988, 12): 1,
+    (1989, 1): 2,
+    (1989, 2): 3,
+    (1989, 3): 4,
+    (1989, 4): 5,
+    (1989, 5): 6,
+    (1989, 6): 7,
+    (1989, 7): 8,
+    (1989, 8): 9,
+    (1989, 9): 10,
+    (1989, 10): 11,
+    (1989, 11): 12,
+    (1989, 12): 13,
+    (1990, 1): 14,
+    (1990, 2): 15,
+    (1990, 3): 16,
+    (1990, 4): 17,
+    (1990, 5): 18,
+    (1990, 6): 19,
+    (1990, 7): 20,
+    (1990, 8): 21,
+    (1990, 9): 22,
+    (1990, 10): 23,
+    (1990, 11): 24,
+    (1990, 12): 25,
+    (1991, 1): 26,
+    (1991, 2): 27,
+    (1991, 3): 28,
+    (1991, 4): 29,
+    (1991, 5): 30,
+    (1991, 6): 31,
+    (1991, 7): 32,
+    (1991, 8): 33,
+    (1991, 9): 34,
+    (1991, 10): 35,
+    (1991, 11): 36,
+    (1991, 12): 37,
+    (1992, 1): 38,
+    (1992, 2): 39,
+    (1992, 3): 40,
+    (1992, 4): 41,
+    (1992, 5): 42,
+    (1992, 6): 43,
+    (1992, 7): 44,
+    (1992, 8): 45,
+    (1992, 9): 46,
+    (1992, 10): 47,
+    (1992, 11): 48,
+    (1992, 12): 49,
+    (1993, 1): 50,
+    (1993, 2): 51,
+    (1993, 3): 52,
+    (1993, 4): 53,
+    (1993, 5): 54,
+    (1993, 6): 55,
+    (1993, 7): 56,
+    (1993, 8): 57,
+    (1993, 9): 58,
+    (1993, 10): 59,
+    (1993, 11): 60,
+    (1993, 12): 1,
+    (1994, 1): 2,
+    (1994, 2): 3,
+    (1994, 3): 4,
+    (1994, 4): 5,
+    (1994, 5): 6,
+    (1994, 6): 7,
+    (1994, 7): 8,
+    (1994, 8): 9,
+    (1994, 9): 10,
+    (1994, 10): 11,
+    (1994, 11): 12,
+    (1994, 12): 13,
+    (1995, 1): 14,
+    (1995, 2): 15,
+    (1995, 3): 16,
+    (1995, 4): 17,
+    (1995, 5): 18,
+    (1995, 6): 19,
+    (1995, 7): 20,
+    (1995, 8): 21,
+    (1995, 9): 22,
+    (1995, 10): 23,
+    (1995, 11): 24,
+    (1995, 12): 25,
+    (1996, 1): 26,
+    (1996, 2): 27,
+    (1996, 3): 28,
+    (1996, 4): 29,
+    (1996, 5): 30,
+    (1996, 6): 31,
+    (1996, 7): 32,
+    (1996, 8): 33,
+    (1996, 9): 34,
+    (1996, 10): 35,
+    (1996, 11): 36,
+    (1996, 12): 37,
+    (1997, 1): 38,
+    (1997, 2): 39,
+    (1997, 3): 40,
+    (1997, 4): 41,
+    (1997, 5): 42,
+    (1997, 6): 43,
+    (1997, 7): 44,
+    (1997, 8): 45,
+    (1997, 9): 46,
+    (1997, 10): 47,
+    (1997, 11): 48,
+    (1997, 12): 49,
+    (1998, 1): 50,
+    (1998, 2): 51,
+    (1998, 3): 52,
+    (1998, 4): 53,
+    (1998, 5): 54,
+    (1998, 6): 55,
+    (1998, 7): 56,
+    (1998, 8): 57,
+    (1998, 9): 58,
+    (1998, 10): 59,
+    (1998, 11): 60,
+    (1998, 12): 1,
+    (1999, 1): 2,
+    (1999, 2): 3,
+    (1999, 3): 4,
+    (1999, 4): 5,
+    (1999, 5): 6,
+    (1999, 6): 7,
+    (1999, 7): 8,
+    (1999, 8): 9,
+    (1999, 9): 10,
+    (1999, 10): 11,
+    (1999, 11): 12,
+    (1999, 12): 13,
+    (2000, 1): 14,
+    (2000, 2): 15,
+    (2000, 3): 16,
+    (2000, 4): 17,
+    (2000, 5): 18,
+    (2000, 6): 19,
+    (2000, 7): 20,
+    (2000, 8): 21,
+    (2000, 9): 22,
+    (2000, 10): 23,
+    (2000, 11): 24,
+    (2000, 12): 25,
+    (2001, 1): 26,
+    (2001, 2): 27,
+    (2001, 3): 28,
+    (2001, 4): 29,
+    (2001, 5): 30,
+    (2001, 6): 31,
+    (2001, 7): 32,
+    (2001, 8): 33,
+    (2001, 9): 34,
+    (2001, 10): 35,
+    (2001, 11): 36,
+    (2001, 12): 37,
+    (2002, 1): 38,
+    (2002, 2): 39,
+    (2002, 3): 40,
+    (2002, 4): 41,
+    (2002, 5): 42,
+    (2002, 6): 43,
+    (2002, 7): 44,
+    (2002, 8): 45,
+    (2002, 9): 46,
+    (2002, 10): 47,
+    (2002, 11): 48,
+    (2002, 12): 49,
+    (2003, 1): 50,
+    (2003, 2): 51,
+    (2003, 3): 52,
+    (2003, 4): 53,
+    (2003, 5): 54,
+    (2003, 6): 55,
+    (2003, 7): 56,
+    (2003, 8): 57,
+    (2003, 9): 58,
+    (2003, 10): 59,
+    (2003, 11): 60,
+    (2003, 12): 1,
+    (2004, 1): 2,
+    (2004, 2): 3,
+    (2004, 3): 4,
+    (2004, 4): 5,
+    (2004, 5): 6,
+    (2004, 6): 7,
+    (2004, 7): 8,
+    (2004, 8): 9,
+    (2004, 9): 10,
+    (2004, 10): 11,
+    (2004, 11): 12,
+    (2004, 12): 13,
+    (2005, 1): 14,
+    (2005, 2): 15,
+    (2005, 3): 16,
+    (2005, 4): 17,
+    (2005, 5): 18,
+    (2005, 6): 19,
+    (2005, 7): 20,
+    (2005, 8): 21,
+    (2005, 9): 22,
+    (2005, 10): 23,
+    (2005, 11): 24,
+    (2005, 12): 25,
+    (2006, 1): 26,
+    (2006, 2): 27,
+    (2006, 3): 28,
+    (2006, 4): 29,
+    (2006, 5): 30,
+    (2006, 6): 31,
+    (2006, 7): 32,
+    (2006, 8): 33,
+    (2006, 9): 34,
+    (2006, 10): 35,
+    (2006, 11): 36,
+    (2006, 12): 37,
+    (2007, 1): 38,
+    (2007, 2): 39,
+    (2007, 3): 40,
+    (2007, 4): 41,
+    (2007, 5): 42,
+    (2007, 6): 43,
+    (2007, 7): 44,
+    (2007, 8): 45,
+    (2007, 9): 46,
+    (2007, 10): 47,
+    (2007, 11): 48,
+    (2007, 12): 49,
+    (2008, 1): 50,
+    (2008, 2): 51,
+    (2008, 3): 52,
+    (2008, 4): 53,
+    (2008, 5): 54,
+    (2008, 6): 55,
+    (2008, 7): 56,
+    (2008, 8): 57,
+    (2008, 9): 58,
+    (2008, 10): 59,
+    (2008, 11): 60,
+    (2008, 12): 1,
+    (2009, 1): 2,
+    (2009, 2): 3,
+    (2009, 3): 4,
+    (2009, 4): 5,
+    (2009, 5): 6,
+    (2009, 6): 7,
+    (2009, 7): 8,
+    (2009, 8): 9,
+    (2009, 9): 10,
+    (2009, 10): 11,
+    (2009, 11): 12,
+    (2009, 12): 13,
+    (2010, 1): 14,
+    (2010, 2): 15,
+    (2010, 3): 16,
+    (2010, 4): 17,
+    (2010, 5): 18,
+    (2010, 6): 19,
+    (2010, 7): 20,
+    (2010, 8): 21,
+    (2010, 9): 22,
+    (2010, 10): 23,
+    (2010, 11): 24,
+    (2010, 12): 25,
+    (2011, 1): 26,
+    (2011, 2): 27,
+    (2011, 3): 28,
+    (2011, 4): 29,
+    (2011, 5): 30,
+    (2011, 6): 31,
+    (2011, 7): 32,
+    (2011, 8): 33,
+    (2011, 9): 34,
+    (2011, 10): 35,
+    (2011, 11): 36,
+    (2011, 12): 37,
+    (2012, 1): 38,
+    (2012, 2): 39,
+    (2012, 3): 40,
+    (2012, 4): 41,
+    (2012, 5): 42,
+    (2012, 6): 43,
+    (2012, 7): 44,
+    (2012, 8): 45,
+    (2012, 9): 46,
+    (2012, 10): 47,
+    (2012, 11): 48,
+    (2012, 12): 49,
+    (2013, 1): 50,
+    (2013, 2): 51,
+    (2013, 3): 52,
+    (2013, 4): 53,
+    (2013, 5): 54,
+    (2013, 6): 55,
+    (2013, 7): 56,
+    (2013, 8): 57,
+    (2013, 9): 58,
+    (2013, 10): 59,
+    (2013, 11): 60,
+    (2013, 12): 1,
+    (2014, 1): 2,
+    (2014, 2): 3,
+    (2014, 3): 4,
+    (2014, 4): 5,
+    (2014, 5): 6,
+    (2014, 6): 7,
+    (2014, 7): 8,
+    (2014, 8): 9,
+    (2014, 9): 10,
+    (2014, 10): 11,
+    (2014, 11): 12,
+    (2014, 12): 13,
+    (2015, 1): 14,
+    (2015, 2): 15,
+    (2015, 3): 16,
+    (2015, 4): 17,
+    (2015, 5): 18,
+    (2015, 6): 19,
+    (2015, 7): 20,
+    (2015, 8): 21,
+    (2015, 9): 22,
+    (2015, 10): 23,
+    (2015, 11): 24,
+    (2015, 12): 25,
+    (2016, 1): 26,
+    (2016, 2): 27,
+    (2016, 3): 28,
+    (2016, 4): 29,
+    (2016, 5): 30,
+    (2016, 6): 31,
+    (2016, 7): 32,
+    (2016, 8): 33,
+    (2016, 9): 34,
+    (2016, 10): 35,
+    (2016, 11): 36,
+    (2016, 12): 37,
+    (2017, 1): 38,
+    (2017, 2): 39,
+    (2017, 3): 40,
+    (2017, 4): 41,
+    (2017, 5): 42,
+    (2017, 6): 43,
+    (2017, 7): 44,
+    (2017, 8): 45,
+    (2017, 9): 46,
+    (2017, 10): 47,
+    (2017, 11): 48,
+    (2017, 12): 49,
+    (2018, 1): 50,
+    (2018, 2): 51,
+    (2018, 3): 52,
+    (2018, 4): 53,
+    (2018, 5): 54,
+    (2018, 6): 55,
+    (2018, 7): 56,
+    (2018, 8): 57,
+    (2018, 9): 58,
+    (2018, 10): 59,
+    (2018, 11): 60,
+    (2018, 12): 1,
+    (2019, 1): 2,
+    (2019, 2): 3,
+    (2019, 3): 4,
+    (2019, 4): 5,
+    (2019, 5): 6,
+    (2019, 6): 7,
+    (2019, 7): 8,
+    (2019, 8): 9,
+    (2019, 9): 10,
+    (2019, 10): 11,
+    (2019, 11): 12,
+    (2019, 12): 13,
+    (2020, 1): 14,
+    (2020, 2): 15,
+    (2020, 3): 16,
+    (2020, 4): 17,
+    (2020, 5): 18,
+    (2020, 6): 19,
+    (2020, 7): 20,
+    (2020, 8): 21,
+    (2020, 9): 22,
+    (2020, 10): 23,
+    (2020, 11): 24,
+    (2020, 12): 25,
+    (2021, 1): 26,
+    (2021, 2): 27,
+    (2021, 3): 28,
+    (2021, 4): 29,
+    (2021, 5): 30,
+    (2021, 6): 31,
+    (2021, 7): 32,
+    (2021, 8): 33,
+    (2021, 9): 34,
+    (2021, 10): 35,
+    (2021, 11): 36,
+    (2021, 12): 37,
+    (2022, 1): 38,
+    (2022, 2): 39,
+    (2022, 3): 40,
+    (2022, 4): 41,
+    (2022, 5): 42,
+    (2022, 6): 43,
+    (2022, 7): 44,
+    (2022, 8): 45,
+    (2022, 9): 46,
+    (2022, 10): 47,
+    (2022, 11): 48,
+    (2022, 12): 49,
+    (2023, 1): 50,
+    (2023, 2): 51,
+    (2023, 3): 52,
+    (2023, 4): 53,
+    (2023, 5): 54,
+    (2023, 6): 55,
+    (2023, 7): 56,
+    (2023, 8): 57,
+    (2023, 9): 58,
+    (2023, 10): 59,
+    (2023, 11): 60,
+    (2023, 12): 1,
+    (2024, 1): 2,
+    (2024, 2): 3,
+    (2024, 3): 4,
+    (2024, 4): 5,
+    (2024, 5): 6,
+    (2024, 6): 7,
+    (2024, 7): 8,
+    (2024, 8): 9,
+    (2024, 9): 10,
+    (2024, 10): 11,
+    (2024, 11): 12,
+    (2024, 12): 13,
+    (2025, 1): 14,
+    (2025, 2): 15,
+    (2025, 3): 16,
+    (2025, 4): 17,
+    (2025, 5): 18,
+    (2025, 6): 19,
+    (2025, 7): 20,
+    (2025, 8): 21,
+    (2025, 9): 22,
+    (2025, 10): 23,
+    (2025, 11): 24,
+    (2025, 12): 25,
+    (2026, 1): 26,
+    (2026, 2): 27,
+    (2026, 3): 28,
+    (2026, 4): 29,
+    (2026, 5): 30,
+    (2026, 6): 31,
+    (2026, 7): 32,
+    (2026, 8): 33,
+    (2026, 9): 34,
+    (2026, 10): 35,
+    (2026, 11): 36,
+    (2026, 12): 37,
+    (2027, 1): 38,
+    (2027, 2): 39,
+    (2027, 3): 40,
+    (2027, 4): 41,
+    (2027, 5): 42,
+    (2027, 6): 43,
+    (2027, 7): 44,
+    (2027, 8): 45,
+    (2027, 9): 46,
+    (2027, 10): 47,
+    (2027, 11): 48,
+    (2027, 12): 49,
+    (2028, 1): 50,
+    (2028, 2): 51,
+    (2028, 3): 52,
+    (2028, 4): 53,
+    (2028, 5): 54,
+    (2028, 6): 55,
+    (2028, 7): 56,
+    (2028, 8): 57,
+    (2028, 9): 58,
+    (2028, 10): 59,
+    (2028, 11): 60,
+    (2028, 12): 1,
+    (2029, 1): 2,
+    (2029, 2): 3,
+    (2029, 3): 4,
+    (2029, 4): 5,
+    (2029, 5): 6,
+    (2029, 6): 7,
+    (2029, 7): 8,
+    (2029, 8): 9,
+    (2029, 9): 10,
+    (2029, 10): 11,
+    (2029, 11): 12,
+    (2029, 12): 13,
+    (2030, 1): 14,
+    (2030, 2): 15,
+    (2030, 3): 16,
+    (2030, 4): 17,
+    (2030, 5): 18,
+    (2030, 6): 19,
+    (2030, 7): 20,
+    (2030, 8): 21,
+    (2030, 9): 22,
+    (2030, 10): 23,
+    (2030, 11): 24,
+    (2030, 12): 25,
+    (2031, 1): 26,
+    (2031, 2): 27,
+    (2031, 3): 28,
+    (2031, 4): 29,
+    (2031, 5): 30,
+    (2031, 6): 31,
+    (2031, 7): 32,
+    (2031, 8): 33,
+    (2031, 9): 34,
+    (2031, 10): 35,
+    (2031, 11): 36,
+    (2031, 12): 37,
+    (2032, 1): 38,
+    (2032, 2): 39,
+    (2032, 3): 40,
+    (2032, 4): 41,
+    (2032, 5): 42,
+    (2032, 6): 43,
+    (2032, 7): 44,
+    (2032, 8): 45,
+    (2032, 9): 46,
+    (2032, 10): 47,
+    (2032, 11): 48,
+    (2032, 12): 49,
+    (2033, 1): 50,
+    (2033, 2): 51,
+    (2033, 3): 52,
+    (2033, 4): 53,
+    (2033, 5): 54,
+    (2033, 6): 55,
+    (2033, 7): 56,
+    (2033, 8): 57,
+    (2033, 9): 58,
+    (2033, 10): 59,
+    (2033, 11): 60,
+    (2033, 12): 1,
+}
@@ -0,0 +1,175 @@
+# sanmeigaku_core/month_table.py
+# month_kanshi_index_dict（月干支）と kanshi_index_table（日干支の月数値）を
+# 起動時に1回だけ正規化して、(年-基準年)*12 + (月-1) で引ける平坦な配列にまとめる。
+# キー形・値形の揺れ（(y,m) / {y:{m:}} / "YYYY-MM" / "YYYYMM"、dict の idx/index/... など）や
+# 0→60・文字列→int の丸めはここで済ませ、計算側は添字を引くだけにする。
+# 形式の不備は import 時に ValueError でまとめて報告する（黙って前月フォールバックしない）。
+# 通常は data_pack のバイナリパック（mmap）から読み、原本の辞書モジュールは import しない。
+
+from array import array
+
+_IDX_KEYS = ("idx", "index", "value", "this")
+_START_KEYS = ("start_day", "start", "boundary")
+_PREV_KEYS = ("prev_idx", "prev", "before")
+
+
+def _to_int(v):
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return None
+
+
+def _norm_kanshi_idx(v):
+    """1..60 に丸める（0→60）。数値にならなければ None。"""
+    i = _to_int(v)
+    if i is None:
+        return None
+    return ((i - 1) % 60) + 1 if i else 60
+
+
+def _first(src: dict, keys):
+    for k in keys:
+        v = src.get(k)
+        if v:
+            return v
+    return None
+
+
+def _iter_year_month(table: dict, problems: list, name: str):
+    """キー形の揺れを吸収して ((年, 月), 値) を返す。"""
+    for key, v in table.items():
+        if isinstance(key, tuple) and len(key) == 2:
+            y, m = _to_int(key[0]), _to_int(key[1])
+            if y is not None and m is not None:
+                yield (y, m), v
+                continue
+        elif isinstance(v, dict) and _to_int(key) is not None and not any(k in v for k in _IDX_KEYS):
+            # {年: {月: 値}}
+            for m, mv in v.items():
+                if _to_int(m) is None:
+                    problems.append(f"{name}[{key!r}]: 月キーが数値ではありません: {m!r}")
+                    continue
+                yield (int(key), int(m)), mv
+            continue
+        elif isinstance(key, str):
+            s = key.replace("-", "")
+            if len(s) == 6 and s.isdigit():
+                yield (int(s[:4]), int(s[4:])), v
+                continue
+        problems.append(f"{name}: 解釈できないキーです: {key!r}")
+
+
+class MonthTable:
+    """
+    年月ごとの月干支・日干支アンカーを保持する平坦な表（値 0 は「なし」）。
+      idx        : 当月（節入り以後）の月干支idx
+      start_day  : 節入り日（無ければ 0）
+      prev_idx   : 節入り前の月干支idx（無ければ 0）
+      day_anchor : kanshi_index_table の月数値（1..60）
+    """
+
+    __slots__ = ("base_year", "last_year", "idx", "start_day", "prev_idx", "day_anchor")
+
+    def __init__(self, base_year: int, last_year: int, idx, start_day, prev_idx, day_anchor):
+        self.base_year = base_year
+        self.last_year = last_year
+        self.idx = idx
+        self.start_day = start_day
+        self.prev_idx = prev_idx
+        self.day_anchor = day_anchor
+
+    def key(self, y: int, m: int) -> int:
+        """(年, 月) → 配列の添字。範囲外は -1。"""
+        if self.base_year <= y <= self.last_year and 1 <= m <= 12:
+            return (y - self.base_year) * 12 + (m - 1)
+        return -1
+
+    def entry(self, y: int, m: int):
+        """(this_idx, start_day, prev_idx)。無い項目は None。"""
+        k = self.key(y, m)
+        if k < 0:
+            return None, None, None
+        return (self.idx[k] or None), (self.start_day[k] or None), (self.prev_idx[k] or None)
+
+    def month_index(self, y: int, m: int):
+        k = self.key(y, m)
+        return (self.idx[k] or None) if k >= 0 else None
+
+    def anchor(self, y: int, m: int):
+        k = self.key(y, m)
+        return (self.day_anchor[k] or None) if k >= 0 else None
+
+
+def load_month_table(month_dict=None, day_table=None) -> MonthTable:
+    """2つの辞書を正規化・検証して MonthTable を作る。不備があれば ValueError。"""
+    if month_dict is None:
+        from .month_kanshi_index_dict import month_kanshi_index_dict as month_dict
+    if day_table is None:
+        from .day_kanshi_dict import kanshi_index_table as day_table
+    problems = []
+    months = {}
+    for (y, m), src in _iter_year_month(month_dict, problems, "month_kanshi_index_dict"):
+        if isinstance(src, dict):
+            idx = _norm_kanshi_idx(_first(src, _IDX_KEYS))
+            sd = _first(src, _START_KEYS)
+            start_day = _to_int(sd) if sd is not None else None
+            pv = _first(src, _PREV_KEYS)
+            prev_idx = _norm_kanshi_idx(pv) if pv is not None else None
+            if sd is not None and not (start_day and 1 <= start_day <= 31):
+                problems.append(f"month_kanshi_index_dict[{y},{m}]: start_day が不正です: {sd!r}")
+            if pv is not None and prev_idx is None:
+                problems.append(f"month_kanshi_index_dict[{y},{m}]: prev_idx が不正です: {pv!r}")
+        else:
+            idx, start_day, prev_idx = _norm_kanshi_idx(src), None, None
+        if idx is None:
+            problems.append(f"month_kanshi_index_dict[{y},{m}]: 月干支idxが不正です: {src!r}")
+        months[(y, m)] = (idx or 0, start_day or 0, prev_idx or 0)
+
+    anchors = {}
+    for (y, m), v in _iter_year_month(day_table, problems, "kanshi_index_table"):
+        a = _norm_kanshi_idx(v)
+        if a is None:
+            problems.append(f"kanshi_index_table[{y},{m}]: 月数値が不正です: {v!r}")
+        anchors[(y, m)] = a or 0
+
+    for (y, m) in list(months) + list(anchors):
+        if not 1 <= m <= 12:
+            problems.append(f"({y}, {m}): 月が 1..12 の範囲外です")
+
+    years = [y for (y, _) in months] + [y for (y, _) in anchors]
+    if not years:
+        problems.append("月干支・日干支のデータが空です")
+    if problems:
+        raise ValueError("月干支テーブルの形式に問題があります:\n  " + "\n  ".join(problems))
+
+    base, last = min(years), max(years)
+    n = (last - base + 1) * 12
+    idx, start_day, prev_idx, day_anchor = (array("B", bytes(n)) for _ in range(4))
+    for (y, m), (i, sd, pv) in months.items():
+        k = (y - base) * 12 + (m - 1)
+        idx[k], start_day[k], prev_idx[k] = i, sd, pv
+    for (y, m), a in anchors.items():
+        day_anchor[(y - base) * 12 + (m - 1)] = a
+
+    # 範囲内の欠損月（そのままだと前月フォールバックに落ちる）も import 時に報告する
+    missing = [(base + k // 12, k % 12 + 1) for k in range(n) if not (idx[k] and day_anchor[k])]
+    if missing:
+        raise ValueError(f"月干支テーブルに欠損があります: {missing[:10]}{' ...' if len(missing) > 10 else ''}")
+
+    return MonthTable(base, last, idx, start_day, prev_idx, day_anchor)
+
+
+def _load_default() -> MonthTable:
+    """パック（原本が変わっていれば作り直したもの）の各列をそのまま使う。"""
+    from .data_pack import load_pack
+    p = load_pack()
+    return MonthTable(p.base_year, p.last_year, p.idx, p.start_day, p.prev_idx, p.day_anchor)
+
+
+def __getattr__(name):
+    # 互換: month_table.MONTH_TABLE は初回アクセス時に読み込む
+    if name == "MONTH_TABLE":
+        from .data_access import get_month_table
+        return get_month_table()
+    raise AttributeError(name)
@@ -0,0 +1,94 @@
+# sanmeigaku_core/periods.py
+# 生年月日から、これから来る「年の天中殺」「月の天中殺」の期間（節入り日〜次の節入りの前日）を順に返す。
+# 天中殺グループ（日干支から決まる2つの支）に当たる年・月を支の周期から直接求め、
+# 境目は節入り日（sekki_index.jie_date）で決める。1日ずつ調べないので、100年先まででも数百回の計算で済む。
+#
+#   for p in tenchusatsu_periods("1985-02-03", years=12):
+#       print(p["kind"], p["start"], p["end"], p["label"])
+
+from datetime import date, timedelta
+from heapq import merge
+
+from .kanshi_core import _as_date, day_kanshi_index, tenchusatsu_from_index
+from .sekki_index import SEKKI_MONTH_BRANCHES, JIE_NAMES, jie_date
+from .kanshi_type import BRANCHES
+_YEAR_ZI = 1984  # 甲子の年（子年）
+_ONE_DAY = timedelta(days=1)
+
+
+def group_of(birth_date) -> str:
+    """生年月日の天中殺グループ（例: "戌亥"）。"""
+    return tenchusatsu_from_index(day_kanshi_index(birth_date))
+
+
+def _sekki_year_of(d: date) -> int:
+    """d が属する節年（立春で切り替わる年）。"""
+    return d.year if d >= jie_date(d.year, 1) else d.year - 1
+
+
+def _next_month(sekki_year: int, sekki_month: int):
+    return (sekki_year + 1, 1) if sekki_month == 12 else (sekki_year, sekki_month + 1)
+
+
+def _year_periods(group: str, first_year: int):
+    """first_year 以降の年の天中殺（2年続き）を古い順に、終わりなく返す。"""
+    b = BRANCHES.index(group[0])
+    y = first_year + (b - (first_year - _YEAR_ZI)) % 12
+    # first_year が2年目（後ろの支）に当たるときは、その前年から始まる期間も含める
+    if (first_year - _YEAR_ZI) % 12 == (b + 1) % 12:
+        y = first_year - 1
+    while True:
+        yield {
+            "kind": "year",
+            "group": group,
+            "start": jie_date(y, 1),
+            "end": jie_date(y + 2, 1) - _ONE_DAY,
+            "label": f"{y}年・{y + 1}年（{group[0]}年・{group[1]}年）",
+            "sekki": (JIE_NAMES[1], JIE_NAMES[1]),
+        }
+        y += 12
+
+
+def _month_periods(group: str, first_year: int):
+    """first_year 以降の月の天中殺（毎年2か月続き）を古い順に、終わりなく返す。"""
+    m1 = SEKKI_MONTH_BRANCHES.index(group[0]) + 1   # 節月（1=寅月）
+    y = first_year - 1  # 前年の子丑月（翌年の立春まで続く）が first_year にかかることがある
+    while True:
+        ey, em = _next_month(*_next_month(y, m1))
+        yield {
+            "kind": "month",
+            "group": group,
+            "start": jie_date(y, m1),
+            "end": jie_date(ey, em) - _ONE_DAY,
+            "label": f"{group[0]}月・{group[1]}月",
+            "sekki": (JIE_NAMES[m1 % 12], JIE_NAMES[em % 12]),
+        }
+        y += 1
+
+
+def tenchusatsu_periods(birth_date, years: int = 12, start=None, kinds=("year", "month")):
+    """
+    birth_date の人の天中殺期間を、start（既定: 今日）から years 年先までジェネレータで返す。
+    start の時点で続いている期間も含む。年・月の期間は開始日の順に混ぜて返す。
+    各要素は dict: kind（year / month）, group, start, end（両端含む date）, label,
+      sekki（始まりの節の名前, 終わり〈翌日〉の節の名前）
+    """
+    if years < 0:
+        raise ValueError(f"years は 0 以上です: {years}")
+    group = group_of(birth_date)
+    since = _as_date(start) if start is not None else date.today()
+    until = date(since.year + years, since.month, 28 if (since.month, since.day) == (2, 29) else since.day)
+    first_year = _sekki_year_of(since)
+
+    sources = []
+    if "year" in kinds:
+        sources.append(_year_periods(group, first_year))
+    if "month" in kinds:
+        sources.append(_month_periods(group, first_year))
+
+    for p in merge(*sources, key=lambda p: p["start"]):
+        if p["start"] > until:
+            return
+        if p["end"] >= since:
+            yield p
+
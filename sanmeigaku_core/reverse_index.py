@@ -0,0 +1,113 @@
+# sanmeigaku_core/reverse_index.py
+# 干支 → 日付 の逆引き索引。「この期間で甲子の日は？」「1990年代の戌亥天中殺の誕生日は？」に答える。
+# calendar_engine の展開済みカレンダー表から、干支idx（年・月・日）と天中殺グループごとに
+# 昇順の ordinal 配列を一度だけ作り、期間の絞り込みは bisect で端を探すだけにする。
+#
+#   python -m sanmeigaku_core.reverse_index 甲子 1990-01-01 1990-12-31
+#   python -m sanmeigaku_core.reverse_index 戌亥 1990-01-01 1999-12-31 --kind group --count
+
+import argparse
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from functools import lru_cache
+
+from .kanshi_core import _as_date
+from .kanshi_type import Kanshi, TENCHUSATSU_GROUPS
+from .calendar_engine import get_engine
+KINDS = ("day", "month", "year", "group")
+
+
+class ReverseIndex:
+    """
+    kind（day / month / year / group）と値から、その日付の ordinal 配列（昇順）を引く。
+    値は干支名（"甲子"）か干支idx（1..60）、group は天中殺グループ名（"戌亥"）。
+    """
+
+    __slots__ = ("start", "end", "_lists")
+
+    def __init__(self, engine=None):
+        engine = engine or get_engine()
+        self.start, self.end = engine.start, engine.end
+        base = engine.start.toordinal()
+        # ordinal は 1600〜2200 年で 60 万〜80 万なので int32 で足りる
+        self._lists = {kind: [array("i") for _ in range(61 if kind != "group" else 6)] for kind in KINDS}
+        day, month, year, group = (self._lists[k] for k in KINDS)
+        for i, (y, m, d) in enumerate(zip(engine.year_idx, engine.month_idx, engine.day_idx)):
+            o = base + i
+            day[d].append(o)
+            month[m].append(o)
+            year[y].append(o)
+            group[(d - 1) // 10].append(o)
+
+    @staticmethod
+    def _key(kind: str, value) -> int:
+        if kind not in KINDS:
+            raise ValueError(f"kind は {', '.join(KINDS)} のいずれかです: {kind}")
+        if kind == "group":
+            if value in TENCHUSATSU_GROUPS:
+                return TENCHUSATSU_GROUPS.index(value)
+            raise ValueError(f"天中殺グループが不明です: {value}")
+        if isinstance(value, str) and value.isdigit():
+            value = int(value)
+        return int(Kanshi(value))
+
+    def _slice(self, kind: str, value, start=None, end=None):
+        key = self._key(kind, value)  # 不明な kind はここで ValueError（_lists を引く前に）
+        ords = self._lists[kind][key]
+        lo = bisect_left(ords, _as_date(start).toordinal()) if start is not None else 0
+        hi = bisect_right(ords, _as_date(end).toordinal()) if end is not None else len(ords)
+        return ords, lo, hi
+
+    def ordinals(self, kind: str, value, start=None, end=None) -> array:
+        """start〜end（両端含む、省略時は全範囲）の該当日の ordinal（array('i') のコピー）。"""
+        ords, lo, hi = self._slice(kind, value, start, end)
+        return ords[lo:hi]
+
+    def dates(self, kind: str, value, start=None, end=None) -> list:
+        """start〜end（両端含む）の該当日（date のリスト、昇順）。"""
+        ords, lo, hi = self._slice(kind, value, start, end)
+        return [date.fromordinal(ords[i]) for i in range(lo, hi)]
+
+    def count(self, kind: str, value, start=None, end=None) -> int:
+        """該当日の数（日付を作らずに bisect の差だけで数える）。"""
+        _, lo, hi = self._slice(kind, value, start, end)
+        return max(hi - lo, 0)
+
+
+@lru_cache(maxsize=None)
+def get_reverse_index() -> ReverseIndex:
+    """プロセス内で1回だけ構築して使い回す。"""
+    return ReverseIndex()
+
+
+def find_dates(value, start=None, end=None, kind: str = "day") -> list:
+    """干支（または天中殺グループ）に当たる日付のリスト。"""
+    return get_reverse_index().dates(kind, value, start, end)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m sanmeigaku_core.reverse_index", description="干支・天中殺グループから日付を逆引きする")
+    parser.add_argument("value", help="干支名・干支idx（1..60）、または天中殺グループ名")
+    parser.add_argument("start", nargs="?", help="期間の開始日（省略時は対応範囲の最初）")
+    parser.add_argument("end", nargs="?", help="期間の終了日（省略時は対応範囲の最後）")
+    parser.add_argument("--kind", choices=KINDS, help="day / month / year / group（既定: 値がグループ名なら group、それ以外は day）")
+    parser.add_argument("--count", action="store_true", help="件数だけ表示する")
+    args = parser.parse_args(argv)
+
+    kind = args.kind or ("group" if args.value in TENCHUSATSU_GROUPS else "day")
+    try:
+        if args.count:
+            print(get_reverse_index().count(kind, args.value, args.start, args.end))
+        else:
+            for d in get_reverse_index().dates(kind, args.value, args.start, args.end):
+                print(d.isoformat())
+    except (TypeError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+import datetime
+
+# 立春データ（1925〜2033年）
+risshun_dict = {
+    1900: datetime.date(1900, 2, 4), 1901: datetime.date(1901, 2, 4), 1902: datetime.date(1902, 2, 5),
+    1903: datetime.date(1903, 2, 5), 1904: datetime.date(1904, 2, 5), 1905: datetime.date(1905, 2, 4),
+    1906: datetime.date(1906, 2, 5), 1907: datetime.date(1907, 2, 5), 1908: datetime.date(1908, 2, 5),
+    1909: datetime.date(1909, 2, 4), 1910: datetime.date(1910, 2, 5), 1911: datetime.date(1911, 2, 5),
+    1912: datetime.date(1912, 2, 5), 1913: datetime.date(1913, 2, 4), 1914: datetime.date(1914, 2, 5),
+    1915: datetime.date(1915, 2, 5), 1916: datetime.date(1916, 2, 5), 1917: datetime.date(1917, 2, 4),
+    1918: datetime.date(1918, 2, 4), 1919: datetime.date(1919, 2, 5), 1920: datetime.date(1920, 2, 5),
+    1921: datetime.date(1921, 2, 4), 1922: datetime.date(1922, 2, 5), 1923: datetime.date(1923, 2, 5),
+    1924: datetime.date(1924, 2, 5),
+    1925: datetime.date(1925, 2, 4), 1926: datetime.date(1926, 2, 5), 1927: datetime.date(1927, 2, 4),
+    1928: datetime.date(1928, 2, 5), 1929: datetime.date(1929, 2, 4), 1930: datetime.date(1930, 2, 4),
+    1931: datetime.date(1931, 2, 4), 1932: datetime.date(1932, 2, 5), 1933: datetime.date(1933, 2, 4),
+    1934: datetime.date(1934, 2, 4), 1935: datetime.date(1935, 2, 4), 1936: datetime.date(1936, 2, 5),
+    1937: datetime.date(1937, 2, 4), 1938: datetime.date(1938, 2, 4), 1939: datetime.date(1939, 2, 4),
+    1940: datetime.date(1940, 2, 5), 1941: datetime.date(1941, 2, 4), 1942: datetime.date(1942, 2, 4),
+    1943: datetime.date(1943, 2, 4), 1944: datetime.date(1944, 2, 5), 1945: datetime.date(1945, 2, 4),
+    1946: datetime.date(1946, 2, 4), 1947: datetime.date(1947, 2, 4), 1948: datetime.date(1948, 2, 5),
+    1949: datetime.date(1949, 2, 4), 1950: datetime.date(1950, 2, 4), 1951: datetime.date(1951, 2, 4),
+    1952: datetime.date(1952, 2, 5), 1953: datetime.date(1953, 2, 4), 1954: datetime.date(1954, 2, 4),
+    1955: datetime.date(1955, 2, 4), 1956: datetime.date(1956, 2, 5), 1957: datetime.date(1957, 2, 4),
+    1958: datetime.date(1958, 2, 4), 1959: datetime.date(1959, 2, 4), 1960: datetime.date(1960, 2, 5),
+    1961: datetime.date(1961, 2, 4), 1962: datetime.date(1962, 2, 4), 1963: datetime.date(1963, 2, 4),
+    1964: datetime.date(1964, 2, 5), 1965: datetime.date(1965, 2, 4), 1966: datetime.date(1966, 2, 4),
+    1967: datetime.date(1967, 2, 4), 1968: datetime.date(1968, 2, 5), 1969: datetime.date(1969, 2, 4),
+    1970: datetime.date(1970, 2, 4), 1971: datetime.date(1971, 2, 4), 1972: datetime.date(1972, 2, 5),
+    1973: datetime.date(1973, 2, 4), 1974: datetime.date(1974, 2, 4), 1975: datetime.date(1975, 2, 4),
+    1976: datetime.date(1976, 2, 5), 1977: datetime.date(1977, 2, 4), 1978: datetime.date(1978, 2, 4),
+    1979: datetime.date(1979, 2, 4), 1980: datetime.date(1980, 2, 5), 1981: datetime.date(1981, 2, 4),
+    1982: datetime.date(1982, 2, 4), 1983: datetime.date(1983, 2, 4), 1984: datetime.date(1984, 2, 5),
+    1985: datetime.date(1985, 2, 4), 1986: datetime.date(1986, 2, 4), 1987: datetime.date(1987, 2, 4),
+    1988: datetime.date(1988, 2, 4), 1989: datetime.date(1989, 2, 4), 1990: datetime.date(1990, 2, 4),
+    1991: datetime.date(1991, 2, 4), 1992: datetime.date(1992, 2, 4), 1993: datetime.date(1993, 2, 4),
+    1994: datetime.date(1994, 2, 4), 1995: datetime.date(1995, 2, 4), 1996: datetime.date(1996, 2, 4),
+    1997: datetime.date(1997, 2, 4), 1998: datetime.date(1998, 2, 4), 1999: datetime.date(1999, 2, 4),
+    2000: datetime.date(2000, 2, 4), 2001: datetime.date(2001, 2, 4), 2002: datetime.date(2002, 2, 4),
+    2003: datetime.date(2003, 2, 4), 2004: datetime.date(2004, 2, 4), 2005: datetime.date(2005, 2, 4),
+    2006: datetime.date(2006, 2, 4), 2007: datetime.date(2007, 2, 4), 2008: datetime.date(2008, 2, 4),
+    2009: datetime.date(2009, 2, 4), 2010: datetime.date(2010, 2, 4), 2011: datetime.date(2011, 2, 4),
+    2012: datetime.date(2012, 2, 4), 2013: datetime.date(2013, 2, 4), 2014: datetime.date(2014, 2, 4),
+    2015: datetime.date(2015, 2, 4), 2016: datetime.date(2016, 2, 4), 2017: datetime.date(2017, 2, 4),
+    2018: datetime.date(2018, 2, 4), 2019: datetime.date(2019, 2, 4), 2020: datetime.date(2020, 2, 4),
+    2021: datetime.date(2021, 2, 3), 2022: datetime.date(2022, 2, 4), 2023: datetime.date(2023, 2, 4),
+    2024: datetime.date(2024, 2, 4), 2025: datetime.date(2025, 2, 3), 2026: datetime.date(2026, 2, 4),
+    2027: datetime.date(2027, 2, 4), 2028: datetime.date(2028, 2, 4), 2029: datetime.date(2029, 2, 3),
+    2030: datetime.date(2030, 2, 4), 2031: datetime.date(2031, 2, 3), 2032: datetime.date(2032, 2, 4),
+    2033: datetime.date(2033, 2, 3)
+}
@@ -0,0 +1,141 @@
+# sanmeigaku_core/sekki_index.py
+# 節入り（12の「節」）の日付を昇順の ordinal 配列にまとめ、bisect で月柱（と立春基準の年）を決める。
+#   日付 → (節月, 月干支idx, 節入りからの日数)
+# 節月は 1=寅月（立春〜）… 11=子月（大雪〜）, 12=丑月（小寒〜）。
+# 節入り日は solar_terms の計算値（データパックに保存済み）。立春だけは年干支と揃えるため
+# risshun_dict の日付を優先する。月干支idxは「1900年の寅月＝戊寅(15)」からの通し番号で求める。
+
+from array import array
+from bisect import bisect_right
+from datetime import date
+from functools import lru_cache
+
+from . import kanshi_core
+from .kanshi_core import RANGE_START, RANGE_END, _as_date, kanshi_name
+from .data_access import get_risshun_date, get_risshun_dict, get_sekki_dates
+from .solar_terms import SEKKI_NAMES, RISSHUN
+from .metrics import instrument
+
+# 節気（小寒〜冬至の24個）のうち月の境目になる「節」の位置と、その節で始まる節月
+JIE_POSITIONS = tuple(range(0, 24, 2))               # 小寒, 立春, 啓蟄, ... 大雪
+JIE_NAMES = tuple(SEKKI_NAMES[k] for k in JIE_POSITIONS)
+SEKKI_MONTH_BRANCHES = ("寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥", "子", "丑")
+
+_ANCHOR_YEAR, _ANCHOR_IDX = 1900, 15  # 1900年 寅月 = 戊寅
+
+
+def month_pillar_index(sekki_year: int, sekki_month: int) -> int:
+    """節年（立春で始まる年）と節月から月干支idx（1..60）。"""
+    months = (sekki_year - _ANCHOR_YEAR) * 12 + (sekki_month - 1)
+    return ((_ANCHOR_IDX - 1 + months) % 60) + 1
+
+
+def jie_date(sekki_year: int, sekki_month: int) -> date:
+    """
+    節年・節月が始まる節入り日（索引を使わず節気の日付から直接）。
+    1..11 月は当年の立春〜大雪、12 月（丑月）は翌年の小寒。立春は risshun_dict を優先。
+    """
+    if not 1 <= sekki_month <= 12:
+        raise ValueError(f"節月は 1..12 です: {sekki_month}")
+    if sekki_month == 1:
+        return get_risshun_date(sekki_year)
+    if sekki_month == 12:
+        return get_sekki_dates(sekki_year + 1)[JIE_POSITIONS[0]]
+    return get_sekki_dates(sekki_year)[JIE_POSITIONS[sekki_month]]
+
+
+class SekkiIndex:
+    """
+    節入りの ordinal（昇順）と、その節で始まる節年・節月・月干支idxの並列配列。
+    節年は立春で切り替わる年なので、年干支もこの配列から引ける。
+    resolve() は範囲外の日付で ValueError。
+    """
+
+    __slots__ = ("start", "end", "ordinals", "years", "months", "pillars", "names")
+
+    def __init__(self, start: date = RANGE_START, end: date = RANGE_END):
+        self.start, self.end = start, end
+        self.ordinals = array("l")
+        self.years = array("H")
+        self.months = array("B")
+        self.pillars = array("B")
+        self.names = []
+        risshun = get_risshun_dict()
+        lo, hi = start.toordinal(), end.toordinal()
+
+        # 開始日の直前の節（前年12月の大雪）から、終了日までの節を並べる
+        for y in range(start.year - 1, end.year + 1):
+            dates = get_sekki_dates(y)
+            for pos in JIE_POSITIONS:
+                d = dates[pos]
+                if pos == RISSHUN and y in risshun:
+                    d = risshun[y]
+                if d.toordinal() > hi:
+                    break
+                # 小寒は前の節年の丑月、それ以外は当年の節月
+                sekki_month = 12 if pos == 0 else pos // 2
+                sekki_year = y - 1 if pos == 0 else y
+                self.ordinals.append(d.toordinal())
+                self.years.append(sekki_year)
+                self.months.append(sekki_month)
+                self.pillars.append(month_pillar_index(sekki_year, sekki_month))
+                self.names.append(SEKKI_NAMES[pos])
+
+        # 開始日より前の節は、開始日を含む1つを残して捨てる
+        first = max(bisect_right(self.ordinals, lo) - 1, 0)
+        for col in (self.ordinals, self.years, self.months, self.pillars, self.names):
+            del col[:first]
+        if not self.ordinals or self.ordinals[0] > lo:
+            raise ValueError(f"節入りデータが不足しています: {start}")
+
+    def _find(self, birth_date):
+        d = _as_date(birth_date)
+        o = d.toordinal()
+        if not self.start <= d <= self.end:
+            raise ValueError(f"対応範囲外の日付です: {d}（{self.start}〜{self.end}）")
+        return bisect_right(self.ordinals, o) - 1, o
+
+    def resolve(self, birth_date):
+        """(節月, 月干支idx, 節入りからの日数)。節入り当日は 0。"""
+        i, o = self._find(birth_date)
+        return self.months[i], self.pillars[i], o - self.ordinals[i]
+
+    def month_index(self, birth_date) -> int:
+        """月干支idxだけ（resolve からタプルを作らない版）。"""
+        return self.pillars[self._find(birth_date)[0]]
+
+    @instrument("SekkiIndex.boundary")
+    def boundary(self, birth_date):
+        """その日が属する節月の (節入り日, 節の名前)。"""
+        i, _ = self._find(birth_date)
+        return date.fromordinal(self.ordinals[i]), self.names[i]
+
+
+@lru_cache(maxsize=None)
+def get_sekki_index() -> SekkiIndex:
+    """プロセス内で1回だけ構築して使い回す。"""
+    return SekkiIndex()
+
+
+def resolve_month(birth_date):
+    """(節月, 月干支idx, 節入りからの日数)"""
+    return get_sekki_index().resolve(birth_date)
+
+
+def get_month_kanshi_by_sekki(birth_date, trace: bool | None = None):
+    """
+    節入り基準の月干支。戻り値の形は get_month_kanshi と同じ (干支名, index, debug)。
+    debug は trace（既定は kanshi_core.TRACE）のときだけ、それ以外は None。
+    """
+    si = get_sekki_index()
+    i, o = si._find(birth_date)
+    idx = si.pillars[i]
+    if not (trace or (trace is None and kanshi_core.TRACE)):
+        return kanshi_name(idx), idx, None
+    return kanshi_name(idx), idx, {
+        "rule": "sekki",
+        "sekki": si.names[i],
+        "start": date.fromordinal(si.ordinals[i]),
+        "month": f"{SEKKI_MONTH_BRANCHES[si.months[i] - 1]}月",
+        "days_since": o - si.ordinals[i],
+    }
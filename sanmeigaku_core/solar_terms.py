@@ -0,0 +1,285 @@
+# sanmeigaku_core/solar_terms.py
+# 二十四節気の瞬間を太陽黄経から計算する（テーブル不要・任意の年に対応）。
+# 太陽の位置は Meeus『Astronomical Algorithms』の短縮 VSOP87（地球 L0..L5, R0..R1）に
+# FK5 補正・章動（簡易式）・光行差を加えた視黄経。精度はおおむね 1 秒角（≒ 30 秒）。
+# 時刻は TT で求めてから ΔT（Espenak–Meeus 多項式）で UT に直し、日本時間（UT+9h）の日付にする。
+#
+#   from solar_terms import sekki_dates
+#   sekki_dates(2025)[2]   # 立春 → date(2025, 2, 3)
+#
+# 年ごとの結果はメモ化する。NumPy があれば複数年まとめて（sekki_table）ベクトル計算する。
+#
+#   python -m sanmeigaku_core.solar_terms   # risshun_dict との突き合わせ（精度チェック）
+
+import math
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+try:  # NumPy は任意（複数年をまとめて計算するときだけ使う）
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# グレゴリオ暦の1年の中での並び（小寒から冬至まで）。黄経は (285 + 15*k) % 360 度
+SEKKI_NAMES = (
+    "小寒", "大寒", "立春", "雨水", "啓蟄", "春分",
+    "清明", "穀雨", "立夏", "小満", "芒種", "夏至",
+    "小暑", "大暑", "立秋", "処暑", "白露", "秋分",
+    "寒露", "霜降", "立冬", "小雪", "大雪", "冬至",
+)
+SEKKI_LONGITUDES = tuple((285 + 15 * k) % 360 for k in range(24))
+RISSHUN = SEKKI_NAMES.index("立春")
+
+JST_OFFSET_HOURS = 9
+_J2000 = 2451545.0
+_TROPICAL_YEAR = 365.242189
+_ORD_TO_JD = 1721424.5  # date.toordinal() → その日 0時UT のユリウス日
+
+# ---------------- 短縮 VSOP87（地球、日心黄経 L と動径 R） ----------------
+# 各項 (A, B, C) → A * cos(B + C * τ)、τ は J2000 からのユリウス千年
+_L0 = (
+    (175347046, 0, 0), (3341656, 4.6692568, 6283.07585), (34894, 4.6261, 12566.1517),
+    (3497, 2.7441, 5753.3849), (3418, 2.8289, 3.5231), (3136, 3.6277, 77713.7715),
+    (2676, 4.4181, 7860.4194), (2343, 6.1352, 3930.2097), (1324, 0.7425, 11506.7698),
+    (1273, 2.0371, 529.691), (1199, 1.1096, 1577.3435), (990, 5.233, 5884.927),
+    (902, 2.045, 26.298), (857, 3.508, 398.149), (780, 1.179, 5223.694),
+    (753, 2.533, 5507.553), (505, 4.583, 18849.228), (492, 4.205, 775.523),
+    (357, 2.92, 0.067), (317, 5.849, 11790.629), (284, 1.899, 796.298),
+    (271, 0.315, 10977.079), (243, 0.345, 5486.778), (206, 4.806, 2544.314),
+    (205, 1.869, 5573.143), (202, 2.458, 6069.777), (156, 0.833, 213.299),
+    (132, 3.411, 2942.463), (126, 1.083, 20.775), (115, 0.645, 0.98),
+    (103, 0.636, 4694.003), (102, 0.976, 15720.839), (102, 4.267, 7.114),
+    (99, 6.21, 2146.17), (98, 0.68, 155.42), (86, 5.98, 161000.69),
+    (85, 1.3, 6275.96), (85, 3.67, 71430.7), (80, 1.81, 17260.15),
+    (79, 3.04, 12036.46), (75, 1.76, 5088.63), (74, 3.5, 3154.69),
+    (74, 4.68, 801.82), (70, 0.83, 9437.76), (62, 3.98, 8827.39),
+    (61, 1.82, 7084.9), (57, 2.78, 6286.6), (56, 4.39, 14143.5),
+    (56, 3.47, 6279.55), (52, 0.19, 12139.55), (52, 1.33, 1748.02),
+    (51, 0.28, 5856.48), (49, 0.49, 1194.45), (41, 5.37, 8429.24),
+    (41, 2.4, 19651.05), (39, 6.17, 10447.39), (37, 6.04, 10213.29),
+    (37, 2.57, 1059.38), (36, 1.71, 2352.87), (36, 1.78, 6812.77),
+    (33, 0.59, 17789.85), (30, 0.44, 83996.85), (30, 2.74, 1349.87),
+    (25, 3.16, 4690.48),
+)
+_L1 = (
+    (628331966747, 0, 0), (206059, 2.678235, 6283.07585), (4303, 2.6351, 12566.1517),
+    (425, 1.59, 3.523), (119, 5.796, 26.298), (109, 2.966, 1577.344),
+    (93, 2.59, 18849.23), (72, 1.14, 529.69), (68, 1.87, 398.15),
+    (67, 4.41, 5507.55), (59, 2.89, 5223.69), (56, 2.17, 155.42),
+    (45, 0.4, 796.3), (36, 0.47, 775.52), (29, 2.65, 7.11),
+    (21, 5.34, 0.98), (19, 1.85, 5486.78), (19, 4.97, 213.3),
+    (17, 2.99, 6275.96), (16, 0.03, 2544.31), (16, 1.43, 2146.17),
+    (15, 1.21, 10977.08), (12, 2.83, 1748.02), (12, 3.26, 5088.63),
+    (12, 5.27, 1194.45), (12, 2.08, 4694.0), (11, 0.77, 553.57),
+    (10, 1.3, 6286.6), (10, 4.24, 1349.87), (9, 2.7, 242.73),
+    (9, 5.64, 951.72), (8, 5.3, 2352.87), (6, 2.65, 9437.76),
+    (6, 4.67, 4690.48),
+)
+_L2 = (
+    (52919, 0, 0), (8720, 1.0721, 6283.0758), (309, 0.867, 12566.152),
+    (27, 0.05, 3.52), (16, 5.19, 26.3), (16, 3.68, 155.42),
+    (10, 0.76, 18849.23), (9, 2.06, 77713.77), (7, 0.83, 775.52),
+    (5, 4.66, 1577.34), (4, 1.03, 7.11), (4, 3.44, 5573.14),
+    (3, 5.14, 796.3), (3, 6.05, 5507.55), (3, 1.19, 242.73),
+    (3, 6.12, 529.69), (3, 0.31, 398.15), (3, 2.28, 553.57),
+    (2, 4.38, 5223.69), (2, 3.75, 0.98),
+)
+_L3 = (
+    (289, 5.844, 6283.076), (35, 0, 0), (17, 5.49, 12566.15),
+    (3, 5.2, 155.42), (1, 4.72, 3.52), (1, 5.3, 18849.23), (1, 5.97, 242.73),
+)
+_L4 = ((114, 3.142, 0), (8, 4.13, 6283.08), (1, 3.84, 12566.15))
+_L5 = ((1, 3.14, 0),)
+_L_SERIES = (_L0, _L1, _L2, _L3, _L4, _L5)
+
+_R0 = (
+    (100013989, 0, 0), (1670700, 3.0984635, 6283.07585), (13956, 3.05525, 12566.1517),
+    (3084, 5.1985, 77713.7715), (1628, 1.1739, 5753.3849), (1576, 2.8469, 7860.4194),
+)
+_R1 = ((103019, 1.10749, 6283.07585), (1721, 1.0644, 12566.1517))
+_R_SERIES = (_R0, _R1)
+
+
+def _series(terms_by_power, tau, cos):
+    total = 0.0
+    for power, terms in enumerate(terms_by_power):
+        s = 0.0
+        for a, b, c in terms:
+            s = s + a * cos(b + c * tau)
+        total = total + s * tau ** power
+    return total * 1e-8
+
+
+def _apparent_longitude(jde, xp=math):
+    """太陽の視黄経（度、0..360）。jde は TT のユリウス日（float または ndarray）。"""
+    tau = (jde - _J2000) / 365250.0
+    t = tau * 10.0
+    lon = xp.degrees(_series(_L_SERIES, tau, xp.cos)) + 180.0   # 地心黄経
+    r = _series(_R_SERIES, tau, xp.cos)
+
+    # FK5 への補正（-0.09033"）、章動（簡易式）、光行差
+    omega = xp.radians(125.04452 - 1934.136261 * t)
+    ls = xp.radians(280.4665 + 36000.7698 * t)
+    lm = xp.radians(218.3165 + 481267.8813 * t)
+    dpsi = (-17.20 * xp.sin(omega) - 1.32 * xp.sin(2 * ls)
+            - 0.23 * xp.sin(2 * lm) + 0.21 * xp.sin(2 * omega))
+    lon = lon + (-0.09033 + dpsi - 20.4898 / r) / 3600.0
+    return lon % 360.0
+
+
+def solar_longitude(jde: float) -> float:
+    """太陽の視黄経（度）。"""
+    return _apparent_longitude(jde)
+
+
+# ---------------- ΔT = TT - UT（秒） ----------------
+def delta_t(year: float) -> float:
+    """Espenak & Meeus (2006) の多項式近似。year は小数年。"""
+    y = year
+    if y < 1600 or y >= 2150:
+        u = (y - 1820) / 100
+        return -20 + 32 * u * u
+    if y < 1700:
+        t = y - 1600
+        return 120 - 0.9808 * t - 0.01532 * t ** 2 + t ** 3 / 7129
+    if y < 1800:
+        t = y - 1700
+        return 8.83 + 0.1603 * t - 0.0059285 * t ** 2 + 0.00013336 * t ** 3 - t ** 4 / 1174000
+    if y < 1860:
+        t = y - 1800
+        return (13.72 - 0.332447 * t + 0.0068612 * t ** 2 + 0.0041116 * t ** 3
+                - 0.00037436 * t ** 4 + 0.0000121272 * t ** 5 - 0.0000001699 * t ** 6
+                + 0.000000000875 * t ** 7)
+    if y < 1900:
+        t = y - 1860
+        return (7.62 + 0.5737 * t - 0.251754 * t ** 2 + 0.01680668 * t ** 3
+                - 0.0004473624 * t ** 4 + t ** 5 / 233174)
+    if y < 1920:
+        t = y - 1900
+        return -2.79 + 1.494119 * t - 0.0598939 * t ** 2 + 0.0061966 * t ** 3 - 0.000197 * t ** 4
+    if y < 1941:
+        t = y - 1920
+        return 21.20 + 0.84493 * t - 0.076100 * t ** 2 + 0.0020936 * t ** 3
+    if y < 1961:
+        t = y - 1950
+        return 29.07 + 0.407 * t - t ** 2 / 233 + t ** 3 / 2547
+    if y < 1986:
+        t = y - 1975
+        return 45.45 + 1.067 * t - t ** 2 / 260 - t ** 3 / 718
+    if y < 2005:
+        t = y - 2000
+        return (63.86 + 0.3345 * t - 0.060374 * t ** 2 + 0.0017275 * t ** 3
+                + 0.000651814 * t ** 4 + 0.00002373599 * t ** 5)
+    if y < 2050:
+        t = y - 2000
+        return 62.92 + 0.32217 * t + 0.005589 * t ** 2
+    u = (y - 1820) / 100
+    return -20 + 32 * u * u - 0.5628 * (2150 - y)
+
+
+# ---------------- 節気の瞬間 ----------------
+def _initial_guess(year: int, k: int) -> float:
+    """year 年の k 番目（小寒=0）の節気のおおよその JDE（春分からの平均運動で見積もる）。"""
+    equinox = 2451623.80984 + 365.242374 * (year - 2000)
+    return equinox + (15 * k - 75) * _TROPICAL_YEAR / 360.0
+
+
+def _solve(jde: float, target: float) -> float:
+    """視黄経が target 度になる JDE をニュートン法で求める。"""
+    for _ in range(20):
+        diff = (target - _apparent_longitude(jde) + 180.0) % 360.0 - 180.0
+        step = diff * _TROPICAL_YEAR / 360.0
+        jde += step
+        if abs(step) < 1e-7:
+            break
+    return jde
+
+
+def _jde_to_jd_ut(jde: float, year: int) -> float:
+    return jde - delta_t(year + 0.5) / 86400.0
+
+
+_instants_cache = {}  # {年: 24節気の UT ユリウス日}（年ごとのメモ）
+
+
+def sekki_instants(year: int) -> tuple:
+    """year 年の24節気（小寒〜冬至）の瞬間を UT のユリウス日で返す。"""
+    v = _instants_cache.get(year)
+    if v is None:
+        v = tuple(
+            _jde_to_jd_ut(_solve(_initial_guess(year, k), SEKKI_LONGITUDES[k]), year)
+            for k in range(24)
+        )
+        _instants_cache[year] = v
+    return v
+
+
+def jd_to_local_datetime(jd_ut: float, offset_hours: int = JST_OFFSET_HOURS) -> datetime:
+    """UT のユリウス日 → 地方時の datetime（naive）。"""
+    days = jd_ut - _ORD_TO_JD + offset_hours / 24.0
+    ordinal = math.floor(days)
+    return datetime.fromordinal(ordinal) + timedelta(seconds=round((days - ordinal) * 86400))
+
+
+@lru_cache(maxsize=None)
+def sekki_datetimes(year: int) -> tuple:
+    """year 年の24節気の日本時間（naive datetime、秒単位）。"""
+    return tuple(jd_to_local_datetime(jd) for jd in sekki_instants(year))
+
+
+@lru_cache(maxsize=None)
+def sekki_dates(year: int) -> tuple:
+    """year 年の24節気の日本時間での日付。"""
+    return tuple(dt.date() for dt in sekki_datetimes(year))
+
+
+def risshun_date(year: int) -> date:
+    return sekki_dates(year)[RISSHUN]
+
+
+def sekki_table(years) -> dict:
+    """
+    複数年の節気日付を {年: (24個の date)} でまとめて返す。
+    NumPy があれば未計算の年・全節気を1つの配列にしてニュートン法をベクトルで回す。
+    """
+    years = list(years)
+    todo = sorted({y for y in years if y not in _instants_cache})
+    if np is not None and len(todo) > 1:
+        ys = np.repeat(np.asarray(todo, dtype=np.float64), 24)
+        ks = np.tile(np.arange(24, dtype=np.float64), len(todo))
+        targets = (285.0 + 15.0 * ks) % 360.0
+        jde = 2451623.80984 + 365.242374 * (ys - 2000) + (15 * ks - 75) * _TROPICAL_YEAR / 360.0
+        for _ in range(20):
+            diff = (targets - _apparent_longitude(jde, np) + 180.0) % 360.0 - 180.0
+            step = diff * _TROPICAL_YEAR / 360.0
+            jde = jde + step
+            if np.abs(step).max() < 1e-7:
+                break
+        for i, y in enumerate(todo):
+            _instants_cache[y] = tuple(_jde_to_jd_ut(float(v), y) for v in jde[i * 24:(i + 1) * 24])
+    return {y: sekki_dates(y) for y in years}
+
+
+# ---------------- 既存テーブルとの突き合わせ ----------------
+def check_against_risshun(table: dict | None = None) -> list:
+    """
+    risshun_dict の各年について計算値の立春日と比べ、食い違った年を
+    [(年, 表の日付, 計算した日本時間)] で返す（空なら全年一致）。
+    """
+    if table is None:
+        from .data_access import get_risshun_dict
+        table = get_risshun_dict()
+    sekki_table(sorted(table))
+    out = []
+    for y in sorted(table):
+        dt = sekki_datetimes(y)[RISSHUN]
+        if dt.date() != table[y]:
+            out.append((y, table[y], dt))
+    return out
+
+
+if __name__ == "__main__":
+    mismatches = check_against_risshun()
+    for y, expected, got in mismatches:
+        print(f"{y}: 表 {expected}  計算 {got:%Y-%m-%d %H:%M}")
+    print(f"立春の食い違い: {len(mismatches)} 件")
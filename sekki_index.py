@@ -0,0 +1,9 @@
+# sekki_index.py
+# 互換用。実装は sanmeigaku_core/sekki_index.py に移った。
+# import sekki_index は sanmeigaku_core.sekki_index そのもの（同じモジュールオブジェクト）を返す。
+
+import sys
+
+from sanmeigaku_core import sekki_index as _module
+
+sys.modules[__name__] = _module
@@ -0,0 +1,361 @@
+# server.py
+# 天中殺診断の HTTP JSON サービス（標準ライブラリのみ）。Streamlit を介さずに 1 件ずつ／まとめて診断する。
+#
+#   python server.py --port 8000
+#   curl 'http://127.0.0.1:8000/diagnose?date=1985-02-03'
+#   curl -X POST http://127.0.0.1:8000/diagnose/batch -d '{"dates": ["1985-02-03", "2000-01-01"]}'
+#   curl -O http://127.0.0.1:8000/assets/inui.720w.<hash>.webp   # graph_asset に入っている URL
+#   curl 'http://127.0.0.1:8000/dates?value=甲子&from=1990-01-01&to=1990-12-31'   # 干支 → 日付の逆引き
+#   curl 'http://127.0.0.1:8000/periods?date=1985-02-03&years=12'   # これからの年・月の天中殺
+#   SANMEIGAKU_METRICS=1 python server.py; curl http://127.0.0.1:8000/metrics   # Prometheus 形式の計測値
+#
+# 起動時にカレンダー表・節入り索引・メッセージを読み込んでおき、各リクエストは表を引くだけにする。
+# 接続はスレッドプール（--workers）で処理し、HTTP/1.1 の keep-alive で使い回す。
+# 何も送ってこない接続は --timeout 秒で切る（待っている接続がワーカーを占有し続けないように）。
+
+import argparse
+import json
+import socket
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from sanmeigaku_core.kanshi_core import RANGE_START, RANGE_END, _as_date
+from sanmeigaku_core.calendar_engine import get_engine
+from sanmeigaku_core.sekki_index import get_sekki_index
+from sanmeigaku_core.data_access import get_messages
+from graph_assets import DEFAULT_WIDTH, get_asset_store, graph_path_for
+from sanmeigaku_core.reverse_index import TENCHUSATSU_GROUPS, get_reverse_index
+from sanmeigaku_core.periods import tenchusatsu_periods
+from sanmeigaku_core import metrics
+
+MAX_BATCH = 10_000         # POST /diagnose/batch の1リクエストあたりの件数上限
+MAX_BODY = 4 * 1024 * 1024  # 受け付ける本文の上限（バイト）
+MAX_DATES = 10_000         # GET /dates で返す日付の上限（件数 count は常に全件）
+MAX_YEARS = 100            # GET /periods で先読みする年数の上限
+IDLE_TIMEOUT = 10.0        # keep-alive の接続で次のリクエストを待つ秒数（超えたら切る）
+PERIOD_KINDS = ("year", "month")  # GET /periods の kind
+
+# 計測のラベルにするパス（それ以外は "other"。/assets/<name> は "/assets" にまとめる）
+ROUTES = ("/diagnose", "/diagnose/batch", "/dates", "/periods", "/healthz", "/metrics")
+
+
+# ---------------- 診断（UI と同じ項目） ----------------
+def warm_up():
+    """表をすべて読み込んでおく（最初のリクエストだけ遅くならないように）。"""
+    get_engine()
+    get_sekki_index()
+    get_messages()
+    get_asset_store()
+    get_reverse_index()
+
+
+def diagnose_record(birth_date, with_messages: bool = True, width: int | None = DEFAULT_WIDTH, webp: bool = True) -> dict:
+    """
+    1件分の診断結果。キーは UI の表示項目そのまま:
+      date, year_kanshi/year_index, month_kanshi/month_index, day_kanshi/day_index,
+      tenchusatsu, sekki（節入りの名前と日付）, graph（グラフ画像の相対パス）,
+      graph_asset（表示幅 width に合う配信用画像の URL）, messages
+    日付が読めない・範囲外なら ValueError / TypeError。
+    """
+    with metrics.timer("diagnosis_seconds", "api"):
+        d = _as_date(birth_date)
+        rec = {"date": d.isoformat()}
+        rec.update(get_engine().diagnose(d))
+        start, name = get_sekki_index().boundary(d)
+        rec["sekki"] = {"name": name, "start": start.isoformat()}
+        rec["graph"] = graph_path_for(rec["tenchusatsu"])
+        asset = get_asset_store().pick(rec["tenchusatsu"], width, webp)
+        rec["graph_asset"] = f"/assets/{asset.name}" if asset else None
+        if with_messages:
+            rec["messages"] = get_messages().get(rec["tenchusatsu"], [])
+    return rec
+
+
+def _flag(value: str | None, default: bool = True) -> bool:
+    if value is None:
+        return default
+    return value.lower() not in ("0", "false", "no", "off")
+
+
+def _q(qs: dict, key: str):
+    """parse_qs の結果から最初の値（無ければ None）。"""
+    return (qs.get(key) or [None])[0]
+
+
+def _width(value) -> int | None:
+    """表示幅（px）。指定なし・不正な値は既定幅。"""
+    try:
+        w = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_WIDTH
+    return w if w > 0 else DEFAULT_WIDTH
+
+
+# ---------------- HTTP ----------------
+class DiagnosisHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # ヘッダーと本文を別々に書くので、遅延ACKで 40ms 待たないように
+    server_version = "SanmeigakuDiagnosis/1.0"
+    timeout = IDLE_TIMEOUT  # ソケットの読み取り待ちの上限。超えると接続を閉じてワーカーを返す
+    quiet = True
+    _status = None
+
+    def send_response(self, code, message=None):
+        self._status = code
+        super().send_response(code, message)
+
+    def _timed(self, handle):
+        """計測が有効なら、パスごとのリクエスト数（ステータス別）と処理時間を数える。"""
+        if not metrics.ENABLED:
+            return handle()
+        path = urlsplit(self.path).path
+        route = "/assets" if path.startswith("/assets/") else path if path in ROUTES else "other"
+        with metrics.timer("http_request_seconds", route):
+            handle()
+        metrics.inc("http_requests_total", route, str(self._status))
+
+    def _send_json(self, status: int, obj, vary: str | None = None):
+        body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if vary:
+            self.send_header("Vary", vary)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status: int, message: str):
+        self._send_json(status, {"error": message})
+
+    def _accepts_webp(self) -> bool:
+        return "image/webp" in (self.headers.get("Accept") or "")
+
+    def _send_asset(self, name: str):
+        asset = get_asset_store().get(name)
+        if asset is None:
+            return self._error(404, "not found")
+        # ハッシュ入りの名前は内容が変われば名前も変わるので、ブラウザ・CDN に無期限で持たせる
+        cache = "public, max-age=31536000, immutable" if asset.immutable else "public, max-age=3600"
+        if self.headers.get("If-None-Match") == asset.etag:
+            self.send_response(304)
+            self.send_header("ETag", asset.etag)
+            self.send_header("Cache-Control", cache)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", asset.content_type)
+        self.send_header("Content-Length", str(len(asset.data)))
+        self.send_header("ETag", asset.etag)
+        self.send_header("Cache-Control", cache)
+        self.end_headers()
+        self.wfile.write(asset.data)
+
+    def _send_metrics(self):
+        if not metrics.ENABLED:
+            return self._error(404, "計測は無効です（SANMEIGAKU_METRICS=1 で起動してください）")
+        body = metrics.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._timed(self._get)
+
+    def do_POST(self):
+        self._timed(self._post)
+
+    def _get(self):
+        url = urlsplit(self.path)
+        if url.path.startswith("/assets/"):
+            return self._send_asset(url.path[len("/assets/"):])
+        if url.path == "/periods":
+            return self._send_periods(parse_qs(url.query))
+        if url.path == "/dates":
+            return self._send_dates(parse_qs(url.query))
+        if url.path == "/metrics":
+            return self._send_metrics()
+        if url.path == "/healthz":
+            return self._send_json(200, {"status": "ok", "range": [RANGE_START.isoformat(), RANGE_END.isoformat()]})
+        if url.path != "/diagnose":
+            return self._error(404, "not found")
+
+        qs = parse_qs(url.query)
+        value = (qs.get("date") or [""])[0]
+        if not value:
+            return self._error(400, "date を指定してください（例: /diagnose?date=1985-02-03）")
+        try:
+            rec = diagnose_record(
+                value,
+                _flag((qs.get("messages") or [None])[0]),
+                _width((qs.get("width") or [None])[0]),
+                self._accepts_webp(),
+            )
+        except (TypeError, ValueError) as e:
+            return self._error(400, str(e))
+        self._send_json(200, rec, vary="Accept")  # graph_asset は Accept（WebP を受け付けるか）で変わる
+
+    def _send_periods(self, qs):
+        """?date=生年月日 &years=12 &from=起点（既定: 今日） &kind=year|month"""
+        value = _q(qs, "date")
+        if not value:
+            return self._error(400, "date を指定してください（例: /periods?date=1985-02-03&years=12）")
+        kind = _q(qs, "kind")
+        if kind and kind not in PERIOD_KINDS:
+            return self._error(400, f"kind は {', '.join(PERIOD_KINDS)} のいずれかです: {kind}")
+        try:
+            years = min(int(_q(qs, "years") or 12), MAX_YEARS)
+            periods = [
+                dict(p, start=p["start"].isoformat(), end=p["end"].isoformat())
+                for p in tenchusatsu_periods(value, years, _q(qs, "from"), (kind,) if kind else PERIOD_KINDS)
+            ]
+        except (TypeError, ValueError) as e:
+            return self._error(400, str(e))
+        self._send_json(200, {"date": _as_date(value).isoformat(), "years": years, "periods": periods})
+
+    def _send_dates(self, qs):
+        """?value=甲子|戌亥|1..60 &kind=day|month|year|group &from= &to= &limit="""
+        value = _q(qs, "value")
+        if not value:
+            return self._error(400, "value を指定してください（例: /dates?value=甲子&from=1990-01-01&to=1990-12-31）")
+        kind = _q(qs, "kind") or ("group" if value in TENCHUSATSU_GROUPS else "day")
+        try:
+            limit = min(int(_q(qs, "limit") or MAX_DATES), MAX_DATES)
+            ords = get_reverse_index().ordinals(kind, value, _q(qs, "from"), _q(qs, "to"))
+        except (TypeError, ValueError) as e:
+            return self._error(400, str(e))
+        self._send_json(200, {
+            "value": value,
+            "kind": kind,
+            "count": len(ords),
+            "dates": [date.fromordinal(o).isoformat() for o in ords[:max(limit, 0)]],
+        })
+
+    def _post(self):
+        url = urlsplit(self.path)
+        if url.path != "/diagnose/batch":
+            return self._error(404, "not found")
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            return self._error(400, "Content-Length が不正です")
+        if length < 0:
+            self.close_connection = True
+            return self._error(400, "Content-Length が不正です")
+        if length > MAX_BODY:
+            self.close_connection = True
+            return self._error(413, f"本文が大きすぎます（上限 {MAX_BODY} バイト）")
+        try:
+            payload = json.loads(self.rfile.read(length) or b"null")
+        except (ValueError, UnicodeDecodeError):
+            return self._error(400, "JSON を解釈できません")
+
+        # {"dates": [...], "messages": false, "width": 480} か、日付の配列そのもの
+        with_messages, width = True, DEFAULT_WIDTH
+        if isinstance(payload, dict):
+            with_messages = bool(payload.get("messages", True))
+            width = _width(payload.get("width"))
+            payload = payload.get("dates")
+        if not isinstance(payload, list):
+            return self._error(400, '{"dates": [...]} の形で日付を渡してください')
+        if len(payload) > MAX_BATCH:
+            return self._error(413, f"件数が多すぎます（上限 {MAX_BATCH} 件）")
+
+        results = []
+        for value in payload:
+            try:
+                rec = diagnose_record(value, with_messages, width, self._accepts_webp())
+                rec["error"] = None
+            except (TypeError, ValueError) as e:
+                rec = {"date": value if isinstance(value, str) else None, "error": str(e)}
+            results.append(rec)
+        self._send_json(200, {"results": results}, vary="Accept")
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+class PooledHTTPServer(HTTPServer):
+    """
+    受け付けた接続を固定サイズのスレッドプールで処理する HTTPServer。
+    処理待ち・処理中の接続を覚えておき、server_close() でそれらも閉じる（読み取り待ちのワーカーを起こして
+    終わらせ、まだ始まっていない接続は処理せずに閉じる）。
+    """
+
+    def __init__(self, server_address, handler_class, workers: int = 16):
+        super().__init__(server_address, handler_class)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="diagnose")
+        self._active = set()
+        self._active_lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        with self._active_lock:
+            self._active.add(request)
+        self._pool.submit(self._process_request, request, client_address)
+
+    def _process_request(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            with self._active_lock:
+                self._active.discard(request)
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        with self._active_lock:
+            active = list(self._active)
+        for request in active:
+            try:
+                request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        # 取り消された（始まらなかった）接続は _process_request の finally を通らないので、ここで閉じる
+        with self._active_lock:
+            cancelled, self._active = list(self._active), set()
+        for request in cancelled:
+            self.shutdown_request(request)
+
+
+def make_server(host: str = "127.0.0.1", port: int = 8000, workers: int = 16, quiet: bool = True,
+                timeout: float | None = IDLE_TIMEOUT) -> PooledHTTPServer:
+    """表を読み込んだうえでサーバーを作る（serve_forever() は呼び出し側で）。timeout=None で切らない。"""
+    warm_up()
+    handler = type("Handler", (DiagnosisHandler,), {"quiet": quiet, "timeout": timeout})
+    return PooledHTTPServer((host, port), handler, workers)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="server.py", description="天中殺診断の HTTP JSON サービス")
+    parser.add_argument("--host", default="127.0.0.1", help="待ち受けアドレス（既定: 127.0.0.1）")
+    parser.add_argument("--port", type=int, default=8000, help="ポート番号（既定: 8000）")
+    parser.add_argument("--workers", type=int, default=16, help="処理スレッド数（既定: 16）")
+    parser.add_argument("--timeout", type=float, default=IDLE_TIMEOUT,
+                        help=f"何も送ってこない接続を切るまでの秒数（既定: {IDLE_TIMEOUT:g}）")
+    parser.add_argument("-v", "--verbose", action="store_true", help="アクセスログを標準エラーへ出す")
+    args = parser.parse_args(argv)
+
+    httpd = make_server(args.host, args.port, args.workers, quiet=not args.verbose, timeout=args.timeout)
+    print(f"listening on http://{args.host}:{args.port}  ({RANGE_START}〜{RANGE_END})", file=sys.stderr)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
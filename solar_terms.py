@@ -0,0 +1,13 @@
+# solar_terms.py
+# 互換用。実装は sanmeigaku_core/solar_terms.py に移った。
+# import solar_terms は sanmeigaku_core.solar_terms そのもの（同じモジュールオブジェクト）を返す。
+# python solar_terms.py ... は python -m sanmeigaku_core.solar_terms ... と同じ。
+
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("sanmeigaku_core.solar_terms", run_name="__main__", alter_sys=True)
+else:
+    from sanmeigaku_core import solar_terms as _module
+    sys.modules[__name__] = _module
@@ -1,46 +1,9 @@
-# tenchusatsu_messages.py
-
-tentyuusatsu_messages = {
-    "子丑": [
-        "欠けているもの：「家系」「居場所」「帰る場所としての安定」「目上」。",
-        "あなたは、家庭や先祖との縁が薄く、家に対して違和感を抱きやすい宿命があります。",
-        "組織やグループでも“自分の居場所がない”と感じることがあるかもしれません。",
-        "魂の成長に必要なのは、自分自身が“誰かの帰る場所”になる覚悟。",
-        "「私はここにいていい」と、自分の存在に許可を出しましょう。"
-    ],
-    "寅卯": [
-        "欠けているもの：「他者との共鳴」「対人の調和」",
-        "強い信念を持ち、自分を貫く力はありますが、孤立しやすい傾向も。",
-        "他人の意見に心を開くことで、新しい可能性が拓かれます。",
-        "魂の成長に必要なのは、“共に創る”という意識。",
-        "一人で背負わず、共鳴・共感できる仲間を信じましょう。"
-    ],
-    "辰巳": [
-        "欠けているもの：「権威」「地位」「名誉」",
-        "表舞台に立つことへの抵抗感があるかもしれません。",
-        "目立たず控えめな人生を選びやすい傾向がありますが、それが自己制限となる場合も。",
-        "魂の成長に必要なのは、“堂々と光を浴びる勇気”。",
-        "「自分にはその価値がある」と信じて、舞台に立ちましょう。"
-    ],
-    "午未": [
-        "欠けているもの：「目下」「子ども」「感情の共有」",
-        "年下や部下、子どもとの関係に課題を持ちやすい宿命です。",
-        "感情よりも理性で判断する傾向が強く、冷たく思われることも。",
-        "魂の成長に必要なのは、“情熱を見守る愛”。",
-        "管理より信頼を、支配より共感を意識しましょう。"
-    ],
-    "申酉": [
-        "欠けているもの：「現実的な成果」「お金」「物質」",
-        "理想主義的な発想になりがちで、現実面での苦労を感じやすい宿命です。",
-        "地に足をつけること、経済的自立への意識が必要です。",
-        "魂の成長に必要なのは、“地道な積み上げ”。",
-        "夢を現実にするための具体的な行動を大切にしましょう。"
-    ],
-    "戌亥": [
-        "欠けているもの：「直感」「スピリチュアル」「非論理の世界」",
-        "感性や目に見えないものへの感受性が弱く、損得や理屈に偏りがちです。",
-        "合理的であることに価値を置く一方、心の声を無視しやすい傾向も。",
-        "魂の成長に必要なのは、“見えない力を信じること”。",
-        "心で感じること、直感で動くこともあなたの大切な武器になります。"
-    ]
-}
+# tenchusatsu_messages.py
+# 互換用。実装は sanmeigaku_core/tenchusatsu_messages.py に移った。
+# import tenchusatsu_messages は sanmeigaku_core.tenchusatsu_messages そのもの（同じモジュールオブジェクト）を返す。
+
+import sys
+
+from sanmeigaku_core import tenchusatsu_messages as _module
+
+sys.modules[__name__] = _module
@@ -0,0 +1,9 @@
+# tenchusatsu_periods.py
+# 互換用。実装は sanmeigaku_core/periods.py に移った。
+# import tenchusatsu_periods は sanmeigaku_core.periods そのもの（同じモジュールオブジェクト）を返す。
+
+import sys
+
+from sanmeigaku_core import periods as _module
+
+sys.modules[__name__] = _module
@@ -0,0 +1,5 @@
+# 実装モジュールはリポジトリ直下にあるので、どこから pytest を起動しても import できるようにする
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,40 @@
+import csv
+import json
+
+import batch_cli
+
+
+def _run(tmp_path, name, text, *extra):
+    src = tmp_path / name
+    src.write_text(text, encoding="utf-8")
+    out = tmp_path / "out.csv"
+    assert batch_cli.main(["batch", str(src), "-o", str(out), "--workers", "1", "-q", *extra]) == 0
+    with open(out, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        return reader.fieldnames, list(reader)
+
+
+def test_jsonl_to_csv_header_is_union_of_keys(tmp_path):
+    lines = [
+        {"id": 1, "birth_date": "1985-02-03"},
+        {"id": 2, "birth_date": "1990-01-01", "note": "後の行にだけある列"},
+        {"id": 3, "birth_date": "あいうえお"},
+    ]
+    header, rows = _run(tmp_path, "in.jsonl", "".join(json.dumps(x, ensure_ascii=False) + "\n" for x in lines))
+    assert header[:2] == ["id", "birth_date"]
+    assert "note" in header and "day_kanshi" in header
+    assert [r["note"] for r in rows] == ["", "後の行にだけある列", ""]
+    assert rows[0]["day_kanshi"] == "癸酉" and rows[0]["error"] == ""
+    assert rows[2]["error"] and rows[2]["day_kanshi"] == ""
+
+
+def test_csv_input_keeps_its_columns(tmp_path):
+    header, rows = _run(tmp_path, "in.csv", "name,birth_date\nA,1985-02-03\nB,1990-01-01\n")
+    assert header[:2] == ["name", "birth_date"]
+    assert [r["name"] for r in rows] == ["A", "B"]
+    assert rows[0]["tenchusatsu"] == "戌亥"
+
+
+def test_messages_are_joined_in_csv(tmp_path):
+    _, rows = _run(tmp_path, "in.jsonl", '{"birth_date": "1985-02-03"}\n', "--messages")
+    assert rows[0]["messages"] and not rows[0]["messages"].startswith("[")
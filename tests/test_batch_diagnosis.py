@@ -0,0 +1,55 @@
+from datetime import date, timedelta
+
+import pytest
+
+from sanmeigaku_core import batch_diagnosis
+from sanmeigaku_core.batch_diagnosis import diagnose_many
+from sanmeigaku_core.calendar_engine import get_engine
+from sanmeigaku_core.kanshi_core import RANGE_START, RANGE_END
+from sanmeigaku_core.sekki_index import get_sekki_index
+
+
+def _sample_dates():
+    # 範囲の両端と、節入りの前日・当日（年・月の切り替わり）を含める
+    si = get_sekki_index()
+    ords = {RANGE_START.toordinal(), RANGE_END.toordinal()}
+    for o in si.ordinals[1::7]:
+        ords.update((o - 1, o))
+    d = RANGE_START
+    while d <= RANGE_END:
+        ords.add(d.toordinal())
+        d += timedelta(days=97)
+    lo, hi = RANGE_START.toordinal(), RANGE_END.toordinal()
+    return sorted(o for o in ords if lo <= o <= hi)
+
+
+def test_python_path_matches_engine():
+    ords = _sample_dates()
+    out = batch_diagnosis._diagnose_python(ords)
+    engine = get_engine()
+    for i, o in enumerate(ords):
+        y, m, d = engine.lookup(date.fromordinal(o))
+        assert (out["year_index"][i], out["month_index"][i], out["day_index"][i]) == (y, m, d)
+        assert out["group"][i] == (d - 1) // 10
+
+
+def test_numpy_path_matches_python_path():
+    np = pytest.importorskip("numpy")
+    ords = _sample_dates()
+    expected = batch_diagnosis._diagnose_python(ords)
+    days = (np.asarray(ords, dtype=np.int64) - batch_diagnosis._EPOCH_ORD).astype("datetime64[D]")
+    for result in (batch_diagnosis._diagnose_numpy(days), diagnose_many(days),
+                   diagnose_many([date.fromordinal(o) for o in ords])):
+        for key, column in expected.items():
+            assert list(result[key]) == list(column), key
+
+
+def test_out_of_range():
+    with pytest.raises(ValueError):
+        diagnose_many([date(1599, 12, 31)])
+    with pytest.raises(ValueError):
+        batch_diagnosis._diagnose_python([date(2201, 1, 1).toordinal()])
+
+
+def test_empty():
+    assert all(len(c) == 0 for c in diagnose_many([]).values())
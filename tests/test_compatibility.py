@@ -0,0 +1,73 @@
+import pytest
+
+from sanmeigaku_core.compat import (
+    CHUU, GAI, IN_TENCHUSATSU, KANGOU, SAME_GROUP, SAME_KANSHI, SANGOU, SHIGOU, _relation_bits, compatibility,
+    get_tables, top_matches,
+)
+from sanmeigaku_core.kanshi_type import NAMES
+
+
+def _idx(name):
+    return NAMES.index(name)
+
+
+@pytest.mark.parametrize("a, b, bit", [
+    ("甲子", "己丑", KANGOU), ("甲子", "己丑", SHIGOU), ("甲子", "丙辰", SANGOU), ("甲子", "庚午", CHUU),
+    ("甲子", "辛未", GAI), ("甲子", "乙丑", SAME_GROUP), ("甲子", "甲戌", IN_TENCHUSATSU), ("甲子", "甲子", SAME_KANSHI),
+])
+def test_relation_bits(a, b, bit):
+    assert _relation_bits(_idx(a), _idx(b)) & bit
+
+
+def test_symmetric_relations():
+    symmetric = KANGOU | SHIGOU | SANGOU | CHUU | GAI | SAME_GROUP | SAME_KANSHI
+    for a in range(1, 61):
+        for b in range(1, 61):
+            assert _relation_bits(a, b) & symmetric == _relation_bits(b, a) & symmetric
+
+
+def test_partner_order_is_sorted_by_score():
+    t = get_tables()
+    for a in range(1, 61):
+        order = t.partner_order[a]
+        assert sorted(order) == list(range(1, 61))
+        scores = [t.score(a, b) for b in order]
+        assert scores == sorted(scores, reverse=True)
+
+
+def test_compatibility_pair():
+    res = compatibility("1985-02-03", "1985-02-03")
+    assert (res["a_kanshi"], res["a_index"]) == ("癸酉", 10)
+    assert "同じ日干支" in res["relations"]
+    assert res["score"] == get_tables().score(10, 10)
+
+
+def test_compatibility_does_not_build_the_calendar_engine():
+    from sanmeigaku_core import calendar_engine
+    calendar_engine.get_engine.cache_clear()
+    compatibility("1985-02-03", "1990-06-15")
+    assert calendar_engine.get_engine.cache_info().currsize == 0
+
+
+def test_compatibility_out_of_range():
+    with pytest.raises(ValueError):
+        compatibility("1599-12-31", "1985-02-03")
+
+
+def test_top_matches():
+    roster = [("A", "1985-02-03"), ("B", "1985-04-04"), ("C", "1990-06-15"), ("D", "2000-01-01")]
+    result = dict(top_matches(roster, k=2))
+    assert set(result) == {"A", "B", "C", "D"}
+    for pid, matches in result.items():
+        assert len(matches) == 2 and pid not in [m[0] for m in matches]
+        assert [m[1] for m in matches] == sorted((m[1] for m in matches), reverse=True)
+
+
+def test_top_matches_agree_with_pairwise_scores():
+    # 名簿の idx は列指向API（NumPy があれば uint8 の配列）から来るので、表の添字計算があふれないこと
+    roster = [("A", "1985-02-03"), ("B", "1985-04-04"), ("C", "1990-06-15"), ("D", "2000-01-01")]
+    dates = dict(roster)
+    for pid, matches in top_matches(roster, k=3).items():
+        for mid, score, labels in matches:
+            pair = compatibility(dates[pid], dates[mid])
+            assert (score, list(labels)) == (pair["score"], pair["relations"])
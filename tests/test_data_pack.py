@@ -0,0 +1,103 @@
+import os
+import warnings
+
+import pytest
+
+from sanmeigaku_core import data_pack
+
+
+@pytest.fixture(scope="module")
+def built():
+    """今の原本から作ったパック（作るのに数秒かかるので1回だけ）。"""
+    return data_pack.build_pack_bytes()
+
+
+@pytest.fixture
+def pack_path(tmp_path, monkeypatch, built):
+    """パックの置き場所を tmp に向け、作り直しの回数を数える。"""
+    path = tmp_path / "kanshi_tables.pack"
+    monkeypatch.setenv("SANMEIGAKU_PACK", str(path))
+    builds = []
+
+    def build(digest=None, stamp=None):
+        builds.append(stamp)
+        return built
+
+    monkeypatch.setattr(data_pack, "build_pack_bytes", build)
+    data_pack.load_pack.cache_clear()
+    yield path, builds
+    data_pack.load_pack.cache_clear()
+
+
+def _load():
+    data_pack.load_pack.cache_clear()
+    return data_pack.load_pack()
+
+
+def test_missing_pack_is_built_and_then_reused_without_hashing(pack_path, monkeypatch):
+    path, builds = pack_path
+    pack = _load()
+    assert path.exists() and len(builds) == 1
+    assert pack.stamp == data_pack.source_stamp()
+
+    def no_hash():
+        raise AssertionError("stamp が一致するならハッシュは取らない")
+
+    monkeypatch.setattr(data_pack, "source_hash", no_hash)
+    assert _load().digest == pack.digest and len(builds) == 1
+
+
+def test_changed_stamp_with_same_content_only_restamps(pack_path, monkeypatch):
+    path, builds = pack_path
+    _load()
+    stamp = tuple(v + 1 for v in data_pack.source_stamp())
+    monkeypatch.setattr(data_pack, "source_stamp", lambda: stamp)
+    assert _load() is not None and len(builds) == 1
+    assert data_pack.DataPack(path.read_bytes()).stamp == stamp
+
+
+def test_changed_content_rebuilds(pack_path, monkeypatch):
+    path, builds = pack_path
+    _load()
+    monkeypatch.setattr(data_pack, "source_stamp", lambda: (1,) * (data_pack._STAMP.size // 8))
+    monkeypatch.setattr(data_pack, "source_hash", lambda: b"\x01" * 32)
+    _load()
+    assert len(builds) == 2
+
+
+@pytest.mark.parametrize("content", [b"", b"SMGKPACK", b"x" * 1000])
+def test_broken_pack_is_rebuilt(pack_path, content):
+    path, builds = pack_path
+    path.write_bytes(content)
+    assert _load().base_year == 1900
+    assert len(builds) == 1
+
+
+def test_unwritable_location_warns_and_builds_in_memory(pack_path, monkeypatch, tmp_path):
+    missing_dir = tmp_path / "missing" / "kanshi_tables.pack"
+    monkeypatch.setenv("SANMEIGAKU_PACK", str(missing_dir))
+    with pytest.warns(RuntimeWarning, match="sanmeigaku_core.data_pack build"):
+        pack = _load()
+    assert pack.base_year == 1900 and not missing_dir.parent.exists()
+
+
+def test_failed_replace_leaves_no_tmp_file(pack_path, monkeypatch):
+    path, _ = pack_path
+
+    def fail(src, dst):
+        raise OSError("read-only")
+
+    monkeypatch.setattr(os, "replace", fail)
+    with pytest.raises(OSError):
+        data_pack.write_pack(str(path))
+    assert list(path.parent.iterdir()) == []
+
+
+def test_pack_matches_sources():
+    from sanmeigaku_core.risshun_data import risshun_dict
+    data_pack.load_pack.cache_clear()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        pack = data_pack.load_pack()
+    assert pack.risshun_dict() == risshun_dict
+    assert pack.sekki_years() == data_pack.sekki_pack_years()
@@ -0,0 +1,53 @@
+from datetime import date
+
+import pytest
+
+from sanmeigaku_core.date_parser import parse_date, parse_many
+
+
+@pytest.mark.parametrize("text", [
+    "1985-02-03", "1985/2/3", "1985.02.03", "19850203", "1985年2月3日", " 1985-02-03T12:34:56 ",
+    "１９８５年２月３日", "１９８５／０２／０３", "昭和60年2月3日", "S60.2.3", "s60/2/3", "Ｓ６０．２．３",
+])
+def test_parses_common_forms(text):
+    assert parse_date(text) == date(1985, 2, 3)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("明治元年10月23日", date(1868, 10, 23)),
+    ("大正元年7月30日", date(1912, 7, 30)),
+    ("昭和64年1月7日", date(1989, 1, 7)),
+    ("平成元年1月8日", date(1989, 1, 8)),
+    ("平成31年4月30日", date(2019, 4, 30)),
+    ("令和元年5月1日", date(2019, 5, 1)),
+    ("R1.5.1", date(2019, 5, 1)),
+])
+def test_era_boundaries(text, expected):
+    assert parse_date(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "明治元年10月22日", "昭和64年1月8日", "平成31年5月1日", "令和0年5月1日", "大正元年7月29日",
+])
+def test_outside_era_is_rejected(text):
+    with pytest.raises(ValueError):
+        parse_date(text)
+
+
+@pytest.mark.parametrize("text", ["", "abc", "1985-02-30", "1985年13月1日", "1985年閏2月1日"])
+def test_invalid_dates(text):
+    with pytest.raises(ValueError):
+        parse_date(text)
+
+
+def test_lunar_dates():
+    assert parse_date("旧暦1985年1月1日") == date(1985, 2, 20)
+    assert parse_date("旧2023年閏2月1日") == date(2023, 3, 22)
+    with pytest.raises(ValueError):
+        parse_date("旧暦2024年閏2月1日")
+
+
+def test_parse_many_keeps_rows_aligned():
+    dates, errors = parse_many(["1985-02-03", "bad", date(2000, 1, 1), None, "平成元年1月8日"])
+    assert dates == [date(1985, 2, 3), None, date(2000, 1, 1), None, date(1989, 1, 8)]
+    assert [e is None for e in errors] == [True, False, True, False, True]
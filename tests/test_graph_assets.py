@@ -0,0 +1,72 @@
+import json
+import os
+import sys
+
+import pytest
+
+import graph_assets
+from graph_assets import AssetStore, TENCHUSATSU_GRAPH_PATHS
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    """戌亥だけ幅違い・形式違いの画像を並べた manifest（中身はダミーのバイト列）。"""
+    variants = []
+    for width in (480, 720, 1080):
+        for fmt in ("webp", "png"):
+            name = f"inui.{width}w.{fmt}{width}.{fmt}"
+            (tmp_path / name).write_bytes(f"{fmt}-{width}".encode())
+            variants.append({"name": name, "format": fmt, "width": width, "sha256": f"{fmt}{width:0>64}"})
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({"version": 1, "groups": {"戌亥": {"variants": variants}}}), encoding="utf-8")
+    return str(path)
+
+
+def test_pick_smallest_variant_at_least_as_wide(manifest):
+    store = AssetStore(manifest)
+    assert store.pick("戌亥", 720).name == "inui.720w.webp720.webp"
+    assert store.pick("戌亥", 500).width == 720
+    assert store.pick("戌亥", 5000).width == 1080  # 足りなければ最大幅
+    assert store.pick("戌亥", None).width == 1080
+
+
+def test_png_only_when_webp_is_not_accepted(manifest):
+    store = AssetStore(manifest)
+    a = store.pick("戌亥", 720, webp=False)
+    assert (a.format, a.width, a.content_type) == ("png", 720, "image/png")
+
+
+def test_variants_are_immutable_and_found_by_name(manifest):
+    store = AssetStore(manifest)
+    a = store.pick("戌亥", 480)
+    assert a.immutable and store.get(a.name) is a and a.data == b"webp-480"
+
+
+def test_groups_without_variants_fall_back_to_the_original(manifest):
+    store = AssetStore(manifest)
+    a = store.pick("子丑", 720)
+    assert a.name == os.path.basename(TENCHUSATSU_GRAPH_PATHS["子丑"])
+    assert a.format == "png" and a.width is None and not a.immutable
+
+
+def test_missing_manifest_serves_originals(tmp_path):
+    missing = tmp_path / "variants" / "manifest.json"
+    store = AssetStore(str(missing))
+    for ts_group in TENCHUSATSU_GRAPH_PATHS:
+        a = store.pick(ts_group)
+        assert a.format == "png" and not a.immutable
+    assert not missing.parent.exists()
+
+
+def test_get_asset_store_does_not_build_variants(tmp_path, monkeypatch):
+    # 画像を作るのは build_assets.py（ビルド時）だけ。実行時に読み込もうとしたら失敗させる
+    missing = tmp_path / "variants" / "manifest.json"
+    monkeypatch.setattr(graph_assets, "MANIFEST_PATH", str(missing))
+    monkeypatch.setattr(graph_assets, "VARIANTS_DIR", str(missing.parent))
+    monkeypatch.setitem(sys.modules, "build_assets", None)
+    graph_assets.get_asset_store.cache_clear()
+    try:
+        assert graph_assets.get_asset_store().pick("戌亥") is not None
+        assert not missing.parent.exists()
+    finally:
+        graph_assets.get_asset_store.cache_clear()
@@ -0,0 +1,65 @@
+import os
+from datetime import date
+
+import pytest
+
+pytest.importorskip("streamlit")
+from streamlit.testing.v1 import AppTest
+
+from sanmeigaku_core import calendar_engine
+from sanmeigaku_core.kanshi_core import kanshi_name
+from sanmeigaku_core.sekki_index import resolve_month
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "kanshi_calc.py")
+
+
+def _button(at, label):
+    return next(b for b in at.button if b.label.startswith(label))
+
+
+def _texts(at):
+    return [m.value for m in at.markdown]
+
+
+@pytest.fixture
+def diagnose_calls(monkeypatch):
+    calls = []
+    original = calendar_engine.CalendarEngine.diagnose
+
+    def counting(self, birth_date):
+        calls.append(birth_date)
+        return original(self, birth_date)
+
+    monkeypatch.setattr(calendar_engine.CalendarEngine, "diagnose", counting)
+    return calls
+
+
+@pytest.mark.parametrize("birth_date", [date(1985, 2, 3), date(1985, 2, 4), date(2001, 12, 31)])
+def test_wizard_shows_resolve_month_and_diagnoses_once(birth_date, diagnose_calls):
+    at = AppTest.from_file(APP, default_timeout=60).run()
+    at.date_input[0].set_value(birth_date)
+    _button(at, "次へ").click().run()
+    at.run()  # フォームの送信で進んだステップを描画する
+    assert at.session_state.step == 1 and not at.exception
+
+    _button(at, "診断する").click().run()
+    assert at.session_state.step == 2 and not at.exception
+    assert at.session_state.result_key == birth_date
+    assert "result" not in at.session_state  # 結果そのものはセッションに持たない
+
+    sekki_month, month_idx, days = resolve_month(birth_date)
+    month_lines = [t for t in _texts(at) if t.startswith("**月干支")]
+    assert len(month_lines) == 1 and kanshi_name(month_idx) in month_lines[0]
+
+    # 結果から確認に戻って、もう一度診断しても計算し直さない
+    _button(at, "◀ 入力に戻る").click().run()
+    _button(at, "診断する").click().run()
+    assert diagnose_calls.count(birth_date) == 1
+
+
+def test_out_of_range_disables_diagnosis():
+    at = AppTest.from_file(APP, default_timeout=60).run()
+    at.session_state.step = 1
+    at.session_state.birth_date = date(1500, 1, 1)
+    at.run()
+    assert at.error and _button(at, "診断する").disabled
@@ -0,0 +1,37 @@
+import json
+import pickle
+
+import pytest
+
+from sanmeigaku_core.kanshi_type import ALL, NAMES, Kanshi
+
+
+def test_identity_and_lookup():
+    assert Kanshi(54) is Kanshi("丁巳") is Kanshi(Kanshi(54))
+    assert [int(k) for k in ALL] == list(range(1, 61))
+
+
+def test_text_forms_use_the_name():
+    k = Kanshi(54)
+    assert str(k) == f"{k}" == "%s" % k == "丁巳"
+    assert f"{k:>3}" == " 丁巳"
+    assert repr(k) == "Kanshi(54, '丁巳')"
+
+
+def test_numeric_forms_stay_int():
+    k = Kanshi(54)
+    assert int(k) == k.index == 54 and k + 1 == 55
+    assert json.dumps({"idx": k}) == '{"idx": 54}'
+    assert pickle.loads(pickle.dumps(k)) is k
+
+
+def test_attributes():
+    k = Kanshi(1)
+    assert (k.name, k.stem_name, k.branch_name, k.gogyo, k.yin_yang, k.tenchusatsu) == ("甲子", "甲", "子", "木", "陽", "戌亥")
+    assert all(k.name == NAMES[k] for k in ALL)
+
+
+@pytest.mark.parametrize("value", [0, 61, "甲丑", ""])
+def test_invalid(value):
+    with pytest.raises(ValueError):
+        Kanshi(value)
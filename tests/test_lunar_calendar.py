@@ -0,0 +1,59 @@
+from datetime import date, timedelta
+
+import pytest
+
+from sanmeigaku_core.kanshi_core import RANGE_START, RANGE_END
+from sanmeigaku_core.lunar_calendar import get_lunar_table, lunar_label, lunar_to_solar, solar_to_lunar
+
+
+@pytest.mark.parametrize("lunar, solar", [
+    ((1985, 1, 1, False), date(1985, 2, 20)),
+    ((2024, 1, 1, False), date(2024, 2, 10)),
+    ((2023, 2, 1, True), date(2023, 3, 22)),
+    ((1872, 12, 2, False), date(1872, 12, 31)),
+])
+def test_known_dates(lunar, solar):
+    assert lunar_to_solar(*lunar) == solar
+    assert solar_to_lunar(solar) == lunar
+
+
+# 日本時間で判定した閏月（2012年は閏3月。中国の暦では閏4月になる）
+@pytest.mark.parametrize("year, month", [
+    (1984, 10), (1987, 6), (1990, 5), (1993, 3), (1995, 8), (1998, 5), (2001, 4), (2004, 2),
+    (2006, 7), (2009, 5), (2012, 3), (2014, 9), (2017, 5), (2020, 4), (2023, 2), (2025, 6),
+    (2028, 5), (2031, 3), (2033, 11), (2036, 6),
+])
+def test_leap_months(year, month):
+    # 閏月は前の月の翌日から始まる
+    leap = lunar_to_solar(year, month, 1, leap=True)
+    last = get_lunar_table().to_solar(year, month, 29)
+    assert leap > last
+    assert solar_to_lunar(leap) == (year, month, 1, True)
+
+
+def test_one_leap_month_per_year_at_most():
+    keys = get_lunar_table().keys
+    leaps = [k >> 5 for k in keys if k & 1]
+    assert len(leaps) == len(set(leaps))
+
+
+def test_missing_month_and_day():
+    with pytest.raises(ValueError):
+        lunar_to_solar(2024, 2, 1, leap=True)
+    with pytest.raises(ValueError):
+        lunar_to_solar(2024, 1, 31)
+    with pytest.raises(ValueError):
+        lunar_to_solar(2024, 13, 1)
+
+
+def test_round_trip_over_range():
+    table = get_lunar_table()
+    assert table.start <= RANGE_START and table.end >= RANGE_END
+    d = RANGE_START
+    while d <= RANGE_END:
+        assert table.to_solar(*table.to_lunar(d)) == d
+        d += timedelta(days=13)
+
+
+def test_label():
+    assert lunar_label(2023, 2, 1, True) == "旧暦2023年閏2月1日"
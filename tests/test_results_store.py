@@ -0,0 +1,58 @@
+import sqlite3
+from datetime import date
+
+import pytest
+
+import results_store
+from sanmeigaku_core.calendar_engine import get_engine
+from results_store import ResultsStore, build_store
+
+
+@pytest.fixture(scope="module")
+def store(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("store") / "diagnoses.sqlite")
+    n = build_store(path, date(1985, 1, 1), date(1985, 3, 31))
+    assert n == 90
+    s = ResultsStore(path)
+    yield s
+    s.close()
+
+
+def test_lookup_matches_engine(store):
+    row = store.lookup("1985-02-03")
+    d = get_engine().diagnose(date(1985, 2, 3))
+    assert row["day_kanshi"] == d["day_kanshi"] == "癸酉"
+    assert row["month_kanshi"] == d["month_kanshi"] == "丁丑"
+    assert row["tenchusatsu"] == "戌亥"
+    assert row["month_rule"] == "sekki" and row["sekki"] == "小寒"
+    assert store.lookup("1986-01-01") is None
+
+
+def test_scan_filters(store):
+    rows = store.scan("1985-01-01", "1985-03-31", tenchusatsu="戌亥")
+    assert rows and all(r["tenchusatsu"] == "戌亥" for r in rows)
+    assert [r["date"] for r in rows] == sorted(r["date"] for r in rows)
+    assert [r["date"] for r in store.scan("1985-01-01", "1985-03-31", day_index=10)] == ["1985-02-03"]
+    assert len(store.scan("1985-02-01", "1985-02-28")) == 28
+
+
+def test_meta_records_range_and_pack(store):
+    meta = store.meta()
+    assert meta["range_start"] == "1985-01-01" and meta["rows"] == "90"
+    assert len(meta["data_pack_sha256"]) == 64
+
+
+def test_store_is_read_only(store):
+    with pytest.raises(sqlite3.OperationalError):
+        store._con.execute("DELETE FROM diagnoses")
+
+
+def test_out_of_range_and_missing_file(tmp_path, capsys):
+    with pytest.raises(ValueError):
+        build_store(str(tmp_path / "x.sqlite"), date(1500, 1, 1), date(1500, 1, 2))
+    assert list(tmp_path.iterdir()) == []
+    missing = str(tmp_path / "missing.sqlite")
+    with pytest.raises(FileNotFoundError):
+        ResultsStore(missing)
+    assert results_store.main(["--path", missing, "info"]) == 1
+    assert "build" in capsys.readouterr().err
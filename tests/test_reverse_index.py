@@ -0,0 +1,42 @@
+from datetime import date
+
+import pytest
+
+from sanmeigaku_core.kanshi_core import day_kanshi_index, month_kanshi_index, tenchusatsu_from_index
+from sanmeigaku_core.reverse_index import get_reverse_index
+
+
+@pytest.fixture(scope="module")
+def index():
+    return get_reverse_index()
+
+
+def test_day_dates_are_sixty_days_apart(index):
+    dates = index.dates("day", "甲子", "1990-01-01", "1990-12-31")
+    assert dates and all(day_kanshi_index(d) == 1 for d in dates)
+    assert all((b - a).days == 60 for a, b in zip(dates, dates[1:]))
+    assert index.count("day", 1, "1990-01-01", "1990-12-31") == len(dates)
+
+
+def test_value_forms_agree(index):
+    assert index.ordinals("day", "甲子") == index.ordinals("day", 1) == index.ordinals("day", "1")
+
+
+def test_month_and_group(index):
+    start, end = date(2000, 1, 1), date(2000, 12, 31)
+    for d in index.dates("month", "戊寅", start, end):
+        assert month_kanshi_index(d) == 15
+    groups = index.dates("group", "戌亥", start, end)
+    assert groups and all(tenchusatsu_from_index(day_kanshi_index(d)) == "戌亥" for d in groups)
+    assert sum(index.count("group", g, start, end) for g in ("戌亥", "申酉", "午未", "辰巳", "寅卯", "子丑")) == 366
+
+
+def test_empty_and_inverted_ranges(index):
+    assert index.count("day", "甲子", "1990-01-02", "1990-01-01") == 0
+    assert index.dates("day", "甲子", "1990-01-02", "1990-01-01") == []
+
+
+@pytest.mark.parametrize("kind, value", [("bogus", "甲子"), ("group", "甲子"), ("day", "甲丑"), ("day", 61)])
+def test_bad_kind_or_value(index, kind, value):
+    with pytest.raises(ValueError):
+        index.count(kind, value)
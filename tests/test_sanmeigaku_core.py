@@ -0,0 +1,58 @@
+import importlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+import sanmeigaku_core
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 直下の互換モジュール → パッケージ内の実装
+SHIMS = {
+    "kanshi_core": "kanshi_core", "kanshi_type": "kanshi_type", "metrics": "metrics",
+    "data_access": "data_access", "data_pack": "data_pack", "month_table": "month_table",
+    "solar_terms": "solar_terms", "sekki_index": "sekki_index", "calendar_engine": "calendar_engine",
+    "batch_diagnosis": "batch_diagnosis", "reverse_index": "reverse_index", "compatibility": "compat",
+    "tenchusatsu_periods": "periods", "date_parser": "date_parser", "lunar_calendar": "lunar_calendar",
+    "month_kanshi_index_dict": "month_kanshi_index_dict", "day_kanshi_dict": "day_kanshi_dict",
+    "risshun_data": "risshun_data", "tenchusatsu_messages": "tenchusatsu_messages",
+}
+
+
+@pytest.mark.parametrize("old, new", sorted(SHIMS.items()))
+def test_shim_is_the_package_module(old, new):
+    assert importlib.import_module(old) is importlib.import_module(f"sanmeigaku_core.{new}")
+
+
+def test_exports_survive_submodule_import():
+    importlib.import_module("sanmeigaku_core.compat")
+    importlib.import_module("sanmeigaku_core.periods")
+    assert callable(sanmeigaku_core.compatibility)
+    assert callable(sanmeigaku_core.tenchusatsu_periods)
+    for name in sanmeigaku_core.__all__:
+        assert getattr(sanmeigaku_core, name) is not None
+
+
+def _run(args, cwd):
+    env = {k: v for k, v in os.environ.items() if k not in ("PYTHONPATH", "SANMEIGAKU_PACK")}
+    return subprocess.run([sys.executable, *args], cwd=cwd, env=env, capture_output=True, text=True, timeout=120)
+
+
+def test_package_runs_on_its_own(tmp_path):
+    """パッケージのディレクトリだけを別の場所に置いても python -m sanmeigaku_core が動く。"""
+    shutil.copytree(os.path.join(ROOT, "sanmeigaku_core"), tmp_path / "sanmeigaku_core",
+                    ignore=shutil.ignore_patterns("__pycache__"))
+    proc = _run(["-m", "sanmeigaku_core", "1985-02-03", "--json"], tmp_path)
+    assert proc.returncode == 0, proc.stderr
+    rec = json.loads(proc.stdout)
+    assert rec["day_kanshi"] == "癸酉" and rec["tenchusatsu"] == "戌亥"
+
+
+def test_old_script_path_still_runs(tmp_path):
+    proc = _run([os.path.join(ROOT, "reverse_index.py"), "甲子", "1990-01-01", "1990-03-31", "--count"], tmp_path)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip()
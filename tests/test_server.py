@@ -0,0 +1,115 @@
+import http.client
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+import server
+
+
+@pytest.fixture(scope="module")
+def base():
+    httpd = server.make_server(port=0, workers=2, timeout=2.0)
+    t = threading.Thread(target=httpd.serve_forever, daemon=True)
+    t.start()
+    yield httpd.server_address
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _request(addr, method, path, body=None, headers=None):
+    conn = http.client.HTTPConnection(*addr, timeout=10)
+    try:
+        conn.request(method, path, body=body, headers=headers or {})
+        res = conn.getresponse()
+        return res.status, json.loads(res.read() or b"null")
+    finally:
+        conn.close()
+
+
+def test_diagnose(base):
+    status, rec = _request(base, "GET", "/diagnose?date=1985-02-03&messages=0")
+    assert status == 200
+    assert (rec["day_kanshi"], rec["day_index"], rec["tenchusatsu"]) == ("癸酉", 10, "戌亥")
+
+
+@pytest.mark.parametrize("path", [
+    "/diagnose", "/diagnose?date=bad", "/diagnose?date=1500-01-01",
+    "/dates?value=%E7%94%B2%E5%AD%90&kind=bogus", "/dates?value=bogus",
+    "/periods?date=1985-02-03&kind=bogus", "/periods?date=1985-02-03&years=x",
+])
+def test_get_errors_are_400(base, path):
+    status, body = _request(base, "GET", path)
+    assert status == 400 and body["error"]
+
+
+def test_unknown_path_is_404(base):
+    assert _request(base, "GET", "/nope")[0] == 404
+
+
+@pytest.mark.parametrize("body, headers, status", [
+    (b"", {"Content-Length": "-1"}, 400),
+    (b"", {"Content-Length": "x"}, 400),
+    (b"{", None, 400),
+    (b'{"dates": "1985-02-03"}', None, 400),
+    (b"", {"Content-Length": str(server.MAX_BODY + 1)}, 413),
+])
+def test_post_errors(base, body, headers, status):
+    assert _request(base, "POST", "/diagnose/batch", body, headers)[0] == status
+
+
+def test_post_batch_reports_errors_per_row(base):
+    status, body = _request(base, "POST", "/diagnose/batch", json.dumps({"dates": ["1985-02-03", "bad"], "messages": False}))
+    assert status == 200
+    assert [r["error"] is None for r in body["results"]] == [True, False]
+
+
+def test_diagnose_varies_on_accept(base):
+    conn = http.client.HTTPConnection(*base, timeout=10)
+    try:
+        conn.request("GET", "/diagnose?date=1985-02-03&messages=0", headers={"Accept": "image/webp"})
+        webp = conn.getresponse()
+        assert webp.getheader("Vary") == "Accept"
+        webp_asset = json.loads(webp.read())["graph_asset"]
+        conn.request("GET", "/diagnose?date=1985-02-03&messages=0", headers={"Accept": "image/png"})
+        png = conn.getresponse()
+        assert png.getheader("Vary") == "Accept"
+        png_asset = json.loads(png.read())["graph_asset"]
+    finally:
+        conn.close()
+    if webp_asset and png_asset:
+        assert webp_asset != png_asset
+
+
+def test_idle_connection_does_not_hold_a_worker():
+    httpd = server.make_server(port=0, workers=1, timeout=0.5)
+    t = threading.Thread(target=httpd.serve_forever, daemon=True)
+    t.start()
+    idle = socket.create_connection(httpd.server_address)
+    try:
+        assert _request(httpd.server_address, "GET", "/healthz")[0] == 200
+    finally:
+        idle.close()
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_server_close_closes_running_and_queued_connections():
+    httpd = server.make_server(port=0, workers=1, timeout=None)
+    t = threading.Thread(target=httpd.serve_forever, daemon=True)
+    t.start()
+    # 1本目がワーカーを占有し（何も送らない）、残りはプールの待ち行列に入る
+    clients = [socket.create_connection(httpd.server_address) for _ in range(3)]
+    deadline = time.monotonic() + 5
+    while len(httpd._active) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(httpd._active) == 3
+    httpd.shutdown()
+    httpd.server_close()
+    assert not httpd._active
+    for c in clients:
+        c.settimeout(5)
+        assert c.recv(1) == b""  # サーバー側が閉じている
+        c.close()
@@ -0,0 +1,59 @@
+from datetime import date, timedelta
+
+import pytest
+
+from sanmeigaku_core.risshun_data import risshun_dict
+from sanmeigaku_core.sekki_index import jie_date
+from sanmeigaku_core.solar_terms import check_against_risshun
+from sanmeigaku_core.periods import group_of, tenchusatsu_periods
+
+
+def test_group_of():
+    assert group_of("1985-02-03") == "戌亥"
+
+
+def test_year_periods_start_on_risshun_from_table():
+    mismatched = {y for y, _, _ in check_against_risshun()}
+    periods = list(tenchusatsu_periods("1985-02-03", years=120, start="1900-01-01", kinds=("year",)))
+    assert [p["start"].year for p in periods[:3]] == [1898, 1910, 1922]  # 1898年立春〜1900年立春前日も続いている
+    checked = 0
+    for p in periods:
+        y = p["start"].year
+        if y in risshun_dict and y not in mismatched:
+            assert p["start"] == risshun_dict[y]
+            checked += 1
+        if y + 2 in risshun_dict and y + 2 not in mismatched:
+            assert p["end"] == risshun_dict[y + 2] - timedelta(days=1)
+        assert p["sekki"] == ("立春", "立春")
+    assert checked >= 8
+
+
+def test_month_periods_cover_two_sekki_months():
+    periods = list(tenchusatsu_periods("1985-02-03", years=3, start="2025-01-01", kinds=("month",)))
+    assert len(periods) == 3
+    for p in periods:
+        y = p["start"].year
+        assert p["start"] == jie_date(y, 9)            # 戌月（寒露）から
+        assert p["end"] == jie_date(y, 11) - timedelta(days=1)  # 子月（大雪）の前日まで
+        assert p["label"] == "戌月・亥月"
+
+
+def test_month_period_across_new_year_includes_previous_year():
+    birth = next(date(1985, 1, 1) + timedelta(days=i) for i in range(60)
+                 if group_of(date(1985, 1, 1) + timedelta(days=i)) == "子丑")
+    p = next(tenchusatsu_periods(birth, years=1, start="2025-01-10", kinds=("month",)))
+    assert p["start"] == jie_date(2024, 11) and p["end"] == jie_date(2025, 1) - timedelta(days=1)
+    assert p["sekki"] == ("大雪", "立春")
+
+
+def test_ongoing_year_period_is_included_and_merged_in_order():
+    periods = list(tenchusatsu_periods("1985-02-03", years=1, start="2031-06-01"))
+    assert periods[0]["kind"] == "year" and periods[0]["start"] == jie_date(2030, 1)
+    starts = [p["start"] for p in periods]
+    assert starts == sorted(starts)
+
+
+def test_kinds_filter_and_negative_years():
+    assert list(tenchusatsu_periods("1985-02-03", years=5, start="2025-01-01", kinds=())) == []
+    with pytest.raises(ValueError):
+        list(tenchusatsu_periods("1985-02-03", years=-1))
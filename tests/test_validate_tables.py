@@ -0,0 +1,39 @@
+from datetime import date
+
+import pytest
+
+import validate_tables
+from validate_tables import summarize, validate
+
+
+def test_engine_and_day_table_agree_with_core():
+    assert validate(("engine", "day_table"), date(1984, 1, 1), date(1986, 12, 31), workers=1) == []
+
+
+def test_month_table_mismatches_are_reported_by_rule():
+    rows = validate(("month_table",), date(1984, 1, 1), date(1990, 12, 31), workers=1)
+    assert rows and all(r[0] == "month_table" for r in rows)
+    assert [r[1] for r in rows] == sorted(r[1] for r in rows)
+    rules = {rule: n for _, rule, n, _, _ in summarize(rows)}
+    assert sum(rules.values()) == len(rows)
+    assert "no start_day" in rules
+
+
+def test_workers_give_the_same_report():
+    args = (("month_table", "engine"), date(1984, 1, 1), date(1986, 12, 31))
+    assert validate(*args, workers=2) == validate(*args, workers=1)
+
+
+def test_risshun_reports_known_years():
+    rows = validate(("risshun",))
+    assert {r[1] for r in rows} >= {"1922", "1926", "1927"}
+    assert all(r[2] != r[3] for r in rows)
+
+
+def test_bad_arguments(capsys):
+    with pytest.raises(ValueError):
+        validate(("nope",))
+    with pytest.raises(ValueError):
+        validate(("engine",), date(1500, 1, 1), date(1500, 1, 2))
+    assert validate_tables.main(["--check", "engine", "--from", "1500-01-01", "--to", "1500-01-02"]) == 2
+    assert "error" in capsys.readouterr().err
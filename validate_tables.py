@@ -0,0 +1,189 @@
+# validate_tables.py
+# データ表どうし・表と計算値の突き合わせ。対応範囲の全日付をワーカープロセスに分けて調べ、
+# 食い違った日付をすべて（どの検査で・どの分岐〈rule〉で）報告する。データを編集したら毎回流す想定。
+#
+#   python validate_tables.py                     # 全検査（食い違いがあれば終了コード 1）
+#   python validate_tables.py --check day_table risshun
+#   python validate_tables.py --json report.json  # 食い違いの全件を JSON に
+#
+# 検査:
+#   day_table     kanshi_index_table（月数値 + 日）の日干支 と JDN で計算した日干支
+#   month_table   month_kanshi_index_dict（旧方式の分岐ごと）の月干支 と 節入り基準の月干支
+#   engine        展開済みカレンダー表（calendar_engine）の年・月・日 と kanshi_core の関数（全範囲）
+#   risshun       risshun_data.py の立春 と 計算した立春（年ごと）
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from sanmeigaku_core.kanshi_core import (
+    RANGE_START, RANGE_END, TABLE_START, TABLE_END,
+    get_year_kanshi_index, month_kanshi_index, day_kanshi_index, get_month_kanshi_from_table,
+)
+from sanmeigaku_core.data_access import get_month_table, get_risshun_dict
+from sanmeigaku_core.metrics import rule_label
+
+DAY_CHECKS = ("day_table", "month_table", "engine")
+CHECKS = DAY_CHECKS + ("risshun",)
+
+# 1件の食い違い: (検査, 日付または年, 期待値〈基準側〉, 実際の値〈検査される側〉, rule)
+FIELDS = ("check", "date", "expected", "got", "rule")
+
+
+def _wrap(n: int) -> int:
+    return (n - 1) % 60 + 1
+
+
+def _sweep(lo: int, hi: int, checks: tuple) -> list:
+    """ordinal lo〜hi（両端含む）の日付を調べ、食い違いのリストを返す（ワーカープロセスで実行）。"""
+    out = []
+    table = get_month_table() if {"day_table", "month_table"} & set(checks) else None
+    t_lo, t_hi = TABLE_START.toordinal(), TABLE_END.toordinal()
+
+    engine = base = None
+    if "engine" in checks:
+        from sanmeigaku_core.calendar_engine import get_engine
+        engine = get_engine()
+        base = engine.start.toordinal()
+
+    for o in range(lo, hi + 1):
+        d = date.fromordinal(o)
+        iso = d.isoformat()
+        day_idx = day_kanshi_index(d)
+        in_table = t_lo <= o <= t_hi
+
+        if table is not None and in_table:
+            if "day_table" in checks:
+                anchor = table.anchor(d.year, d.month)
+                got = _wrap(anchor + d.day) if anchor else None
+                if got != day_idx:
+                    out.append(("day_table", iso, day_idx, got, f"kanshi_index_table[{d.year}][{d.month}]={anchor}"))
+            if "month_table" in checks:
+                _, got, dbg = get_month_kanshi_from_table(d, trace=True)  # rule を報告に使う
+                expected = month_kanshi_index(d)
+                if got != expected:
+                    out.append(("month_table", iso, expected, got, rule_label(dbg["rule"])))
+
+        if engine is not None:
+            i = o - base
+            core = (get_year_kanshi_index(d), month_kanshi_index(d), day_idx)
+            cols = (engine.year_idx[i], engine.month_idx[i], engine.day_idx[i])
+            for part, expected, got in zip(("year", "month", "day"), core, cols):
+                if got != expected:
+                    out.append(("engine", iso, expected, got, part))
+    return out
+
+
+def check_risshun() -> list:
+    """立春の年ごとの突き合わせ。risshun_data.py の日付を基準に、計算した立春と比べる。"""
+    from sanmeigaku_core.solar_terms import risshun_date
+    out = []
+    for y, expected in sorted(get_risshun_dict().items()):
+        computed = risshun_date(y)
+        if computed != expected:
+            out.append(("risshun", str(y), expected.isoformat(), computed.isoformat(), "computed"))
+    return out
+
+
+def _chunks(start: date, end: date, n: int):
+    """start〜end を n 個ほどの ordinal 区間に分ける（年の境目で切る必要はない）。"""
+    lo, hi = start.toordinal(), end.toordinal()
+    size = max((hi - lo + 1 + n - 1) // n, 1)
+    return [(a, min(a + size - 1, hi)) for a in range(lo, hi + 1, size)]
+
+
+def validate(checks=CHECKS, start: date | None = None, end: date | None = None, workers: int | None = None) -> list:
+    """
+    checks の検査を実行して食い違いのリスト（FIELDS の順のタプル、検査・日付順）を返す。
+    日付ごとの検査は start〜end（既定: 対応範囲全体。表の検査は表の範囲だけ）を workers 個のプロセスで分担する。
+    """
+    unknown = set(checks) - set(CHECKS)
+    if unknown:
+        raise ValueError(f"検査の名前が不明です: {', '.join(sorted(unknown))}（{', '.join(CHECKS)}）")
+    start = start or RANGE_START
+    end = end or RANGE_END
+    if not RANGE_START <= start <= end <= RANGE_END:
+        raise ValueError(f"対応範囲外の期間です: {start}〜{end}（{RANGE_START}〜{RANGE_END}）")
+
+    day_checks = tuple(c for c in checks if c in DAY_CHECKS)
+    if day_checks and "engine" not in day_checks:
+        # 表の範囲だけ調べれば足りる
+        start, end = max(start, TABLE_START), min(end, TABLE_END)
+
+    out = []
+    if day_checks and start <= end:
+        workers = workers or os.cpu_count() or 1
+        # 立ち上がりを揃えるため、パック・表は fork 前に親で読んでおく
+        get_month_table()
+        get_risshun_dict()
+        if workers == 1:
+            out.extend(_sweep(start.toordinal(), end.toordinal(), day_checks))
+        else:
+            chunks = _chunks(start, end, workers * 4)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for part in pool.map(_sweep, *zip(*chunks), [day_checks] * len(chunks)):
+                    out.extend(part)
+    if "risshun" in checks:
+        out.extend(check_risshun())
+    order = {c: i for i, c in enumerate(CHECKS)}
+    out.sort(key=lambda r: (order[r[0]], r[1]))
+    return out
+
+
+def summarize(rows: list) -> list:
+    """(検査, rule) ごとの (件数, 最初, 最後)。"""
+    counts = Counter((r[0], r[4]) for r in rows)
+    first, last = {}, {}
+    for r in rows:
+        key = (r[0], r[4])
+        first.setdefault(key, r[1])
+        last[key] = r[1]
+    return [(check, rule, n, first[(check, rule)], last[(check, rule)]) for (check, rule), n in counts.items()]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="validate_tables.py", description="データ表と計算値の全日付突き合わせ")
+    parser.add_argument("--check", nargs="+", choices=CHECKS, default=list(CHECKS), help="実行する検査（既定: すべて）")
+    parser.add_argument("--from", dest="start", type=date.fromisoformat, help="日付の検査の開始日")
+    parser.add_argument("--to", dest="end", type=date.fromisoformat, help="日付の検査の終了日")
+    parser.add_argument("-j", "--workers", type=int, help="ワーカープロセス数（既定: CPU数）")
+    parser.add_argument("--json", help="食い違いの全件を JSON で書き出す")
+    parser.add_argument("--limit", type=int, default=5, help="検査・rule ごとに表示する件数（既定: 5、0 で全件）")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    try:
+        rows = validate(tuple(args.check), args.start, args.end, args.workers)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - t0
+
+    shown = Counter()
+    for r in rows:
+        key = (r[0], r[4])
+        if args.limit and shown[key] >= args.limit:
+            continue
+        shown[key] += 1
+        print("\t".join("" if v is None else str(v) for v in r))
+    if rows:
+        print(file=sys.stderr)
+    for check, rule, n, first, last in summarize(rows):
+        print(f"{check:<12}{rule:<40}{n:>7,} 件  {first} 〜 {last}", file=sys.stderr)
+    print(f"食い違い: {len(rows):,} 件（{', '.join(args.check)}、{elapsed:.1f}s）", file=sys.stderr)
+
+    if args.json:
+        tmp = f"{args.json}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump([dict(zip(FIELDS, r)) for r in rows], f, ensure_ascii=False, indent=1)
+        os.replace(tmp, args.json)
+    return 1 if rows else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())